@@ -0,0 +1,157 @@
+"""Reproducible synthetic corpora for econlint benchmarks.
+
+A corpus is a tree of Python modules made of functions with nested loops.
+Each generated statement triggers one of ECON001-ECON004 with probability
+`trigger_density` and is plain filler code otherwise. The same spec always
+produces byte-identical files.
+"""
+
+import json
+import random
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+# Statements that trigger each rule; {var} is the innermost loop variable
+TRIGGERS = {
+    "ECON001": [
+        'requests.get(f"/api/items/{{{var}.id}}")',
+        'httpx.post("/api/events", json={var})',
+        "billing_client.charge({var}.amount)",
+    ],
+    "ECON002": [
+        "while True:\n"
+        "    try:\n"
+        "        sync_once({var})\n"
+        "        break\n"
+        "    except Exception:\n"
+        "        time.sleep(1)",
+        "retrying_fetch = retry()(fetch_remote)",
+    ],
+    "ECON003": [
+        "user_repo.get_user({var}.user_id)",
+        "order_api.fetch_order({var})",
+    ],
+    "ECON004": [
+        "await asyncio.gather(*[handle(x) for x in {var}.children])",
+        "ThreadPoolExecutor().submit(handle, {var})",
+        "Pool().map(handle, [{var}])",
+    ],
+}
+
+FILLER = [
+    "total += {var} * 2",
+    "values.append({var})",
+    "name = str({var}).strip().lower()",
+    "if {var} is None:\n    continue",
+    "result = transform({var}, scale=3)",
+    "cache[{var}] = len(values)",
+    'log.debug("processing %s", {var})',
+]
+
+HEADER = """\
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pool
+
+import httpx
+import requests
+from tenacity import retry
+
+
+"""
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    """Parameters describing a synthetic corpus."""
+
+    files: int = 200
+    lines_per_file: int = 300
+    nesting_depth: int = 3
+    trigger_density: float = 0.05
+    seed: int = 0
+
+    def name(self) -> str:
+        """Directory name identifying this spec."""
+        return (
+            f"f{self.files}-l{self.lines_per_file}-d{self.nesting_depth}"
+            f"-t{self.trigger_density:g}-s{self.seed}"
+        )
+
+
+def _indent(code: str, level: int) -> str:
+    pad = "    " * level
+    return "\n".join(pad + line for line in code.split("\n"))
+
+
+def _statement(rng: random.Random, spec: CorpusSpec, var: str) -> str:
+    if rng.random() < spec.trigger_density:
+        code = rng.choice(sorted(TRIGGERS))
+        template = rng.choice(TRIGGERS[code])
+    else:
+        template = rng.choice(FILLER)
+    return template.format(var=var)
+
+
+def _function(rng: random.Random, spec: CorpusSpec, index: int, budget: int) -> str:
+    depth = rng.randint(1, max(1, spec.nesting_depth))
+    lines = [
+        f"async def task_{index}(items, total=0, values=None, cache=None):",
+        "    values = values or []",
+    ]
+    for level in range(depth):
+        source = "items" if level == 0 else f"item{level - 1}.children"
+        lines.append(_indent(f"for item{level} in {source}:", level + 1))
+
+    var = f"item{depth - 1}"
+    while budget > 0:
+        statement = _statement(rng, spec, var)
+        lines.append(_indent(statement, depth + 1))
+        budget -= statement.count("\n") + 1
+    lines.append("    return values")
+    return "\n".join(lines) + "\n"
+
+
+def generate_module(spec: CorpusSpec, index: int) -> str:
+    """Generate the source of one module of the corpus."""
+    rng = random.Random(f"{spec.seed}:{index}")
+    parts = [HEADER]
+    lines = HEADER.count("\n")
+    function_index = 0
+    while lines < spec.lines_per_file:
+        function = _function(rng, spec, function_index, rng.randint(5, 25))
+        parts.append(function + "\n\n")
+        lines += function.count("\n") + 2
+        function_index += 1
+    return "".join(parts)
+
+
+def generate_corpus(spec: CorpusSpec, directory: Path) -> Path:
+    """Write a corpus under directory/<spec name> and return its root.
+
+    An existing corpus for the same spec is reused.
+    """
+    root = directory / spec.name()
+    manifest_path = root / "manifest.json"
+    if manifest_path.exists():
+        return root
+
+    total_lines = 0
+    for index in range(spec.files):
+        # Spread modules over packages so discovery has directories to walk
+        module_path = root / f"pkg{index % 10}" / f"module_{index}.py"
+        module_path.parent.mkdir(parents=True, exist_ok=True)
+        source = generate_module(spec, index)
+        module_path.write_text(source, encoding="utf-8")
+        total_lines += source.count("\n")
+
+    manifest = {"spec": asdict(spec), "files": spec.files, "lines": total_lines}
+    manifest_path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    return root
+
+
+def corpus_lines(root: Path) -> int:
+    """Total number of source lines in a generated corpus."""
+    manifest = json.loads((root / "manifest.json").read_text(encoding="utf-8"))
+    return manifest["lines"]
@@ -0,0 +1,315 @@
+"""Throughput benchmarks for econlint.
+
+Generates a synthetic corpus (see benchmarks.corpus), then times a set of
+scenarios over it: a complete single-file run (startup cost), the import
+of the CLI module, the full CLI pipeline, discovery, parsing, and each
+rule in isolation. Every scenario
+runs in a fresh interpreter so its peak RSS is its own. Results can be
+saved as a baseline and later runs compared against it:
+
+    python -m benchmarks.run --save-baseline
+    python -m benchmarks.run              # exits 1 on a regression
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import asdict
+from pathlib import Path
+
+from benchmarks.corpus import CorpusSpec, corpus_lines, generate_corpus
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+# Relative slowdown (or RSS growth) tolerated before a scenario is flagged
+DEFAULT_THRESHOLD = 0.15
+
+RULE_CODES = ("ECON001", "ECON002", "ECON003", "ECON004")
+SCENARIOS = (
+    "startup", "import", "cli", "cli-cached", "discovery", "parse",
+    *(f"rule:{code}" for code in RULE_CODES),
+)
+
+
+def _corpus_files(root: Path) -> list[Path]:
+    return sorted(root.rglob("*.py"))
+
+
+def _prepare(scenario: str, root: Path, scratch: Path) -> Callable[[], object]:
+    """Do a scenario's untimed setup and return the function to time."""
+    from econlint.cli import main
+    from econlint.discovery import discover_files
+    from econlint.engine import run_rules
+    from econlint.parser import parse_file
+    from econlint.rules import ALL_RULES
+
+    def run_cli(*extra: str) -> None:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            main([str(root), "--jobs", "1", *extra])
+
+    if scenario == "cli":
+        return lambda: run_cli("--no-cache")
+    if scenario == "cli-cached":
+        cache_dir = str(scratch / "cache")
+        run_cli("--cache-dir", cache_dir)
+        return lambda: run_cli("--cache-dir", cache_dir)
+    if scenario == "discovery":
+        return lambda: list(discover_files(root))
+
+    files = _corpus_files(root)
+    if scenario == "parse":
+        return lambda: [parse_file(path) for path in files]
+
+    if scenario.startswith("rule:"):
+        code = scenario.partition(":")[2]
+        rules = [rule for rule in ALL_RULES if rule.code == code]
+        if not rules:
+            raise ValueError(f"unknown rule {code}")
+        parsed = [(path, parse_file(path)) for path in files]
+        trees = [(path, result[1], result[0]) for path, result in parsed if result]
+        return lambda: [
+            run_rules(path, source, tree, rules) for path, source, tree in trees
+        ]
+
+    raise ValueError(f"unknown scenario {scenario}")
+
+
+def measure_startup(root: Path, repeat: int) -> dict[str, float]:
+    """Time complete `econlint` runs on a single file, as a pre-commit hook would."""
+    target = _corpus_files(root)[0]
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "econlint", str(target), "--no-cache", "--jobs", "1"],
+            cwd=Path(__file__).parent.parent,
+            stdout=subprocess.DEVNULL,
+            check=False,
+        )
+        best = min(best, time.perf_counter() - start)
+
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    if sys.platform == "darwin":
+        peak //= 1024
+    lines = target.read_text(encoding="utf-8").count("\n")
+    return {"seconds": best, "peak_rss_kb": peak, "files": 1, "lines": lines}
+
+
+def measure_import(repeat: int) -> dict[str, float]:
+    """Time `import econlint.cli` in fresh interpreters, as -X importtime reports it."""
+    best = float("inf")
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import econlint.cli"],
+            cwd=Path(__file__).parent.parent,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=True,
+        )
+        for line in completed.stderr.splitlines():
+            # import time: self [us] | cumulative | imported package
+            fields = line.partition(":")[2].split("|")
+            if len(fields) == 3 and fields[2].strip() == "econlint.cli":
+                best = min(best, int(fields[1]) / 1_000_000)
+
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    if sys.platform == "darwin":
+        peak //= 1024
+    return {"seconds": best, "peak_rss_kb": peak, "files": 1, "lines": 0}
+
+
+def measure(scenario: str, root: Path, repeat: int) -> dict[str, float]:
+    """Time a scenario in this process; the best of `repeat` runs counts."""
+    if scenario == "startup":
+        return measure_startup(root, repeat)
+    if scenario == "import":
+        return measure_import(repeat)
+
+    with tempfile.TemporaryDirectory() as scratch:
+        func = _prepare(scenario, root, Path(scratch))
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak //= 1024
+    return {"seconds": best, "peak_rss_kb": peak}
+
+
+def run_scenario(scenario: str, root: Path, repeat: int) -> dict[str, float]:
+    """Measure a scenario in a fresh interpreter."""
+    completed = subprocess.run(
+        [
+            sys.executable, "-m", "benchmarks.run",
+            "--measure", scenario, "--corpus", str(root), "--repeat", str(repeat),
+        ],
+        cwd=Path(__file__).parent.parent,
+        stdout=subprocess.PIPE,
+        check=True,
+    )
+    return json.loads(completed.stdout)
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    """List the scenarios that regressed beyond threshold."""
+    regressions = []
+    for scenario, result in results.items():
+        base = baseline.get(scenario)
+        if base is None:
+            continue
+        if result["files_per_sec"] < base["files_per_sec"] * (1 - threshold):
+            regressions.append(
+                f"{scenario}: {result['files_per_sec']:.0f} files/s, "
+                f"baseline {base['files_per_sec']:.0f}"
+            )
+        if result["peak_rss_mb"] > base["peak_rss_mb"] * (1 + threshold):
+            regressions.append(
+                f"{scenario}: peak RSS {result['peak_rss_mb']:.1f} MB, "
+                f"baseline {base['peak_rss_mb']:.1f}"
+            )
+    return regressions
+
+
+def format_report(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+) -> str:
+    lines = [
+        f"{'scenario':<16} {'files/s':>10} {'lines/s':>12} {'peak RSS':>10} {'vs base':>8}"
+    ]
+    for scenario, result in results.items():
+        base = baseline.get(scenario)
+        change = ""
+        if base:
+            ratio = result["files_per_sec"] / base["files_per_sec"] - 1
+            change = f"{ratio:+.0%}"
+        lines.append(
+            f"{scenario:<16} {result['files_per_sec']:>10.0f} "
+            f"{result['lines_per_sec']:>12.0f} "
+            f"{result['peak_rss_mb']:>7.1f} MB {change:>8}"
+        )
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    defaults = CorpusSpec()
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description="Benchmark econlint throughput on a synthetic corpus.",
+    )
+    parser.add_argument("--files", type=int, default=defaults.files)
+    parser.add_argument("--lines-per-file", type=int, default=defaults.lines_per_file)
+    parser.add_argument("--nesting-depth", type=int, default=defaults.nesting_depth)
+    parser.add_argument(
+        "--trigger-density",
+        type=float,
+        default=defaults.trigger_density,
+        help="Probability that a generated statement triggers a rule",
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument(
+        "--corpus-dir",
+        type=Path,
+        default=Path(tempfile.gettempdir()) / "econlint-bench",
+        help="Where generated corpora are kept between runs",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=SCENARIOS,
+        help="Scenario to run (can be repeated; default: all)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store these results as the new baseline",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Tolerated relative regression (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    # Internal: measure one scenario in this process
+    parser.add_argument("--measure", help=argparse.SUPPRESS)
+    parser.add_argument("--corpus", type=Path, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    if args.measure:
+        print(json.dumps(measure(args.measure, args.corpus, args.repeat)))
+        return 0
+
+    spec = CorpusSpec(
+        files=args.files,
+        lines_per_file=args.lines_per_file,
+        nesting_depth=args.nesting_depth,
+        trigger_density=args.trigger_density,
+        seed=args.seed,
+    )
+    root = generate_corpus(spec, args.corpus_dir)
+    lines = corpus_lines(root)
+
+    results: dict[str, dict[str, float]] = {}
+    for scenario in args.scenario or SCENARIOS:
+        raw = run_scenario(scenario, root, args.repeat)
+        seconds = raw["seconds"]
+        results[scenario] = {
+            "seconds": round(seconds, 4),
+            "files_per_sec": round(raw.get("files", spec.files) / seconds, 1),
+            "lines_per_sec": round(raw.get("lines", lines) / seconds, 1),
+            "peak_rss_mb": round(raw["peak_rss_kb"] / 1024, 1),
+        }
+
+    baseline: dict[str, dict[str, float]] = {}
+    if args.baseline.exists():
+        stored = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if stored.get("spec") == asdict(spec):
+            baseline = stored["results"]
+        elif not args.save_baseline:
+            print(
+                "baseline was recorded for a different corpus; not comparing",
+                file=sys.stderr,
+            )
+
+    if args.json:
+        print(json.dumps({"spec": asdict(spec), "lines": lines, "results": results}, indent=2))
+    else:
+        print(f"corpus: {spec.files} files, {lines} lines ({root})")
+        print(format_report(results, baseline))
+
+    if args.save_baseline:
+        document = {"spec": asdict(spec), "results": results}
+        args.baseline.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+        print(f"baseline saved to {args.baseline}", file=sys.stderr)
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+        print(f"regression: {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+"""On-disk result cache for econlint.
+
+Warnings are stored per file, with inline suppressions already applied,
+keyed by a hash of the file contents, the econlint version and the set of
+enabled rules. An unchanged file is answered from the cache without being
+parsed. Because the key is the content, renamed or copied files hit the
+cache too.
+
+Layout:
+  <cache_dir>/<2 hex chars>/<key>.json
+
+The same store holds other per-content entries, such as the function
+summaries of --interprocedural runs, under keys of their own.
+
+Entries are evicted least-recently-used first once the cache grows past
+its size bound; a hit refreshes the entry's mtime.
+"""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import replace
+from pathlib import Path
+
+from econlint import __version__
+from econlint.warnings import Warning, EXPLANATIONS
+
+DEFAULT_CACHE_DIR = Path(".econlint_cache")
+
+# Maximum number of entries kept on disk
+DEFAULT_MAX_ENTRIES = 100_000
+
+# Bump when the entry format or what gets stored changes
+CACHE_FORMAT = 4
+
+# Entries kept by an in-memory cache
+DEFAULT_MEMORY_ENTRIES = 10_000
+
+
+def _salt(rule_codes: Iterable[str]) -> bytes:
+    return f"{CACHE_FORMAT}\0{__version__}\0{','.join(sorted(rule_codes))}\0".encode()
+
+
+def _key(salt: bytes, data: bytes) -> str:
+    digest = hashlib.blake2b(salt, digest_size=20)
+    digest.update(data)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Per-file warning cache stored under a directory."""
+
+    def __init__(
+        self,
+        directory: Path,
+        rule_codes: Iterable[str],
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self.directory = directory
+        self.max_entries = max_entries
+        self._salt = _salt(rule_codes)
+
+    def key(self, data: bytes) -> str:
+        """Compute the cache key for a file's contents."""
+        return _key(self._salt, data)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str, file_path: Path) -> list[Warning] | None:
+        """Look up cached warnings, attributing them to file_path.
+
+        Returns None on a miss or an unreadable entry.
+        """
+        entry = self.get_entry(key)
+        if entry is None:
+            return None
+
+        try:
+            return [
+                Warning(
+                    code=code,
+                    message=message,
+                    file=file_path,
+                    line=line,
+                    pattern=pattern,
+                    explanation=EXPLANATIONS.get(code, ""),
+                )
+                for code, message, line, pattern in entry["warnings"]
+            ]
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def put(self, key: str, warnings: list[Warning]) -> None:
+        """Store warnings for a key. Failures to write are ignored."""
+        self.put_entry(key, {
+            "warnings": [[w.code, w.message, w.line, w.pattern] for w in warnings],
+        })
+
+    def get_entry(self, key: str) -> dict | None:
+        """Look up a raw JSON entry. Returns None on a miss or an unreadable entry."""
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(entry_path)
+        except (OSError, ValueError):
+            return None
+        return entry if isinstance(entry, dict) else None
+
+    def put_entry(self, key: str, entry: dict) -> None:
+        """Store a JSON-serializable entry for a key. Failures to write are ignored."""
+        entry_path = self._entry_path(key)
+        # Write then rename so concurrent workers never see partial entries;
+        # the pid keeps workers' temporary files apart
+        tmp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self._ensure_directory()
+            entry_path.parent.mkdir(exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, separators=(",", ":"))
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            pass
+
+    def _ensure_directory(self) -> None:
+        if self.directory.is_dir():
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Keep the cache out of version control
+        (self.directory / ".gitignore").write_text("*\n", encoding="utf-8")
+
+    def prune(self) -> int:
+        """Evict least-recently-used entries beyond max_entries.
+
+        Returns the number of entries removed.
+        """
+        entries: list[tuple[float, str]] = []
+        try:
+            shards = list(os.scandir(self.directory))
+        except OSError:
+            return 0
+
+        for shard in shards:
+            if not shard.is_dir():
+                continue
+            try:
+                with os.scandir(shard.path) as it:
+                    for entry in it:
+                        if entry.name.endswith(".json"):
+                            entries.append((entry.stat().st_mtime, entry.path))
+            except OSError:
+                continue
+
+        excess = len(entries) - self.max_entries
+        if excess <= 0:
+            return 0
+
+        entries.sort()
+        removed = 0
+        for _, entry_path in entries[:excess]:
+            try:
+                os.remove(entry_path)
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+
+class MemoryCache:
+    """In-process counterpart of ResultCache for long-running servers.
+
+    Same keys and interface, but entries live in a bounded LRU dict and
+    warnings are stored as-is.
+    """
+
+    def __init__(
+        self,
+        rule_codes: Iterable[str],
+        max_entries: int = DEFAULT_MEMORY_ENTRIES,
+    ) -> None:
+        self.max_entries = max_entries
+        self._salt = _salt(rule_codes)
+        self._entries: OrderedDict[str, list[Warning] | dict] = OrderedDict()
+
+    def key(self, data: bytes) -> str:
+        """Compute the cache key for a file's contents."""
+        return _key(self._salt, data)
+
+    def get(self, key: str, file_path: Path) -> list[Warning] | None:
+        """Look up cached warnings, attributing them to file_path."""
+        warnings = self._entries.get(key)
+        if not isinstance(warnings, list):
+            return None
+        self._entries.move_to_end(key)
+        return [w if w.file == file_path else replace(w, file=file_path) for w in warnings]
+
+    def put(self, key: str, warnings: list[Warning]) -> None:
+        """Store warnings for a key, evicting the least recently used."""
+        self._store(key, warnings)
+
+    def get_entry(self, key: str) -> dict | None:
+        """Look up a raw entry stored with put_entry."""
+        entry = self._entries.get(key)
+        if not isinstance(entry, dict):
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put_entry(self, key: str, entry: dict) -> None:
+        """Store a raw entry for a key, evicting the least recently used."""
+        self._store(key, entry)
+
+    def _store(self, key: str, value: list[Warning] | dict) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def prune(self) -> int:
+        """Entries are evicted on insertion; nothing to do."""
+        return 0
@@ -0,0 +1,447 @@
+"""Interprocedural analysis: function summaries and a project call graph.
+
+ECON001 and ECON004 see one module at a time, so a loop calling a project
+helper that makes the external call (or the unbounded fan-out) goes
+unreported. With --interprocedural every module is also summarized:
+
+- each function and method: the external call (a network entry point of
+  an HTTP library, or a call ECON001 flags by its database, AWS or client
+  name) and the unbounded fan-out (as ECON004 classifies calls) it makes
+  directly, if any, and the functions it calls;
+- each call made inside a loop, with its candidate targets.
+
+Once every file has been summarized, external calls and fan-outs are
+propagated up the call graph to every function that reaches them,
+however indirectly and across modules, and each loop call whose target
+reaches one is reported at the call site under ECON001 or ECON004.
+
+Functions are named after their module path: app/users.py defines
+app.users.sync_user, and methods are named after their class. Calls are
+resolved through the caller's imports (relative imports included), to
+functions of the same module, and through self/cls to the enclosing
+class's methods. Names are matched against the scanned files by their
+trailing components, so scans from any directory agree; a name two
+scanned functions share is left unresolved.
+
+Summaries are cached like rule results: per file under its contents, and
+per top-level definition under a hash of its text and the module-wide
+context the rules depend on, with lines relative to the definition, so after an edit only the changed definitions are
+summarized again. Propagation over the whole graph is cheap and is
+redone on every run.
+"""
+
+import ast
+import bisect
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from econlint.engine import walk
+from econlint.facts import ModuleFacts
+from econlint.incremental import MIN_SEGMENTS, SEGMENT_TYPES, statement_span
+from econlint.rules.econ001 import (
+    ECON001, LOOP_TYPES, is_external_method_name, is_network_call_name,
+)
+from econlint.rules.econ004 import ECON004, unbounded_fan_out
+from econlint.suppression import extract_suppressions
+from econlint.warnings import EXPLANATIONS, Warning
+
+if TYPE_CHECKING:
+    from econlint.cache import MemoryCache, ResultCache
+
+# Rules whose findings are propagated to loop call sites
+PROPAGATED_RULES = {rule.code: rule for rule in (ECON001, ECON004)}
+
+
+@dataclass
+class FunctionSummary:
+    """What a function does directly, and what it calls."""
+
+    # Qualified name, e.g. "app.users.UserSync.run"
+    name: str
+    line: int
+    # First external call / unbounded fan-out made in the body, if any
+    external: str = ""
+    fan_out: str = ""
+    # Per distinct call: candidate target names, most specific first
+    calls: list[list[str]] = field(default_factory=list)
+
+
+@dataclass
+class LoopCall:
+    """A call made inside a loop, to be checked against the call graph."""
+
+    line: int
+    # The call name as spelled, e.g. "sync_user"
+    name: str
+    targets: list[str]
+    # Codes ignored on the line, empty for a bare ignore; None if none
+    ignored: list[str] | None = None
+
+
+@dataclass
+class ModuleSummary:
+    """The summaries of one module's functions and loop calls."""
+
+    module: str
+    functions: list[FunctionSummary] = field(default_factory=list)
+    loop_calls: list[LoopCall] = field(default_factory=list)
+
+    def to_dict(self, line_offset: int = 0) -> dict:
+        """JSON-serializable form, with lines shifted up by line_offset."""
+        return {
+            "module": self.module,
+            "functions": [
+                [f.name, f.line - line_offset, f.external, f.fan_out, f.calls]
+                for f in self.functions
+            ],
+            "loop_calls": [
+                [c.line - line_offset, c.name, c.targets, c.ignored]
+                for c in self.loop_calls
+            ],
+        }
+
+    def __reduce__(self):
+        # Sent from worker processes in the compact form, which pickles
+        # several times faster than the dataclasses
+        return ModuleSummary.from_dict, (self.to_dict(),)
+
+    @classmethod
+    def from_dict(cls, data: dict, line_offset: int = 0) -> "ModuleSummary | None":
+        """Rebuild a summary from to_dict output. Returns None if malformed."""
+        try:
+            return cls(
+                data["module"],
+                [
+                    FunctionSummary(name, line + line_offset, external, fan_out, calls)
+                    for name, line, external, fan_out, calls in data["functions"]
+                ],
+                [
+                    LoopCall(line + line_offset, name, targets, ignored)
+                    for line, name, targets, ignored in data["loop_calls"]
+                ],
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+
+def module_name(path: Path) -> tuple[str, str]:
+    """Dotted module and package names for a file path.
+
+    app/users.py is module "app.users" in package "app"; app/__init__.py
+    is module and package "app".
+    """
+    parts = [part for part in path.with_suffix("").parts if part not in (path.anchor, ".", "..")]
+    if parts and parts[-1] == "__init__":
+        parts.pop()
+        return ".".join(parts), ".".join(parts)
+    return ".".join(parts), ".".join(parts[:-1])
+
+
+def summary_key_prefix(file_path: Path) -> bytes:
+    """Prefix of a file's summary cache key; summaries depend on the path."""
+    module, package = module_name(file_path)
+    return f"summary\0{module}\0{package}\0".encode()
+
+
+class SummaryCollector:
+    """Walk observer that records a module's function summaries.
+
+    Pass it to run_rules (or run_rules_incremental) with the same facts to
+    summarize in the rules' pass, then hand it to summarize_module.
+    """
+
+    def __init__(self, file_path: Path, source: str, facts: ModuleFacts) -> None:
+        self.module, self.package = module_name(file_path)
+        self.facts = facts
+        self.ignored = extract_suppressions(source)
+        self.functions: list[FunctionSummary] = []
+        self.loop_calls: list[LoopCall] = []
+        # First lines of the top-level definitions walked
+        self.walked: set[int] = set()
+        # Names of functions defined inside other functions of the current
+        # top-level definition; per definition, so it can be cached alone
+        self._nested: set[str] = set()
+        # Enclosing classes and functions: (name, summary or None for a class)
+        self._scopes: list[tuple[str, FunctionSummary | None]] = []
+
+    def _qualname(self, name: str) -> str:
+        return ".".join([self.module, *(scope for scope, _ in self._scopes), name])
+
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        if not self._scopes:
+            self.walked.add(node.lineno)
+        elif self._scopes[-1][1] is not None:
+            self._nested.add(node.name)
+        summary = FunctionSummary(self._qualname(node.name), node.lineno)
+        self.functions.append(summary)
+        self._scopes.append((node.name, summary))
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        if not self._scopes:
+            self.walked.add(node.lineno)
+        self._scopes.append((node.name, None))
+
+    def _leave_scope(self, node: ast.AST) -> None:
+        self._scopes.pop()
+        if not self._scopes:
+            self._nested.clear()
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+    leave_FunctionDef = leave_AsyncFunctionDef = leave_ClassDef = _leave_scope
+
+    def visit_Call(self, node: ast.Call) -> None:
+        call = self.facts.call_parts(node)
+        if not call.dotted:
+            return
+        # Class bodies run once, at import; only functions get summaries
+        function = self._scopes[-1][1] if self._scopes else None
+
+        # Library calls count only if they are network entry points, spelled
+        # or imported: a summary is propagated to every caller, so ECON001's
+        # module prefixes (urllib.request.pathname2url) would spread widely
+        external = is_network_call_name(call.qualified) or is_external_method_name(call.dotted)
+        fan_out = unbounded_fan_out(call.qualified, node, self.facts.has_semaphore)
+        if external or fan_out:
+            # Reported by the rules themselves where it happens
+            if function is not None:
+                if external and not function.external:
+                    function.external = call.qualified
+                if fan_out and not function.fan_out:
+                    function.fan_out = fan_out
+            return
+
+        targets = self._targets(call.dotted, call.qualified)
+        if not targets:
+            return
+        if function is not None and targets not in function.calls:
+            function.calls.append(targets)
+        if any(isinstance(loop, LOOP_TYPES) for loop in self.facts.loops):
+            codes = self.ignored.get(node.lineno)
+            self.loop_calls.append(LoopCall(
+                node.lineno, call.dotted, targets,
+                None if codes is None else sorted(codes),
+            ))
+
+    def _targets(self, dotted: str, qualified: str) -> list[str]:
+        """Names the called function may have, most specific first."""
+        if "(" in dotted or "[" in dotted:
+            return []
+        head, _, rest = dotted.partition(".")
+        if head in ("self", "cls"):
+            # A method of the innermost enclosing class
+            for index in range(len(self._scopes) - 1, -1, -1):
+                if self._scopes[index][1] is None:
+                    names = [scope for scope, _ in self._scopes[:index + 1]]
+                    return [".".join([self.module, *names, rest])] if rest else []
+            return []
+        if qualified != dotted:
+            return [self._absolute(qualified)]
+        if not rest:
+            # A function of an enclosing function, else of the module
+            if dotted not in self._nested:
+                return [f"{self.module}.{dotted}"]
+            enclosing = [summary.name for _, summary in reversed(self._scopes) if summary]
+            return [f"{name}.{dotted}" for name in enclosing] + [f"{self.module}.{dotted}"]
+        # A class of this module (Model.create), else a module imported
+        # under its own name (import app.users; app.users.sync_user)
+        return [f"{self.module}.{dotted}", dotted]
+
+    def _absolute(self, name: str) -> str:
+        """Resolve a relative import's target (".models.User") against the package."""
+        if not name.startswith("."):
+            return name
+        relative = name.lstrip(".")
+        parts = self.package.split(".") if self.package else []
+        up = len(name) - len(relative) - 1
+        if up:
+            parts = parts[:-up]
+        return ".".join([*parts, relative])
+
+
+def _collect(
+    file_path: Path, source: str, tree: ast.Module, facts: ModuleFacts
+) -> SummaryCollector:
+    collector = SummaryCollector(file_path, source, facts)
+    walk(tree, [], facts=facts, observers=[collector])
+    return collector
+
+
+def summarize_module(
+    file_path: Path,
+    source: str,
+    tree: ast.Module,
+    cache: "ResultCache | MemoryCache | None" = None,
+    collector: SummaryCollector | None = None,
+) -> ModuleSummary:
+    """Summarize a parsed module's functions and loop calls.
+
+    collector, if given, has observed a pass over the module: all of it, or
+    (with a cache) the statements run_rules_incremental walked. Other
+    top-level definitions are summarized from the cache when their text
+    is unchanged, and walked otherwise.
+    """
+    module = module_name(file_path)[0]
+    facts = collector.facts if collector is not None else ModuleFacts(source, tree)
+    body = tree.body
+    if cache is None or sum(isinstance(node, SEGMENT_TYPES) for node in body) < MIN_SEGMENTS:
+        if collector is None:
+            collector = _collect(file_path, source, tree, facts)
+        return ModuleSummary(module, collector.functions, collector.loop_calls)
+
+    lines = facts.lines
+    # Like rule results, summaries depend on module-wide facts (ECON004's
+    # Semaphore check) and on how the imports resolve calls
+    context = "\0".join(rule.module_context(source) for rule in PROPAGATED_RULES.values())
+    imports = ",".join(f"{name}={origin}" for name, origin in sorted(facts.imports.items()))
+    prefix = summary_key_prefix(file_path) + f"segment\0{context}\0{imports}\0".encode()
+    walked = collector.walked if collector is not None else set()
+
+    spans = [statement_span(node) for node in body]
+    found = [ModuleSummary(module) for _ in body]
+    missed: dict[int, str] = {}
+    to_walk: list[ast.stmt] = []
+
+    for index, node in enumerate(body):
+        if not isinstance(node, SEGMENT_TYPES):
+            # Statements outside definitions are always walked
+            if collector is None:
+                to_walk.append(node)
+            continue
+        start, end = spans[index]
+        text = "".join(lines[start - 1:end])
+        key = cache.key(prefix + text.encode("utf-8", "surrogatepass"))
+        if node.lineno in walked:
+            missed[index] = key
+            continue
+        entry = cache.get_entry(key)
+        cached = None if entry is None else ModuleSummary.from_dict(entry, start - 1)
+        if cached is None:
+            missed[index] = key
+            to_walk.append(node)
+        else:
+            found[index] = cached
+
+    collectors = [collector] if collector is not None else []
+    if to_walk:
+        partial = ast.Module(body=to_walk, type_ignores=[])
+        collectors.append(_collect(file_path, source, partial, facts))
+    starts = [start for start, _ in spans]
+    for observed in collectors:
+        for function in observed.functions:
+            found[max(0, bisect.bisect_right(starts, function.line) - 1)].functions.append(function)
+        for call in observed.loop_calls:
+            found[max(0, bisect.bisect_right(starts, call.line) - 1)].loop_calls.append(call)
+
+    for index, key in missed.items():
+        cache.put_entry(key, found[index].to_dict(spans[index][0] - 1))
+
+    summary = ModuleSummary(module)
+    for statement_summary in found:
+        summary.functions.extend(statement_summary.functions)
+        summary.loop_calls.extend(statement_summary.loop_calls)
+    return summary
+
+
+def _tail(name: str) -> str:
+    """Last two parts of a qualified name, e.g. "users.sync_user"."""
+    head, _, last = name.rpartition(".")
+    return f"{head.rpartition('.')[2]}.{last}" if head else last
+
+
+def _reach(callers: dict[str, list[str]], found: dict[str, str]) -> dict[str, str]:
+    """Extend found (function -> what it does) to every function calling one."""
+    queue = deque(found)
+    while queue:
+        callee = queue.popleft()
+        for caller in callers.get(callee, ()):
+            if caller not in found:
+                found[caller] = found[callee]
+                queue.append(caller)
+    return found
+
+
+def interprocedural_warnings(
+    summaries: Iterable[tuple[Path, ModuleSummary]],
+    codes: Iterable[str] = tuple(PROPAGATED_RULES),
+) -> dict[Path, list[Warning]]:
+    """Warnings for loop calls to functions that reach an external call or fan-out.
+
+    Only codes among `codes` are reported. Returns warnings per file, in
+    source order, with inline suppressions applied.
+    """
+    summaries = list(summaries)
+    codes = set(codes)
+    functions: dict[str, FunctionSummary] = {}
+    by_tail: dict[str, list[str]] = {}
+    for _, summary in summaries:
+        for function in summary.functions:
+            if function.name not in functions:
+                by_tail.setdefault(_tail(function.name), []).append(function.name)
+            functions[function.name] = function
+
+    matches: dict[str, str | None] = {}
+
+    def match(target: str) -> str | None:
+        """The one function whose name is target or ends with it, if any."""
+        if target in matches:
+            return matches[target]
+        if target in functions:
+            name = target
+        else:
+            dotted = "." + target
+            names = [name for name in by_tail.get(_tail(target), ()) if name.endswith(dotted)]
+            name = names[0] if len(names) == 1 else None
+        matches[target] = name
+        return name
+
+    def resolve(targets: list[str]) -> str | None:
+        for target in targets:
+            name = match(target)
+            if name is not None:
+                return name
+        return None
+
+    callers: dict[str, list[str]] = {}
+    for function in functions.values():
+        for targets in function.calls:
+            callee = resolve(targets)
+            if callee is not None and callee != function.name:
+                callers.setdefault(callee, []).append(function.name)
+
+    # Per code, what each function reaching the finding does
+    reached: dict[str, dict[str, str]] = {}
+    if ECON001.code in codes:
+        reached[ECON001.code] = _reach(callers, {
+            name: f"makes an external call ({f.external}())"
+            for name, f in functions.items() if f.external
+        })
+    if ECON004.code in codes:
+        reached[ECON004.code] = _reach(callers, {
+            name: f"fans out ({f.fan_out})"
+            for name, f in functions.items() if f.fan_out
+        })
+
+    warnings: dict[Path, list[Warning]] = {}
+    for path, summary in summaries:
+        for call in summary.loop_calls:
+            callee = resolve(call.targets)
+            if callee is None:
+                continue
+            for code, found in reached.items():
+                does = found.get(callee)
+                if does is None:
+                    continue
+                if call.ignored is not None and (not call.ignored or code in call.ignored):
+                    continue
+                warnings.setdefault(path, []).append(Warning(
+                    code=code,
+                    message=PROPAGATED_RULES[code].message,
+                    file=path,
+                    line=call.line,
+                    pattern=f"{call.name}() called inside loop {does}",
+                    explanation=EXPLANATIONS.get(code, ""),
+                ))
+    return warnings
@@ -1,16 +1,42 @@
 """Command-line interface and orchestration for econlint."""
 
 import argparse
+import os
 import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, TextIO, TypeVar
 
-from econlint.discovery import discover_files
-from econlint.parser import parse_file
-from econlint.rules import ALL_RULES
-from econlint.suppression import filter_suppressed
-from econlint.formatters import format_text, format_json
+from econlint.cache import DEFAULT_CACHE_DIR, ResultCache
+from econlint.discovery import discover_paths, read_file_list
+from econlint.rules import RULE_CODES, load_rules
+from econlint.runner import (
+    ANALYZED, Analyzer, FileResult, RunStats, Task, default_jobs, iter_results,
+)
+from econlint.shard import SHARD_STRATEGIES, parse_shard, select_shard
 from econlint.warnings import Warning
 
+if TYPE_CHECKING:
+    from econlint.diff import ChangedLines
+    from econlint.formatters.json_fmt import JsonLinesWriter, JsonWriter
+    from econlint.formatters.text import TextWriter
+
+    Writer = TextWriter | JsonWriter | JsonLinesWriter
+
+T = TypeVar("T")
+
+
+def positive_int(value: str) -> int:
+    """Argparse type for options that take a count of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {value}")
+    return number
+
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     """Parse command-line arguments."""
@@ -19,16 +45,43 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         description="Detect expensive code patterns in Python files.",
     )
     parser.add_argument(
-        "path",
+        "paths",
         type=Path,
-        help="Path to file or directory to analyze",
+        nargs="*",
+        metavar="path",
+        help="Paths to files or directories to analyze",
+    )
+    parser.add_argument(
+        "--files-from",
+        metavar="FILE",
+        help="Also analyze files listed in FILE, NUL- or newline-separated "
+        "('-' reads stdin, e.g. git ls-files -z '*.py' | econlint --files-from -)",
     )
     parser.add_argument(
+        "--rev",
+        metavar="COMMIT",
+        help="Analyze files as of a git revision, read from the object "
+        "database without checking it out (paths restrict the tree)",
+    )
+    parser.add_argument(
+        "--diff-base",
+        metavar="REF",
+        help="Only analyze files changed since the merge base with REF, and "
+        "only report warnings on added or modified lines",
+    )
+    output_format = parser.add_mutually_exclusive_group()
+    output_format.add_argument(
         "--json",
         action="store_true",
         dest="json_output",
         help="Output results as JSON",
     )
+    output_format.add_argument(
+        "--jsonl",
+        action="store_true",
+        dest="jsonl_output",
+        help="Output results as JSON Lines, one warning per line",
+    )
     parser.add_argument(
         "--disable",
         type=str,
@@ -41,69 +94,466 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=[],
         help="Exclude paths matching pattern (can be used multiple times)",
     )
-    return parser.parse_args(argv)
+    parser.add_argument(
+        "--no-ignore",
+        action="store_true",
+        help="Do not skip paths listed in .gitignore/.ignore files",
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=positive_int,
+        default=None,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help=f"Directory for cached results (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Analyze every file without reading or writing the result cache",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print file counts, time per phase and per rule, and the slowest "
+        "files to stderr (as a JSON object with --json/--jsonl)",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        metavar="I/N",
+        help="Only analyze shard I of N (1-based), for splitting a scan across "
+        "machines; combine the --json outputs with `econlint merge`",
+    )
+    parser.add_argument(
+        "--shard-by",
+        choices=SHARD_STRATEGIES,
+        default="hash",
+        help="Assign files to shards by a stable hash of their path (default) "
+        "or into bins of similar total size",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="After the initial scan, keep polling for changed files and "
+        "report new and resolved warnings until interrupted",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="How often --watch checks for changes (default: 0.5)",
+    )
+    parser.add_argument(
+        "--interprocedural",
+        action="store_true",
+        help="Also report loops that call project functions making external "
+        "calls or unbounded fan-outs, directly or through other functions, "
+        "across modules (output starts once every file is analyzed)",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Send the scan to a running `econlint daemon` (falls back to "
+        "scanning locally if none is listening)",
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=None,
+        help="Socket of the daemon to use with --daemon",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="FILE",
+        help="Write a cProfile dump of the run to FILE (implies --jobs=1 "
+        "unless --jobs is given)",
+    )
+    args = parser.parse_args(argv)
+    if args.rev is not None or args.diff_base is not None:
+        if args.files_from is not None:
+            parser.error("--files-from cannot be combined with --rev or --diff-base")
+        if args.watch:
+            parser.error("--watch cannot be combined with --rev or --diff-base")
+    elif not args.paths and args.files_from is None:
+        parser.error("the following arguments are required: path")
+    if args.daemon:
+        unsupported = [
+            option for option, value in (
+                ("--files-from", args.files_from), ("--rev", args.rev),
+                ("--diff-base", args.diff_base), ("--watch", args.watch),
+                ("--stats", args.stats), ("--profile", args.profile),
+                ("--shard", args.shard), ("--interprocedural", args.interprocedural),
+            )
+            if value
+        ]
+        if unsupported:
+            parser.error(f"--daemon cannot be combined with {', '.join(unsupported)}")
+    if args.watch and args.shard is not None:
+        parser.error("--watch cannot be combined with --shard")
+    if args.interprocedural:
+        # The call graph needs every file's summary
+        if args.shard is not None:
+            parser.error("--interprocedural cannot be combined with --shard")
+        if args.watch:
+            parser.error("--interprocedural cannot be combined with --watch")
+    if args.watch and args.json_output:
+        parser.error("--watch reports changes as they happen; use --jsonl")
+    return args
 
 
 def get_enabled_rules(disabled: str) -> list:
     """Get list of enabled rule classes based on disabled rules."""
     if not disabled:
-        return ALL_RULES
+        return load_rules()
 
     disabled_codes = {code.strip().upper() for code in disabled.split(",")}
-    return [rule for rule in ALL_RULES if rule.code not in disabled_codes]
+    # Only the enabled rules' modules are imported
+    return load_rules([code for code in RULE_CODES if code not in disabled_codes])
+
+
+def timed_iter(items: Iterable[T], stats: RunStats, phase: str) -> Iterator[T]:
+    """Yield from items, charging the time spent producing them to phase."""
+    iterator = iter(items)
+    while True:
+        start = perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            stats.add_time(phase, perf_counter() - start)
+            return
+        stats.add_time(phase, perf_counter() - start)
+        yield item
 
 
 def run_analysis(
-    path: Path,
-    rules: list,
-    exclude_patterns: list[str]
-) -> tuple[list[Warning], dict[Path, list[str]]]:
-    """Run all rules on all discovered files.
-
-    Returns:
-        Tuple of (warnings, source_cache)
+    files: Iterable[Task],
+    analyzer: Analyzer,
+    jobs: int = 1,
+    stats: RunStats | None = None,
+    changed: "ChangedLines | None" = None,
+) -> Iterator[list[Warning]]:
+    """Run all rules on the given files, yielding each file's warnings.
+
+    Files are paths read from disk or (path, contents) pairs. Each file's
+    AST is walked once, with every rule handled in that pass. With jobs > 1
+    files are analyzed in worker processes; results keep the order of
+    `files` either way. Files that no enabled rule can match are skipped and
+    files whose contents are in the cache are not parsed.
+
+    Suppressions are applied per file during analysis and the
+    changed-lines filter (if given) as each file completes, so warnings can
+    be written out immediately and nothing accumulates across files. A
+    summarizing analyzer is the exception: its results are held until every
+    file is analyzed, then each file's warnings are completed with those
+    found through the call graph.
+    """
+    misses = 0
+    results: Iterable[FileResult] = iter_results(files, analyzer, jobs)
+    if analyzer.summarize:
+        results = with_interprocedural_warnings(results, analyzer, stats)
+
+    for result in results:
+        if result.status == ANALYZED:
+            misses += 1
+        if stats is not None:
+            stats.record(result)
+
+        warnings = result.warnings
+        if changed is not None:
+            warnings = [w for w in warnings if changed.contains(w.file, w.line)]
+        yield warnings
+
+    if analyzer.cache is not None and misses:
+        analyzer.cache.prune()
+
+
+def with_interprocedural_warnings(
+    results: Iterable[FileResult],
+    analyzer: Analyzer,
+    stats: RunStats | None = None,
+) -> list[FileResult]:
+    """Add call-graph warnings to a complete set of summarized results.
+
+    Added warnings go after the rule's own, keeping each file's warnings
+    grouped by rule in rule order.
     """
-    warnings: list[Warning] = []
-    source_cache: dict[Path, list[str]] = {}
+    from econlint.callgraph import interprocedural_warnings
+
+    results = list(results)
+    start = perf_counter()
+    found = interprocedural_warnings(
+        ((result.path, result.summary) for result in results if result.summary),
+        [rule.code for rule in analyzer.rules],
+    )
+    order = {rule.code: index for index, rule in enumerate(analyzer.rules)}
+    for result in results:
+        added = found.get(result.path)
+        if added:
+            result.warnings = sorted(result.warnings + added, key=lambda w: order[w.code])
+    if stats is not None:
+        stats.add_time("call graph", perf_counter() - start)
+    return results
+
 
-    for file_path in discover_files(path, exclude_patterns):
-        result = parse_file(file_path)
-        if result is None:
-            continue
+def open_writer(args: argparse.Namespace, stream: TextIO) -> "Writer":
+    """Create the streaming writer for the selected output format."""
+    if args.json_output:
+        from econlint.formatters.json_fmt import JsonWriter
 
-        tree, source = result
-        source_cache[file_path] = source.splitlines()
+        return JsonWriter(stream)
+    if args.jsonl_output:
+        from econlint.formatters.json_fmt import JsonLinesWriter
 
-        for rule_class in rules:
-            rule = rule_class(file_path, source)
-            rule.visit(tree)
-            warnings.extend(rule.warnings)
+        return JsonLinesWriter(stream)
+    from econlint.formatters.text import TextWriter
 
-    return warnings, source_cache
+    return TextWriter(stream)
+
+
+def run_lsp(argv: list[str]) -> int:
+    """Run `econlint lsp`: a language server on stdin/stdout."""
+    parser = argparse.ArgumentParser(
+        prog="econlint lsp",
+        description="Publish econlint warnings as editor diagnostics over LSP.",
+    )
+    parser.add_argument(
+        "--disable",
+        type=str,
+        default="",
+        help="Disable specific rules (comma-separated)",
+    )
+    args = parser.parse_args(argv)
+
+    from econlint import lsp
+
+    return lsp.main(get_enabled_rules(args.disable))
+
+
+def run_daemon(argv: list[str]) -> int:
+    """Run `econlint daemon`: serve scans over a Unix socket."""
+    from econlint import daemon
+
+    parser = argparse.ArgumentParser(
+        prog="econlint daemon",
+        description="Keep results warm and answer `econlint --daemon` scans.",
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=None,
+        help="Socket path (default: per-user runtime directory)",
+    )
+    parser.add_argument(
+        "--stop",
+        action="store_true",
+        help="Stop the daemon listening on the socket",
+    )
+    args = parser.parse_args(argv)
+    try:
+        socket_path = args.socket or daemon.default_socket_path()
+        if args.stop:
+            daemon.send_request({"command": "stop"}, socket_path)
+            return 0
+    except daemon.DaemonError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    return daemon.serve(load_rules(), socket_path)
+
+
+def run_merge(argv: list[str]) -> int:
+    """Run `econlint merge`: combine JSON reports into one."""
+    parser = argparse.ArgumentParser(
+        prog="econlint merge",
+        description="Combine --json/--jsonl reports (e.g. from --shard runs) "
+        "into one report ordered by file, line and code.",
+    )
+    parser.add_argument("reports", nargs="+", metavar="report", help="Report files")
+    output_format = parser.add_mutually_exclusive_group()
+    output_format.add_argument(
+        "--json", action="store_true", dest="json_output", help="Output as JSON"
+    )
+    output_format.add_argument(
+        "--jsonl", action="store_true", dest="jsonl_output", help="Output as JSON Lines"
+    )
+    args = parser.parse_args(argv)
+
+    from econlint.merge import merge_reports
+
+    try:
+        warnings = merge_reports(args.reports)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    writer = open_writer(args, sys.stdout)
+    writer.write(warnings)
+    writer.close()
+    return 1 if warnings else 0
+
+
+# Subcommands, selected by the first argument
+SUBCOMMANDS = {
+    "daemon": run_daemon,
+    "lsp": run_lsp,
+    "merge": run_merge,
+}
+
+
+def scan_with_daemon(args: argparse.Namespace) -> int | None:
+    """Forward a scan to the daemon and print its answer.
+
+    Returns None if no daemon is listening.
+    """
+    from econlint import daemon
+
+    output_format = "text"
+    if args.json_output:
+        output_format = "json"
+    elif args.jsonl_output:
+        output_format = "jsonl"
+    request = {
+        "cwd": os.getcwd(),
+        "paths": [str(path) for path in args.paths],
+        "disable": args.disable,
+        "exclude": args.exclude,
+        "no_ignore": args.no_ignore,
+        "format": output_format,
+    }
+    try:
+        socket_path = args.socket or daemon.default_socket_path()
+        response = daemon.send_request(request, socket_path)
+    except daemon.DaemonNotRunning:
+        return None
+    except daemon.DaemonError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    sys.stdout.write(response["output"])
+    return response["status"]
 
 
 def main(argv: list[str] | None = None) -> int:
     """Main entry point for econlint CLI."""
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] in SUBCOMMANDS:
+        return SUBCOMMANDS[argv[0]](argv[1:])
+
     args = parse_args(argv)
 
-    if not args.path.exists():
-        print(f"Error: Path does not exist: {args.path}", file=sys.stderr)
-        return 2
+    if args.rev is None and args.diff_base is None:
+        for path in args.paths:
+            if not path.exists():
+                print(f"Error: Path does not exist: {path}", file=sys.stderr)
+                return 2
 
+    if args.daemon:
+        status = scan_with_daemon(args)
+        if status is not None:
+            return status
+        print("econlint: no daemon running, scanning locally", file=sys.stderr)
+
+    if args.profile is None:
+        return lint(args)
+
+    import cProfile
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(lint, args)
+    finally:
+        profiler.dump_stats(args.profile)
+
+
+def lint(args: argparse.Namespace) -> int:
+    """Run a scan as described by parsed arguments and write the results."""
+    start = perf_counter()
+    stats = RunStats() if args.stats else None
+    found = 0
+    listed_files: list[str] = []
     try:
+        files: Iterable[Task]
+        pathspecs = [str(path) for path in args.paths]
+        changed = None
+        if args.diff_base is not None:
+            from econlint.diff import changed_lines
+
+            changed = changed_lines(args.diff_base, args.rev, pathspecs)
+
+        if args.rev is not None:
+            from econlint.git import iter_revision_sources
+
+            files = iter_revision_sources(
+                args.rev, pathspecs, args.exclude,
+                only=None if changed is None else set(changed.files),
+            )
+        elif changed is not None:
+            files = discover_paths(
+                [], args.exclude, listed_files=[str(p) for p in changed.files]
+            )
+        else:
+            if args.files_from is not None:
+                listed_files = read_file_list(args.files_from)
+            files = discover_paths(
+                args.paths, args.exclude, not args.no_ignore, listed_files
+            )
+        if args.shard is not None:
+            files = select_shard(files, *args.shard, args.shard_by)
+        if stats is not None:
+            files = timed_iter(files, stats, "discovery")
+
         rules = get_enabled_rules(args.disable)
-        warnings, source_cache = run_analysis(args.path, rules, args.exclude)
-        warnings = filter_suppressed(warnings, source_cache)
+        jobs = args.jobs or (1 if args.profile is not None else default_jobs())
+        cache = None
+        if not args.no_cache:
+            cache = ResultCache(args.cache_dir, [rule.code for rule in rules])
+        analyzer = Analyzer(
+            rules, cache, timed=stats is not None, summarize=args.interprocedural
+        )
+
+        if args.watch:
+            from econlint.watch import DEFAULT_POLL_INTERVAL, Watcher, watch
+
+            watcher = Watcher(
+                args.paths, analyzer, args.exclude, not args.no_ignore,
+                listed_files, jobs,
+            )
+            return watch(
+                watcher, args.poll_interval or DEFAULT_POLL_INTERVAL,
+                jsonl=args.jsonl_output,
+            )
+
+        writer = open_writer(args, sys.stdout)
+
+        for warnings in run_analysis(files, analyzer, jobs, stats, changed):
+            if stats is None:
+                writer.write(warnings)
+            else:
+                write_start = perf_counter()
+                writer.write(warnings)
+                stats.add_time("formatting", perf_counter() - write_start)
+            found += len(warnings)
+        writer.close()
+    except BrokenPipeError:
+        # Output was closed early (e.g. piped into head); stop quietly
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1 if found else 0
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         return 2
 
-    if args.json_output:
-        output = format_json(warnings)
-    else:
-        output = format_text(warnings)
+    if stats is not None:
+        stats.wall_time = perf_counter() - start
+        if args.json_output or args.jsonl_output:
+            import json
 
-    if output:
-        print(output)
+            print(json.dumps(stats.to_dict(), indent=2), file=sys.stderr)
+        else:
+            print(stats.summary(), file=sys.stderr)
 
-    return 1 if warnings else 0
+    return 1 if found else 0
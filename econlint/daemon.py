@@ -0,0 +1,273 @@
+"""Long-lived analysis daemon and its client.
+
+`econlint daemon` listens on a Unix socket and answers scan requests from
+`econlint --daemon`, so back-to-back invocations skip interpreter startup,
+imports, and the analysis of files that did not change. The daemon keeps
+every file's warnings keyed by its mtime and size; a file whose signature
+changed is re-analyzed in the daemon's own process with an in-memory cache
+of whole-file and per-definition results, so touching a file without
+changing it, or editing one function, costs little. Files the daemon has
+not seen yet are spread over worker processes, and their whole-file
+results stored in that cache as they come back.
+
+Requests and responses are single JSON lines.
+"""
+
+import io
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+import tempfile
+import threading
+from collections.abc import Iterator
+from dataclasses import replace
+from pathlib import Path
+
+from econlint.cache import MemoryCache
+from econlint.discovery import discover_paths
+from econlint.formatters import JsonLinesWriter, JsonWriter, TextWriter
+from econlint.parser import read_source_bytes
+from econlint.runner import (
+    ANALYZED, Analyzer, FileResult, Task, default_jobs, iter_results,
+)
+from econlint.warnings import Warning
+
+# (mtime in ns, size) of a file when its warnings were computed
+Signature = tuple[int, int]
+
+# Warnings for the biggest repositories fit comfortably; entries are small
+DAEMON_CACHE_ENTRIES = 200_000
+
+
+class DaemonError(Exception):
+    """The daemon could not be reached or returned an error."""
+
+
+class DaemonNotRunning(DaemonError):
+    """No daemon is listening: no socket, or one left behind by a dead daemon."""
+
+
+def default_socket_path() -> Path:
+    """Per-user socket location."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "econlint.sock"
+    directory = Path(tempfile.gettempdir()) / f"econlint-{os.getuid()}"
+    try:
+        directory.mkdir(mode=0o700, exist_ok=True)
+        info = directory.lstat()
+    except OSError as e:
+        raise DaemonError(f"cannot create {directory}: {e}") from e
+    # Another user could have created it first, to intercept the socket
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or stat.S_IMODE(info.st_mode) != 0o700
+    ):
+        raise DaemonError(
+            f"{directory} is not a private directory of the current user; "
+            "remove it or pass --socket"
+        )
+    return directory / "daemon.sock"
+
+
+class ScanService:
+    """Answers scan requests, reusing results for unchanged files."""
+
+    def __init__(self, rules: list) -> None:
+        self.rules = list(rules)
+        self.cache = MemoryCache([rule.code for rule in self.rules], DAEMON_CACHE_ENTRIES)
+        self.analyzer = Analyzer(self.rules, self.cache)
+        # Handed to worker processes, which could only fill copies of the cache
+        self.worker_analyzer = Analyzer(self.rules)
+        self.results: dict[Path, tuple[Signature, list[Warning]]] = {}
+
+    def _analyze(self, seen: list[Path], unseen: list[Path]) -> Iterator[FileResult]:
+        """Analyze changed files in-process and new files in worker processes."""
+        yield from iter_results(seen, self.analyzer)
+
+        keys: dict[Path, str] = {}
+
+        def tasks() -> Iterator[Task]:
+            for path in unseen:
+                data = read_source_bytes(path)
+                if data is None:
+                    # Fails again in the worker, which reports it
+                    yield path
+                    continue
+                keys[path] = self.cache.key(data)
+                yield path, data
+
+        for result in iter_results(tasks(), self.worker_analyzer, default_jobs()):
+            key = keys.pop(result.path, None)
+            if key is not None and result.status == ANALYZED:
+                self.cache.put(key, result.warnings)
+            yield result
+
+    def _forget(self, roots: list[Path], found: set[Path]) -> None:
+        """Drop results for files under roots that are no longer found there."""
+        prefixes = tuple(f"{root}{os.sep}" for root in roots)
+        for key in [key for key in self.results if str(key).startswith(prefixes)]:
+            if key not in found:
+                del self.results[key]
+
+    def _warnings(self, paths: list[Path], cwd: Path) -> list[list[Warning]]:
+        """Current warnings for each path, analyzing only stale files."""
+        seen: list[Path] = []
+        unseen: list[Path] = []
+        current: list[tuple[Path, Path, Signature | None]] = []
+        for path in paths:
+            key = cwd / path
+            try:
+                stat = os.stat(path)
+                signature: Signature | None = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                signature = None
+            cached = self.results.get(key)
+            if cached is None:
+                unseen.append(path)
+            elif signature is None or cached[0] != signature:
+                seen.append(path)
+            current.append((path, key, signature))
+
+        fresh = {result.path: result.warnings for result in self._analyze(seen, unseen)}
+
+        per_file: list[list[Warning]] = []
+        for path, key, signature in current:
+            if path in fresh:
+                warnings = fresh[path]
+                if signature is not None:
+                    self.results[key] = (signature, warnings)
+                else:
+                    # Deleted since it was discovered
+                    self.results.pop(key, None)
+            else:
+                warnings = self.results[key][1]
+            if warnings and warnings[0].file != path:
+                warnings = [replace(w, file=path) for w in warnings]
+            per_file.append(warnings)
+        return per_file
+
+    def scan(self, request: dict) -> dict:
+        """Run a scan request and return the response."""
+        cwd = Path(request["cwd"])
+        disabled = {code.strip().upper() for code in request.get("disable", "").split(",")}
+        previous_cwd = os.getcwd()
+        # Requests are served one at a time, so changing directory is safe and
+        # keeps paths and --exclude matching exactly as in a local run
+        os.chdir(cwd)
+        try:
+            files = list(discover_paths(
+                [Path(p) for p in request["paths"]],
+                request.get("exclude") or [],
+                not request.get("no_ignore", False),
+            ))
+            per_file = self._warnings(files, cwd)
+            self._forget(
+                [cwd / p for p in request["paths"]], {cwd / path for path in files}
+            )
+        finally:
+            os.chdir(previous_cwd)
+
+        output = io.StringIO()
+        output_format = request.get("format", "text")
+        if output_format == "json":
+            writer = JsonWriter(output)
+        elif output_format == "jsonl":
+            writer = JsonLinesWriter(output)
+        else:
+            writer = TextWriter(output)
+        found = 0
+        for warnings in per_file:
+            warnings = [w for w in warnings if w.code not in disabled]
+            writer.write(warnings)
+            found += len(warnings)
+        writer.close()
+        return {"output": output.getvalue(), "status": 1 if found else 0}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: "DaemonServer"
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        try:
+            request = json.loads(line)
+            if request.get("command") == "stop":
+                response = {"output": "", "status": 0}
+                # shutdown() waits for serve_forever, so it can't run here
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+            else:
+                response = self.server.service.scan(request)
+        except Exception as e:
+            response = {"error": str(e), "status": 2}
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Serves requests one at a time on a Unix socket."""
+
+    def __init__(self, socket_path: Path, service: ScanService) -> None:
+        self.service = service
+        super().__init__(str(socket_path), _Handler)
+
+
+def _connect(socket_path: Path) -> socket.socket:
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(str(socket_path))
+    except OSError:
+        client.close()
+        raise
+    return client
+
+
+def send_request(request: dict, socket_path: Path) -> dict:
+    """Send a request to a running daemon and return its response."""
+    try:
+        client = _connect(socket_path)
+    except (FileNotFoundError, ConnectionRefusedError) as e:
+        raise DaemonNotRunning(f"no daemon listening on {socket_path}: {e}") from e
+    except OSError as e:
+        raise DaemonError(f"cannot reach the daemon on {socket_path}: {e}") from e
+    with client, client.makefile("rwb") as stream:
+        stream.write(json.dumps(request).encode() + b"\n")
+        stream.flush()
+        line = stream.readline()
+    if not line:
+        raise DaemonError("daemon closed the connection")
+    response = json.loads(line)
+    if "error" in response:
+        raise DaemonError(response["error"])
+    return response
+
+
+def serve(rules: list, socket_path: Path) -> int:
+    """Run the daemon until stopped or interrupted."""
+    if socket_path.exists():
+        try:
+            _connect(socket_path).close()
+        except OSError:
+            # Left behind by a daemon that did not shut down cleanly
+            socket_path.unlink()
+        else:
+            print(f"Error: a daemon is already listening on {socket_path}", file=sys.stderr)
+            return 2
+
+    server = DaemonServer(socket_path, ScanService(rules))
+    os.chmod(socket_path, 0o600)
+    print(f"econlint: daemon listening on {socket_path}", file=sys.stderr)
+    try:
+        server.serve_forever(poll_interval=0.2)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        try:
+            socket_path.unlink()
+        except OSError:
+            pass
+    return 0
@@ -0,0 +1,97 @@
+"""Changed-line detection against a git base ref.
+
+Used to report only warnings introduced by a change: files are still
+analyzed in full (so loop context is resolved correctly), but only warnings
+on added or modified lines are kept.
+"""
+
+import bisect
+import codecs
+import re
+from collections.abc import Iterable
+from pathlib import Path
+
+from econlint.git import run_git
+
+HUNK_HEADER = re.compile(rb"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+
+def _decode_diff_path(raw: bytes) -> str | None:
+    """Decode the path from a '+++ ' header line, or None for /dev/null."""
+    if raw.startswith(b'"') and raw.endswith(b'"'):
+        # C-style quoted path
+        raw = codecs.escape_decode(raw[1:-1])[0]
+    if raw == b"/dev/null":
+        return None
+    if raw.startswith(b"b/"):
+        raw = raw[2:]
+    return raw.decode("utf-8", errors="surrogateescape")
+
+
+class ChangedLines:
+    """Line ranges added or modified per file, on the new side of a diff."""
+
+    def __init__(self, ranges: dict[Path, list[tuple[int, int]]]) -> None:
+        self._starts: dict[Path, list[int]] = {}
+        self._ends: dict[Path, list[int]] = {}
+        for path, file_ranges in ranges.items():
+            file_ranges = sorted(file_ranges)
+            self._starts[path] = [start for start, _ in file_ranges]
+            self._ends[path] = [end for _, end in file_ranges]
+
+    @property
+    def files(self) -> list[Path]:
+        """Files with at least one added or modified line, in diff order."""
+        return [path for path, starts in self._starts.items() if starts]
+
+    def contains(self, path: Path, line: int) -> bool:
+        """Check if a line of a file was added or modified."""
+        starts = self._starts.get(path)
+        if not starts:
+            return False
+        index = bisect.bisect_right(starts, line) - 1
+        return index >= 0 and line <= self._ends[path][index]
+
+    @classmethod
+    def parse(cls, diff: bytes) -> "ChangedLines":
+        """Parse `git diff -U0` output."""
+        ranges: dict[Path, list[tuple[int, int]]] = {}
+        current: list[tuple[int, int]] | None = None
+
+        for line in diff.splitlines():
+            if line.startswith(b"+++ "):
+                path = _decode_diff_path(line[4:].rstrip(b"\t"))
+                current = None if path is None else ranges.setdefault(Path(path), [])
+            elif line.startswith(b"@@") and current is not None:
+                match = HUNK_HEADER.match(line)
+                if match is None:
+                    continue
+                start = int(match.group(1))
+                count = int(match.group(2)) if match.group(2) is not None else 1
+                if count:
+                    current.append((start, start + count - 1))
+
+        return cls(ranges)
+
+
+def changed_lines(
+    base: str,
+    rev: str | None = None,
+    pathspecs: Iterable[str] = (),
+) -> ChangedLines:
+    """Compute lines changed since the merge base of `base`.
+
+    Compares against the working tree, or against `rev` if given. Paths
+    are relative to the current directory.
+    """
+    head = rev if rev is not None else "HEAD"
+    merge_base = run_git(["merge-base", base, head]).decode().strip()
+
+    args = [
+        "diff", "-U0", "--no-color", "--no-ext-diff", "--relative",
+        "--src-prefix=a/", "--dst-prefix=b/", merge_base,
+    ]
+    if rev is not None:
+        args.append(rev)
+    diff = run_git([*args, "--", *pathspecs])
+    return ChangedLines.parse(diff)
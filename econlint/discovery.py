@@ -1,44 +1,372 @@
 """File discovery for econlint."""
 
 import fnmatch
-from collections.abc import Iterator
+import os
+import re
+import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
+# Files whose patterns are honoured while walking, lowest precedence first
+IGNORE_FILES = (".gitignore", ".ignore")
+
+# Directories that are never walked
+ALWAYS_SKIPPED_DIRS = {".git"}
+
+
+def _combine(regexes: Iterable[str]) -> re.Pattern[str] | None:
+    """Compile several anchored regexes into one alternation."""
+    regexes = list(regexes)
+    if not regexes:
+        return None
+    return re.compile("|".join(f"(?:{regex})" for regex in regexes))
+
+
+class ExcludeMatcher:
+    """Exclusion globs precompiled into single regexes.
+
+    A path is excluded if a pattern matches its full path or any of its
+    parts (directory names or the file name).
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        patterns = [os.path.normcase(pattern) for pattern in patterns]
+        self._any = _combine(fnmatch.translate(p) for p in patterns)
+        # A pattern ending in "*" that matches "dir/" matches everything
+        # below it, so directories can be pruned on their full path too
+        self._dir_prefix = _combine(
+            fnmatch.translate(p) for p in patterns if p.endswith("*")
+        )
+
+    def __bool__(self) -> bool:
+        return self._any is not None
+
+    def matches_part(self, name: str) -> bool:
+        """Check if a single path component is excluded."""
+        return self._any is not None and self._any.match(
+            os.path.normcase(name)
+        ) is not None
+
+    def matches_path(self, file_path: Path) -> bool:
+        """Check if a full path is excluded, ignoring its individual parts."""
+        return self._any is not None and self._any.match(
+            os.path.normcase(str(file_path))
+        ) is not None
+
+    def excludes_file(self, file_path: Path) -> bool:
+        """Check if a file is excluded by its full path or any part."""
+        if self._any is None:
+            return False
+        if self.matches_path(file_path):
+            return True
+        return any(self.matches_part(part) for part in file_path.parts)
+
+    def prunes_dir(self, dir_path: Path) -> bool:
+        """Check if everything below a directory is excluded.
+
+        Only the directory's own name and full path are checked; its parent
+        parts are checked when the parents themselves are walked.
+        """
+        if self._any is None:
+            return False
+        if self.matches_part(dir_path.name):
+            return True
+        return self._dir_prefix is not None and self._dir_prefix.match(
+            os.path.normcase(str(dir_path) + os.sep)
+        ) is not None
+
+
+def _translate_ignore_glob(pattern: str) -> str:
+    """Translate a gitignore glob into a regex over '/'-separated paths."""
+    regex = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            regex.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == n:
+            regex.append("/.*")
+            i += 3
+        elif pattern.startswith("**", i):
+            regex.append(".*")
+            i += 2
+        elif c == "*":
+            regex.append("[^/]*")
+            i += 1
+        elif c == "?":
+            regex.append("[^/]")
+            i += 1
+        elif c == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                regex.append(re.escape(c))
+                i += 1
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                regex.append("[" + body.replace("\\", "\\\\") + "]")
+                i = end + 1
+        elif c == "\\" and i + 1 < n:
+            regex.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            regex.append(re.escape(c))
+            i += 1
+    return "".join(regex)
+
+
+class IgnoreFile:
+    """Patterns from one .gitignore/.ignore file.
+
+    Paths passed to `match` are relative to the directory holding the file,
+    '/'-separated.
+    """
+
+    def __init__(self, lines: Iterable[str]) -> None:
+        # (regex, negated, directories only), in file order
+        self.rules: list[tuple[re.Pattern[str], bool, bool]] = []
+
+        for line in lines:
+            if not line.endswith("\\ "):
+                line = line.rstrip()
+            if not line or line.startswith("#"):
+                continue
+
+            negated = line.startswith("!")
+            if negated:
+                line = line[1:]
+            elif line.startswith("\\"):
+                line = line[1:]
+
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+
+            if "/" in line:
+                # Anchored to the directory containing the ignore file
+                regex = _translate_ignore_glob(line.lstrip("/"))
+            else:
+                regex = "(?:.*/)?" + _translate_ignore_glob(line)
+            self.rules.append((re.compile(regex + r"\Z", re.DOTALL), negated, dir_only))
+
+        self._has_negation = any(negated for _, negated, _ in self.rules)
+        self._files = _combine(
+            r.pattern for r, _, dir_only in self.rules if not dir_only
+        )
+        self._dirs = _combine(r.pattern for r, _, _ in self.rules)
+
+    @classmethod
+    def load(cls, path: Path) -> "IgnoreFile | None":
+        """Read an ignore file, returning None if it is missing or empty."""
+        try:
+            text = path.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return None
+        ignore_file = cls(text.splitlines())
+        return ignore_file if ignore_file.rules else None
+
+    def match(self, rel_path: str, is_dir: bool) -> bool | None:
+        """Check a path against this file's patterns.
+
+        Returns True if ignored, False if explicitly re-included with '!',
+        or None if no pattern applies.
+        """
+        if not self._has_negation:
+            combined = self._dirs if is_dir else self._files
+            if combined is not None and combined.match(rel_path):
+                return True
+            return None
+
+        for regex, negated, dir_only in reversed(self.rules):
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel_path):
+                return not negated
+        return None
+
+
+def _find_repo_root(path: Path) -> Path | None:
+    """Find the enclosing git work tree, if any."""
+    for candidate in (path, *path.parents):
+        if (candidate / ".git").exists():
+            return candidate
+    return None
+
+
+# An active ignore file: (prefix, strip, file). A path relative to the walk
+# root maps to a path relative to the file's directory as
+# prefix + rel_path[strip:]
+ActiveIgnore = tuple[str, int, IgnoreFile]
+
+
+def _ancestor_ignore_files(root: Path) -> list[ActiveIgnore]:
+    """Load ignore files from the repository root down to (excluding) root."""
+    root = root.resolve()
+    repo_root = _find_repo_root(root)
+    if repo_root is None or repo_root == root:
+        return []
+
+    loaded: list[ActiveIgnore] = []
+    rel_parts = root.relative_to(repo_root).parts
+    directory = repo_root
+    for depth in range(len(rel_parts)):
+        prefix = "/".join(rel_parts[depth:]) + "/"
+        for name in IGNORE_FILES:
+            ignore_file = IgnoreFile.load(directory / name)
+            if ignore_file is not None:
+                loaded.append((prefix, 0, ignore_file))
+        directory = directory / rel_parts[depth]
+    return loaded
+
+
+def _is_ignored(ignores: list[ActiveIgnore], rel_path: str, is_dir: bool) -> bool:
+    """Apply ignore files, the most deeply nested taking precedence."""
+    for prefix, strip, ignore_file in reversed(ignores):
+        decision = ignore_file.match(prefix + rel_path[strip:], is_dir)
+        if decision is not None:
+            return decision
+    return False
+
 
 def discover_files(
     path: Path,
-    exclude_patterns: list[str] | None = None
+    exclude_patterns: list[str] | None = None,
+    respect_ignore_files: bool = True,
 ) -> Iterator[Path]:
     """Discover Python files to analyze.
 
     Args:
         path: File or directory to analyze
         exclude_patterns: Glob patterns to exclude (e.g., ["**/tests/**", "**/venv/**"])
+        respect_ignore_files: Skip paths listed in .gitignore/.ignore files
 
     If path is a file, yield it if it's a .py file.
-    If path is a directory, recursively yield all .py files.
+    If path is a directory, recursively yield all .py files. Excluded and
+    ignored directories are pruned without being entered. Files in a
+    directory are yielded in name order before its subdirectories.
     """
-    exclude_patterns = exclude_patterns or []
-
-    def is_excluded(file_path: Path) -> bool:
-        """Check if a path matches any exclusion pattern."""
-        path_str = str(file_path)
-        for pattern in exclude_patterns:
-            if fnmatch.fnmatch(path_str, pattern):
-                return True
-            # Also check just the relative path parts
-            if fnmatch.fnmatch(file_path.name, pattern):
-                return True
-            # Check if any parent directory matches
-            for part in file_path.parts:
-                if fnmatch.fnmatch(part, pattern):
-                    return True
-        return False
+    matcher = ExcludeMatcher(exclude_patterns or [])
 
     if path.is_file():
-        if path.suffix == ".py" and not is_excluded(path):
+        if path.suffix == ".py" and not matcher.excludes_file(path):
             yield path
-    elif path.is_dir():
-        for file_path in path.rglob("*.py"):
-            if file_path.is_file() and not is_excluded(file_path):
+        return
+    if not path.is_dir():
+        return
+    if any(matcher.matches_part(part) for part in path.parts):
+        return
+
+    root_ignores: list[ActiveIgnore] = []
+    if respect_ignore_files:
+        root_ignores = _ancestor_ignore_files(path)
+
+    # (directory, path relative to root with trailing '/', active ignore files)
+    stack: list[tuple[Path, str, list[ActiveIgnore]]] = [
+        (path, "", root_ignores)
+    ]
+    while stack:
+        directory, rel_dir, ignores = stack.pop()
+
+        if respect_ignore_files:
+            for name in IGNORE_FILES:
+                ignore_file = IgnoreFile.load(directory / name)
+                if ignore_file is not None:
+                    ignores = ignores + [("", len(rel_dir), ignore_file)]
+
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+
+        subdirs: list[Path] = []
+        for entry in entries:
+            name = entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+
+            if is_dir:
+                if name in ALWAYS_SKIPPED_DIRS:
+                    continue
+                dir_path = directory / name
+                if matcher and matcher.prunes_dir(dir_path):
+                    continue
+                if ignores and _is_ignored(ignores, rel_dir + name, True):
+                    continue
+                subdirs.append(dir_path)
+            elif name.endswith(".py"):
+                if matcher and matcher.matches_part(name):
+                    continue
+                if ignores and _is_ignored(ignores, rel_dir + name, False):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                file_path = directory / name
+                # Parent parts were checked as directories were entered
+                if matcher and matcher.matches_path(file_path):
+                    continue
+                yield file_path
+
+        for dir_path in reversed(subdirs):
+            stack.append((dir_path, rel_dir + dir_path.name + "/", ignores))
+
+
+def read_file_list(source: str) -> list[str]:
+    """Read a list of file names from a file, or from stdin if source is "-".
+
+    Names are NUL-separated if the input contains a NUL byte (as produced by
+    `git ls-files -z`), otherwise newline-separated.
+    """
+    if source == "-":
+        data = sys.stdin.buffer.read()
+    else:
+        with open(source, "rb") as f:
+            data = f.read()
+
+    separator = b"\0" if b"\0" in data else b"\n"
+    names = []
+    for raw in data.split(separator):
+        raw = raw.rstrip(b"\r") if separator == b"\n" else raw
+        if raw.strip():
+            names.append(os.fsdecode(raw))
+    return names
+
+
+def discover_paths(
+    paths: Iterable[Path],
+    exclude_patterns: list[str] | None = None,
+    respect_ignore_files: bool = True,
+    listed_files: Iterable[str] = (),
+) -> Iterator[Path]:
+    """Discover Python files under several paths plus an explicit file list.
+
+    Listed files are taken as given: they are filtered by suffix and
+    exclusion patterns but not looked up on disk, so no traversal happens.
+    Each file is yielded once, in first-seen order.
+    """
+    seen: set[Path] = set()
+
+    for path in paths:
+        for file_path in discover_files(path, exclude_patterns, respect_ignore_files):
+            if file_path not in seen:
+                seen.add(file_path)
                 yield file_path
+
+    matcher = ExcludeMatcher(exclude_patterns or [])
+    for name in listed_files:
+        file_path = Path(name)
+        if file_path.suffix != ".py" or file_path in seen:
+            continue
+        if matcher and matcher.excludes_file(file_path):
+            continue
+        seen.add(file_path)
+        yield file_path
@@ -0,0 +1,141 @@
+"""Single-pass rule execution for econlint.
+
+Each module's AST is walked exactly once. Every node is fanned out to the
+handlers of all enabled rules:
+
+  visit_<NodeType>(node)  called before the node's children are walked
+  leave_<NodeType>(node)  called after the node's children are walked
+
+Rules keep their own state by pairing visit_ and leave_ handlers, so adding
+a rule costs a handler call per matching node, not a traversal. Context
+shared by all rules (enclosing loops and functions, call names) lives in a
+ModuleFacts object whose handlers run before every rule's visit_ and after
+every rule's leave_ (see econlint.facts). Observers are walk participants
+that produce no warnings, such as the function summary collector of
+econlint.callgraph; they share the same pass.
+
+When a timings dict is passed, every handler is wrapped to add its wall
+time under "rule:<code>"; the walk is untouched otherwise.
+"""
+
+import ast
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from econlint.facts import ModuleFacts
+from econlint.warnings import Warning
+
+if TYPE_CHECKING:
+    from econlint.rules.base import BaseRule
+
+Handler = Callable[[ast.AST], None]
+
+
+def _timed(handler: Handler, key: str, timings: dict[str, float]) -> Handler:
+    """Wrap a handler to accumulate its wall time in timings[key]."""
+    def timed_handler(node: ast.AST) -> None:
+        start = perf_counter()
+        handler(node)
+        timings[key] = timings.get(key, 0.0) + perf_counter() - start
+
+    return timed_handler
+
+
+def _resolve_handlers(
+    rules: Sequence["BaseRule"],
+    node_type: type,
+    timings: dict[str, float] | None = None,
+    facts: ModuleFacts | None = None,
+    observers: Sequence[object] = (),
+) -> tuple[list[Handler], list[Handler]]:
+    """Collect the bound visit_/leave_ handlers of all rules for a node type.
+
+    Observers' handlers run after the rules' and are not timed.
+    """
+    name = node_type.__name__
+    enter: list[Handler] = []
+    leave: list[Handler] = []
+    if facts is not None:
+        handler = getattr(facts, "visit_" + name, None)
+        if handler is not None:
+            enter.append(handler)
+    for rule in rules:
+        for prefix, handlers in (("visit_", enter), ("leave_", leave)):
+            handler = getattr(rule, prefix + name, None)
+            if handler is None:
+                continue
+            if timings is not None:
+                handler = _timed(handler, "rule:" + rule.code, timings)
+            handlers.append(handler)
+    for observer in observers:
+        for prefix, handlers in (("visit_", enter), ("leave_", leave)):
+            handler = getattr(observer, prefix + name, None)
+            if handler is not None:
+                handlers.append(handler)
+    if facts is not None:
+        handler = getattr(facts, "leave_" + name, None)
+        if handler is not None:
+            leave.append(handler)
+    return enter, leave
+
+
+def walk(
+    tree: ast.AST,
+    rules: Sequence["BaseRule"],
+    timings: dict[str, float] | None = None,
+    facts: ModuleFacts | None = None,
+    observers: Sequence[object] = (),
+) -> None:
+    """Walk a tree once, dispatching every node to all rules and observers.
+
+    If facts is given, its context is kept up to date during the walk.
+    """
+    table: dict[type, tuple[list[Handler], list[Handler]]] = {}
+    iter_child_nodes = ast.iter_child_nodes
+
+    def visit(node: ast.AST) -> None:
+        node_type = node.__class__
+        handlers = table.get(node_type)
+        if handlers is None:
+            handlers = table[node_type] = _resolve_handlers(
+                rules, node_type, timings, facts, observers
+            )
+        enter, leave = handlers
+
+        for handler in enter:
+            handler(node)
+        for child in iter_child_nodes(node):
+            visit(child)
+        for handler in leave:
+            handler(node)
+
+    visit(tree)
+
+
+def run_rules(
+    file_path: Path,
+    source: str,
+    tree: ast.Module,
+    rule_classes: Sequence[type["BaseRule"]],
+    timings: dict[str, float] | None = None,
+    facts: ModuleFacts | None = None,
+    observers: Sequence[object] = (),
+) -> list[Warning]:
+    """Run all rule classes over a parsed module in a single pass.
+
+    Warnings are returned grouped by rule, in the order of `rule_classes`.
+    If timings is given, per-rule handler time is accumulated into it.
+    Pass facts when `tree` is only part of the module, and observers to
+    have them walk the tree in the same pass.
+    """
+    if facts is None:
+        facts = ModuleFacts(source, tree)
+    rules = [rule_class(file_path, source, facts) for rule_class in rule_classes]
+    walk(tree, rules, timings, facts, observers)
+
+    warnings: list[Warning] = []
+    for rule in rules:
+        warnings.extend(rule.warnings)
+    return warnings
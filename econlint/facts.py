@@ -0,0 +1,250 @@
+"""Per-module facts shared by all rules.
+
+One ModuleFacts object is built per module and handed to every rule, so
+context several rules need is computed once rather than once per rule:
+
+- loops / functions: the loops and function definitions enclosing the
+  node currently being visited, innermost last. The engine keeps these
+  up to date during its single walk: a node is pushed before any rule
+  sees it and popped after every rule has left it.
+- call_parts() / call_name(): call names, resolved once per Call node and
+  stored both dotted and split into receiver and method, plus the
+  qualified name the module's imports resolve it to (see below). Calls
+  nested in a chain (a.b().c()) reuse the entry of the inner call.
+- lines / segment(): the source split into lines once, and node source
+  segments sliced from them.
+- imports: local names bound by module-level imports. A call whose name
+  starts with one of them is qualified with its origin: with
+  `import httpx as hx`, hx.get is "httpx.get"; with `from requests import
+  get`, get is "requests.get". Names bound inside functions, or rebound
+  after the import, are not tracked.
+- has_semaphore: whether the module creates a Semaphore.
+
+Module-wide facts are computed lazily, on first use.
+"""
+
+import ast
+import re
+from dataclasses import dataclass
+from functools import cached_property
+
+# Pattern to detect Semaphore instantiation in code
+SEMAPHORE_PATTERN = re.compile(r"\bSemaphore\s*\(")
+
+# First component of a dotted call name ("hx" in "hx.Client().get")
+NAME_HEAD = re.compile(r"[^.(\[]*")
+
+# Line breaks as the parser sees them
+LINE_BREAK = re.compile(r"\r\n?|\n")
+
+# Statements whose bodies are searched for module-level imports
+_IMPORT_BLOCKS = (ast.If, ast.Try, ast.With)
+
+
+def module_has_semaphore(source: str) -> bool:
+    """Check if a module uses a Semaphore."""
+    if "Semaphore" not in source:
+        return False
+    for line in source.splitlines():
+        # Skip comment-only lines
+        code_part = line.split("#")[0]
+        if SEMAPHORE_PATTERN.search(code_part):
+            return True
+    return False
+
+
+def expr_name(node: ast.expr) -> str:
+    """Recursively build a dotted name from an expression."""
+    if isinstance(node, ast.Name):
+        return node.id
+    elif isinstance(node, ast.Attribute):
+        value_name = expr_name(node.value)
+        if value_name:
+            return f"{value_name}.{node.attr}"
+        return node.attr
+    elif isinstance(node, ast.Call):
+        return expr_name(node.func) + "()"
+    elif isinstance(node, ast.Subscript):
+        return expr_name(node.value) + "[]"
+    return ""
+
+
+def split_lines(source: str) -> list[str]:
+    """Split source into lines, keeping line endings, as the parser does."""
+    lines = []
+    start = 0
+    for match in LINE_BREAK.finditer(source):
+        lines.append(source[start:match.end()])
+        start = match.end()
+    if start < len(source):
+        lines.append(source[start:])
+    return lines
+
+
+def _module_imports(body: list[ast.stmt], imports: dict[str, str]) -> None:
+    for node in body:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    imports[alias.asname] = alias.name
+                else:
+                    name = alias.name.partition(".")[0]
+                    imports[name] = name
+        elif isinstance(node, ast.ImportFrom):
+            module = "." * node.level + (node.module or "")
+            for alias in node.names:
+                if alias.name == "*":
+                    continue
+                qualified = f"{module}.{alias.name}" if node.module else module + alias.name
+                imports[alias.asname or alias.name] = qualified
+        elif isinstance(node, _IMPORT_BLOCKS):
+            _module_imports(node.body, imports)
+            if isinstance(node, ast.Try):
+                for handler in node.handlers:
+                    _module_imports(handler.body, imports)
+            _module_imports(getattr(node, "orelse", []), imports)
+            _module_imports(getattr(node, "finalbody", []), imports)
+
+
+@dataclass(slots=True)
+class CallName:
+    """A resolved call name, e.g. "client.api.get" split at its last dot."""
+
+    dotted: str
+    # "client.api"; empty for a bare function call
+    receiver: str
+    # "get"
+    method: str
+    # Dotted name with its first component resolved through the module's
+    # imports, e.g. "httpx.Client.get" for hx.Client.get; else dotted
+    qualified: str
+
+
+class ModuleFacts:
+    """Facts about one module, shared by all rules analyzing it."""
+
+    def __init__(self, source: str, tree: ast.Module | None = None) -> None:
+        self.source = source
+        self.tree = tree
+        self.loops: list[ast.AST] = []
+        self.functions: list[ast.AST] = []
+        self._call_names: dict[ast.Call, CallName] = {}
+
+    @property
+    def enclosing_loop(self) -> ast.AST | None:
+        """Innermost loop or comprehension around the current node."""
+        return self.loops[-1] if self.loops else None
+
+    @property
+    def enclosing_function(self) -> ast.AST | None:
+        """Innermost function or lambda around the current node."""
+        return self.functions[-1] if self.functions else None
+
+    def call_parts(self, node: ast.Call) -> CallName:
+        """Name of a call's target, dotted and split into receiver and method."""
+        entry = self._call_names.get(node)
+        if entry is None:
+            func = node.func
+            if isinstance(func, ast.Attribute):
+                receiver = self._expr_name(func.value)
+                dotted = f"{receiver}.{func.attr}" if receiver else func.attr
+                entry = CallName(dotted, receiver, func.attr, self.qualify(dotted))
+            else:
+                dotted = self._expr_name(func)
+                receiver, _, method = dotted.rpartition(".")
+                entry = CallName(dotted, receiver, method, self.qualify(dotted))
+            self._call_names[node] = entry
+        return entry
+
+    def call_name(self, node: ast.Call) -> str:
+        """Dotted name of a call's target, e.g. "requests.get"."""
+        return self.call_parts(node).dotted
+
+    def qualified_name(self, node: ast.Call) -> str:
+        """Call name resolved through the module's imports."""
+        return self.call_parts(node).qualified
+
+    def qualify(self, dotted: str) -> str:
+        """Resolve the first component of a dotted name through the imports."""
+        imports = self.imports
+        if not imports:
+            return dotted
+        head = NAME_HEAD.match(dotted).group()
+        origin = imports.get(head)
+        if origin is None or origin == head:
+            return dotted
+        return origin + dotted[len(head):]
+
+    def _expr_name(self, node: ast.expr) -> str:
+        """expr_name, reusing the table for calls inside the expression."""
+        if isinstance(node, ast.Name):
+            return node.id
+        elif isinstance(node, ast.Attribute):
+            value_name = self._expr_name(node.value)
+            if value_name:
+                return f"{value_name}.{node.attr}"
+            return node.attr
+        elif isinstance(node, ast.Call):
+            return self.call_parts(node).dotted + "()"
+        elif isinstance(node, ast.Subscript):
+            return self._expr_name(node.value) + "[]"
+        return ""
+
+    @cached_property
+    def lines(self) -> list[str]:
+        """Source lines, line endings included."""
+        return split_lines(self.source)
+
+    def segment(self, node: ast.AST) -> str | None:
+        """Source text of a node, like ast.get_source_segment."""
+        try:
+            if node.end_lineno is None or node.end_col_offset is None:
+                return None
+            first = node.lineno - 1
+            last = node.end_lineno - 1
+            start = node.col_offset
+            end = node.end_col_offset
+        except AttributeError:
+            return None
+
+        lines = self.lines
+        # Column offsets count UTF-8 bytes
+        if first == last:
+            return lines[first].encode()[start:end].decode()
+        head = lines[first].encode()[start:].decode()
+        tail = lines[last].encode()[:end].decode()
+        return "".join([head, *lines[first + 1:last], tail])
+
+    @cached_property
+    def imports(self) -> dict[str, str]:
+        """Names bound by module-level imports, mapped to what they import."""
+        imports: dict[str, str] = {}
+        if self.tree is not None:
+            _module_imports(self.tree.body, imports)
+        return imports
+
+    @cached_property
+    def has_semaphore(self) -> bool:
+        """Whether the module creates a Semaphore anywhere."""
+        return module_has_semaphore(self.source)
+
+    # Context tracking, driven by the engine's walk
+
+    def _enter_loop(self, node: ast.AST) -> None:
+        self.loops.append(node)
+
+    def _leave_loop(self, node: ast.AST) -> None:
+        self.loops.pop()
+
+    def _enter_function(self, node: ast.AST) -> None:
+        self.functions.append(node)
+
+    def _leave_function(self, node: ast.AST) -> None:
+        self.functions.pop()
+
+    visit_For = visit_AsyncFor = visit_While = _enter_loop
+    visit_ListComp = visit_SetComp = visit_DictComp = visit_GeneratorExp = _enter_loop
+    leave_For = leave_AsyncFor = leave_While = _leave_loop
+    leave_ListComp = leave_SetComp = leave_DictComp = leave_GeneratorExp = _leave_loop
+    visit_FunctionDef = visit_AsyncFunctionDef = visit_Lambda = _enter_function
+    leave_FunctionDef = leave_AsyncFunctionDef = leave_Lambda = _leave_function
@@ -1,6 +1,26 @@
-"""Output formatters for econlint."""
+"""Output formatters for econlint.
 
-from econlint.formatters.text import format_text
-from econlint.formatters.json_fmt import format_json
+Formatter modules are imported when first used.
+"""
 
-__all__ = ["format_text", "format_json"]
+import importlib
+
+_EXPORTS = {
+    "format_text": "econlint.formatters.text",
+    "TextWriter": "econlint.formatters.text",
+    "format_json": "econlint.formatters.json_fmt",
+    "JsonWriter": "econlint.formatters.json_fmt",
+    "JsonLinesWriter": "econlint.formatters.json_fmt",
+}
+
+
+def __getattr__(name: str) -> object:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
+
+
+__all__ = [
+    "format_text", "format_json", "TextWriter", "JsonWriter", "JsonLinesWriter",
+]
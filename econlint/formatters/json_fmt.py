@@ -1,21 +1,63 @@
 """JSON output formatter for econlint."""
 
 import json
+from collections.abc import Iterable
+from typing import TextIO
 
 from econlint.warnings import Warning
 
 
+def warning_to_dict(warning: Warning) -> dict:
+    """Convert a warning to a JSON-serializable dict."""
+    return {
+        "code": warning.code,
+        "message": warning.message,
+        "file": str(warning.file),
+        "line": warning.line,
+        "pattern": warning.pattern,
+        "explanation": warning.explanation,
+    }
+
+
 def format_json(warnings: list[Warning]) -> str:
     """Format warnings as JSON."""
-    data = [
-        {
-            "code": w.code,
-            "message": w.message,
-            "file": str(w.file),
-            "line": w.line,
-            "pattern": w.pattern,
-            "explanation": w.explanation,
-        }
-        for w in warnings
-    ]
+    data = [warning_to_dict(w) for w in warnings]
     return json.dumps(data, indent=2)
+
+
+class JsonWriter:
+    """Writes a JSON array of warnings incrementally.
+
+    The complete output is identical to printing format_json().
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+        self._count = 0
+
+    def write(self, warnings: Iterable[Warning]) -> None:
+        for warning in warnings:
+            item = json.dumps(warning_to_dict(warning), indent=2)
+            item = item.replace("\n", "\n  ")
+            self.stream.write(("[\n  " if self._count == 0 else ",\n  ") + item)
+            self._count += 1
+        self.stream.flush()
+
+    def close(self) -> None:
+        self.stream.write("[]\n" if self._count == 0 else "\n]\n")
+        self.stream.flush()
+
+
+class JsonLinesWriter:
+    """Writes one JSON object per warning per line (JSON Lines)."""
+
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+
+    def write(self, warnings: Iterable[Warning]) -> None:
+        for warning in warnings:
+            self.stream.write(json.dumps(warning_to_dict(warning)) + "\n")
+        self.stream.flush()
+
+    def close(self) -> None:
+        self.stream.flush()
@@ -1,8 +1,26 @@
 """Text output formatter for econlint."""
 
+from collections.abc import Iterable
+from typing import TextIO
+
 from econlint.warnings import Warning
 
 
+def format_warning(warning: Warning) -> str:
+    """Format a single warning as a human-readable block."""
+    header = f"{warning.code}: {warning.message} at {warning.file}:{warning.line}"
+
+    explanation_lines = warning.explanation.strip().split("\n")
+    indented_explanation = "\n".join(f"  {line}" for line in explanation_lines)
+
+    return f"""{header}
+
+  Pattern: {warning.pattern}
+
+{indented_explanation}
+"""
+
+
 def format_text(warnings: list[Warning]) -> str:
     """Format warnings as human-readable text.
 
@@ -17,20 +35,22 @@ def format_text(warnings: list[Warning]) -> str:
     if not warnings:
         return ""
 
-    parts: list[str] = []
+    return "\n".join(format_warning(warning) for warning in warnings)
 
-    for warning in warnings:
-        header = f"{warning.code}: {warning.message} at {warning.file}:{warning.line}"
 
-        explanation_lines = warning.explanation.strip().split("\n")
-        indented_explanation = "\n".join(f"  {line}" for line in explanation_lines)
+class TextWriter:
+    """Writes warnings as text blocks as they arrive.
 
-        block = f"""{header}
+    The complete output is identical to printing format_text().
+    """
 
-  Pattern: {warning.pattern}
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
 
-{indented_explanation}
-"""
-        parts.append(block)
+    def write(self, warnings: Iterable[Warning]) -> None:
+        for warning in warnings:
+            self.stream.write(format_warning(warning) + "\n")
+        self.stream.flush()
 
-    return "\n".join(parts)
+    def close(self) -> None:
+        self.stream.flush()
@@ -0,0 +1,159 @@
+"""Reading Python sources straight from a git object database.
+
+Lets econlint lint any revision without checking it out: the tree is
+listed with `git ls-tree` and blob contents are streamed through a single
+long-lived `git cat-file --batch` process.
+"""
+
+import subprocess
+import threading
+from collections.abc import Collection, Iterable, Iterator
+from pathlib import Path
+
+from econlint.discovery import ExcludeMatcher
+
+# Tree entry modes that hold regular file contents (symlinks and
+# submodules are skipped)
+FILE_MODES = {"100644", "100755"}
+
+
+class GitError(Exception):
+    """A git command failed."""
+
+
+def run_git(args: list[str], cwd: Path | None = None) -> bytes:
+    """Run a git command and return its stdout."""
+    try:
+        completed = subprocess.run(
+            ["git", *args],
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=False,
+        )
+    except OSError as e:
+        raise GitError(f"could not run git: {e}") from e
+    if completed.returncode != 0:
+        message = completed.stderr.decode(errors="replace").strip()
+        raise GitError(message or f"git {args[0]} failed")
+    return completed.stdout
+
+
+def list_python_blobs(rev: str, pathspecs: Iterable[str] = ()) -> list[tuple[str, str]]:
+    """List the .py files in a revision's tree as (path, blob id) pairs.
+
+    Paths are relative to the current directory, as with `git ls-tree`
+    run without --full-tree; pathspecs restrict the listing.
+    """
+    output = run_git(["ls-tree", "-r", "-z", rev, "--", *pathspecs])
+
+    blobs: list[tuple[str, str]] = []
+    for record in output.split(b"\0"):
+        if not record:
+            continue
+        meta, _, raw_path = record.partition(b"\t")
+        mode, object_type, object_id = meta.decode().split(" ")
+        path = raw_path.decode("utf-8", errors="surrogateescape")
+        if object_type == "blob" and mode in FILE_MODES and path.endswith(".py"):
+            blobs.append((path, object_id))
+    return blobs
+
+
+class BlobReader:
+    """Reads blob contents through one `git cat-file --batch` process.
+
+    Use as a context manager; the process is shut down on exit.
+    """
+
+    def __init__(self) -> None:
+        self._process: subprocess.Popen[bytes] | None = None
+
+    def __enter__(self) -> "BlobReader":
+        try:
+            self._process = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+        except OSError as e:
+            raise GitError(f"could not run git: {e}") from e
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        process = self._process
+        if process is None:
+            return
+        self._process = None
+        try:
+            if process.stdin is not None:
+                process.stdin.close()
+        except OSError:
+            pass
+        if process.stdout is not None:
+            process.stdout.close()
+        process.wait()
+
+    def iter_blobs(self, object_ids: Iterable[str]) -> Iterator[bytes]:
+        """Yield the contents of each object, in order.
+
+        Requests are written from a separate thread so git never blocks on
+        a full output pipe while we are still sending it object ids.
+        """
+        process = self._process
+        if process is None or process.stdin is None or process.stdout is None:
+            raise GitError("BlobReader used outside of a with block")
+        stdin, stdout = process.stdin, process.stdout
+        object_ids = list(object_ids)
+
+        def feed() -> None:
+            try:
+                for object_id in object_ids:
+                    stdin.write(object_id.encode() + b"\n")
+                stdin.flush()
+            except (OSError, ValueError):
+                pass
+
+        feeder = threading.Thread(target=feed, daemon=True)
+        feeder.start()
+        finished = False
+        try:
+            for object_id in object_ids:
+                header = stdout.readline()
+                if not header:
+                    raise GitError("git cat-file exited unexpectedly")
+                fields = header.split()
+                if len(fields) != 3:
+                    status = header.decode(errors="replace").strip()
+                    raise GitError(f"cannot read object {object_id}: {status}")
+                data = stdout.read(int(fields[2]))
+                stdout.read(1)  # trailing newline
+                yield data
+            finished = True
+        finally:
+            if not finished:
+                # Abandoned early: stop git so a blocked feeder unblocks
+                process.kill()
+            feeder.join()
+
+
+def iter_revision_sources(
+    rev: str,
+    pathspecs: Iterable[str] = (),
+    exclude_patterns: list[str] | None = None,
+    only: Collection[Path] | None = None,
+) -> Iterator[tuple[Path, bytes]]:
+    """Yield (path, contents) for every .py file in a revision.
+
+    If `only` is given, files not in it are skipped.
+    """
+    matcher = ExcludeMatcher(exclude_patterns or [])
+    blobs = [
+        (path, object_id)
+        for path, object_id in list_python_blobs(rev, pathspecs)
+        if not (matcher and matcher.excludes_file(Path(path)))
+        and (only is None or Path(path) in only)
+    ]
+    with BlobReader() as reader:
+        contents = reader.iter_blobs(object_id for _, object_id in blobs)
+        for (path, _), data in zip(blobs, contents):
+            yield Path(path), data
@@ -0,0 +1,110 @@
+"""Function-level incremental analysis.
+
+A module's top-level functions and classes are analyzed as independent
+segments. Warnings for each are cached under a hash of the definition's
+exact source text, plus the module-wide context the rules depend on (the
+module's imports, which qualify call names, and each rule's
+module_context), with line numbers stored relative to the first line of
+the definition. When a file changes, only definitions whose text changed
+are walked again; warnings for the others are reused and shifted to
+wherever the definition now starts. Top-level statements outside
+definitions are always analyzed.
+
+The hash covers the source text rather than a normalized AST because rules
+may read source segments (comments included) and because stored line
+offsets within a definition are only valid if its text is unchanged.
+"""
+
+import ast
+import bisect
+from collections.abc import Sequence
+from dataclasses import replace
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from econlint.engine import run_rules
+from econlint.facts import ModuleFacts
+from econlint.warnings import Warning
+
+if TYPE_CHECKING:
+    from econlint.cache import MemoryCache, ResultCache
+    from econlint.rules.base import BaseRule
+
+SEGMENT_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+# Modules with fewer top-level definitions are analyzed whole
+MIN_SEGMENTS = 2
+
+
+def statement_span(node: ast.stmt) -> tuple[int, int]:
+    """First and last line of a top-level statement, decorators included."""
+    start = node.lineno
+    for decorator in getattr(node, "decorator_list", ()):
+        start = min(start, decorator.lineno)
+    return start, node.end_lineno or node.lineno
+
+
+def run_rules_incremental(
+    file_path: Path,
+    source: str,
+    tree: ast.Module,
+    rule_classes: Sequence[type["BaseRule"]],
+    cache: "ResultCache | MemoryCache",
+    timings: dict[str, float] | None = None,
+    facts: ModuleFacts | None = None,
+    observers: Sequence[object] = (),
+) -> list[Warning]:
+    """Run rules over a module, reusing cached results per definition.
+
+    Returns the same warnings, in the same order, as run_rules. Observers
+    only walk the statements the rules walk.
+    """
+    if facts is None:
+        facts = ModuleFacts(source, tree)
+    body = tree.body
+    if sum(isinstance(node, SEGMENT_TYPES) for node in body) < MIN_SEGMENTS:
+        return run_rules(file_path, source, tree, rule_classes, timings, facts, observers)
+
+    lines = facts.lines
+    context = "\0".join(rule.module_context(source) for rule in rule_classes)
+    imports = ",".join(f"{name}={origin}" for name, origin in sorted(facts.imports.items()))
+    prefix = f"segment\0{context}\0{imports}\0".encode()
+
+    spans = [statement_span(node) for node in body]
+    found: list[list[Warning]] = [[] for _ in body]
+    missed: dict[int, str] = {}
+    to_walk: list[ast.stmt] = []
+
+    for index, node in enumerate(body):
+        if not isinstance(node, SEGMENT_TYPES):
+            to_walk.append(node)
+            continue
+        start, end = spans[index]
+        text = "".join(lines[start - 1:end])
+        key = cache.key(prefix + text.encode("utf-8", "surrogatepass"))
+        cached = cache.get(key, file_path)
+        if cached is None:
+            missed[index] = key
+            to_walk.append(node)
+        else:
+            found[index] = [replace(w, line=w.line + start - 1) for w in cached]
+
+    if to_walk:
+        partial = ast.Module(body=to_walk, type_ignores=[])
+        starts = [start for start, _ in spans]
+        for warning in run_rules(
+            file_path, source, partial, rule_classes, timings, facts, observers
+        ):
+            index = max(0, bisect.bisect_right(starts, warning.line) - 1)
+            found[index].append(warning)
+
+    for index, key in missed.items():
+        offset = spans[index][0] - 1
+        cache.put(key, [replace(w, line=w.line - offset) for w in found[index]])
+
+    # Regroup by rule, in statement order, to match a whole-module walk
+    warnings: list[Warning] = []
+    for rule_class in rule_classes:
+        for statement_warnings in found:
+            warnings.extend(w for w in statement_warnings if w.code == rule_class.code)
+    return warnings
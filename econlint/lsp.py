@@ -0,0 +1,220 @@
+"""Language Server Protocol mode for econlint.
+
+`econlint lsp` speaks JSON-RPC over stdin/stdout. Buffers are analyzed
+from the contents the editor sends, never from disk. Rapid edits are
+debounced, and results for the buffer and for each of its top-level
+definitions are kept in an in-memory cache, so re-analyzing after an edit
+only walks the definitions that changed.
+
+Supported messages: initialize, initialized, shutdown, exit,
+textDocument/didOpen, didChange (full sync), didSave and didClose.
+"""
+
+import json
+import sys
+import threading
+from pathlib import Path
+from typing import BinaryIO
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from econlint import __version__
+from econlint.cache import MemoryCache
+from econlint.facts import split_lines
+from econlint.runner import FAILED, Analyzer
+from econlint.warnings import Warning
+
+# Delay after the last change before a buffer is analyzed
+DEBOUNCE_SECONDS = 0.15
+
+# LSP constants
+TEXT_DOCUMENT_SYNC_FULL = 1
+SEVERITY_WARNING = 2
+METHOD_NOT_FOUND = -32601
+
+
+def uri_to_path(uri: str) -> Path:
+    """Convert a file:// URI to a path; other URIs are used verbatim."""
+    parsed = urlparse(uri)
+    if parsed.scheme != "file":
+        return Path(uri)
+    # url2pathname decodes percent escapes itself
+    return Path(url2pathname(parsed.path))
+
+
+def read_message(stream: BinaryIO) -> dict | None:
+    """Read one Content-Length framed message, or None at end of input."""
+    length = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"content-length":
+            length = int(value.strip())
+    if length is None:
+        return None
+    return json.loads(stream.read(length))
+
+
+def to_diagnostic(warning: Warning, lines: list[str]) -> dict:
+    """Build an LSP diagnostic spanning the warning's line."""
+    line = warning.line - 1
+    end = 0
+    if 0 <= line < len(lines):
+        # Positions count UTF-16 code units
+        end = len(lines[line].encode("utf-16-le")) // 2
+    return {
+        "range": {
+            "start": {"line": line, "character": 0},
+            "end": {"line": line, "character": end},
+        },
+        "severity": SEVERITY_WARNING,
+        "code": warning.code,
+        "source": "econlint",
+        "message": f"{warning.message}: {warning.pattern}",
+    }
+
+
+class LanguageServer:
+    """Minimal LSP server publishing econlint warnings as diagnostics."""
+
+    def __init__(
+        self,
+        rules: list,
+        output: BinaryIO,
+        debounce: float = DEBOUNCE_SECONDS,
+    ) -> None:
+        cache = MemoryCache([rule.code for rule in rules])
+        self.analyzer = Analyzer(rules, cache)
+        self.output = output
+        self.debounce = debounce
+        self.documents: dict[str, str] = {}
+        self._timers: dict[str, threading.Timer] = {}
+        self._lock = threading.Lock()
+        # Debounce timers fire on their own threads; analyze one at a time
+        self._analysis_lock = threading.Lock()
+        self._shutdown = False
+
+    def send(self, message: dict) -> None:
+        body = json.dumps(message).encode("utf-8")
+        with self._lock:
+            self.output.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+            self.output.flush()
+
+    def publish(self, uri: str, diagnostics: list[dict]) -> None:
+        self.send({
+            "jsonrpc": "2.0",
+            "method": "textDocument/publishDiagnostics",
+            "params": {"uri": uri, "diagnostics": diagnostics},
+        })
+
+    def analyze(self, uri: str) -> None:
+        """Analyze the current contents of a buffer and publish the result.
+
+        A buffer that does not parse keeps its previous diagnostics.
+        """
+        with self._analysis_lock:
+            with self._lock:
+                text = self.documents.get(uri)
+            if text is None:
+                return
+            result = self.analyzer.analyze_source(
+                uri_to_path(uri), text.encode("utf-8")
+            )
+            if result.status == FAILED:
+                return
+            # Split where the parser (and LSP clients) break lines
+            lines = [line.rstrip("\r\n") for line in split_lines(text)]
+            self.publish(uri, [to_diagnostic(w, lines) for w in result.warnings])
+
+    def schedule(self, uri: str) -> None:
+        """Analyze a buffer once edits have paused for the debounce delay."""
+        timer = threading.Timer(self.debounce, self.analyze, (uri,))
+        timer.daemon = True
+        with self._lock:
+            previous = self._timers.get(uri)
+            if previous is not None:
+                previous.cancel()
+            self._timers[uri] = timer
+        timer.start()
+
+    def handle(self, message: dict) -> bool:
+        """Handle one message. Returns False once the client asks to exit."""
+        method = message.get("method")
+        params = message.get("params") or {}
+        request_id = message.get("id")
+
+        if method == "initialize":
+            self.respond(request_id, {
+                "capabilities": {
+                    "textDocumentSync": {
+                        "openClose": True,
+                        "change": TEXT_DOCUMENT_SYNC_FULL,
+                        "save": True,
+                    },
+                },
+                "serverInfo": {"name": "econlint", "version": __version__},
+            })
+        elif method == "shutdown":
+            self._shutdown = True
+            self.respond(request_id, None)
+        elif method == "exit":
+            return False
+        elif method == "textDocument/didOpen":
+            document = params["textDocument"]
+            with self._lock:
+                self.documents[document["uri"]] = document["text"]
+            self.analyze(document["uri"])
+        elif method == "textDocument/didChange":
+            uri = params["textDocument"]["uri"]
+            changes = params.get("contentChanges") or []
+            if changes:
+                # Full sync: the last change holds the whole buffer
+                with self._lock:
+                    self.documents[uri] = changes[-1]["text"]
+                self.schedule(uri)
+        elif method == "textDocument/didSave":
+            uri = params["textDocument"]["uri"]
+            if "text" in params:
+                with self._lock:
+                    self.documents[uri] = params["text"]
+            self.schedule(uri)
+        elif method == "textDocument/didClose":
+            uri = params["textDocument"]["uri"]
+            with self._lock:
+                self.documents.pop(uri, None)
+                timer = self._timers.pop(uri, None)
+            if timer is not None:
+                timer.cancel()
+            self.publish(uri, [])
+        elif request_id is not None:
+            self.send({
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "error": {"code": METHOD_NOT_FOUND, "message": f"unsupported: {method}"},
+            })
+        return True
+
+    def respond(self, request_id: object, result: object) -> None:
+        self.send({"jsonrpc": "2.0", "id": request_id, "result": result})
+
+    def serve(self, input_stream: BinaryIO) -> int:
+        """Process messages until exit. Returns the process exit code."""
+        while True:
+            message = read_message(input_stream)
+            if message is None or not self.handle(message):
+                break
+        with self._lock:
+            for timer in self._timers.values():
+                timer.cancel()
+        return 0 if self._shutdown else 1
+
+
+def main(rules: list) -> int:
+    """Run the server on stdin/stdout."""
+    server = LanguageServer(rules, sys.stdout.buffer)
+    return server.serve(sys.stdin.buffer)
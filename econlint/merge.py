@@ -0,0 +1,51 @@
+"""Combining reports from several econlint runs (e.g. CI shards).
+
+Reads the output of `--json` or `--jsonl` runs and produces one report,
+ordered by file, line and code so the result does not depend on the order
+shards finished in.
+"""
+
+import json
+from collections.abc import Iterable
+from pathlib import Path
+
+from econlint.warnings import Warning
+
+
+def read_report(path: str) -> list[Warning]:
+    """Load the warnings of a --json or --jsonl report."""
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    if text.lstrip().startswith("["):
+        items = json.loads(text)
+    else:
+        items = [json.loads(line) for line in text.splitlines() if line.strip()]
+    try:
+        return [
+            Warning(
+                code=item["code"],
+                message=item["message"],
+                file=Path(item["file"]),
+                line=item["line"],
+                pattern=item["pattern"],
+                explanation=item["explanation"],
+            )
+            for item in items
+        ]
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"{path} is not an econlint JSON report") from e
+
+
+def merge_reports(paths: Iterable[str]) -> list[Warning]:
+    """Combine reports in a deterministic order.
+
+    Shards cover disjoint files, so nothing is deduplicated: identical
+    warnings (the same call twice on one line) are kept, as in a full run.
+    """
+    merged: list[Warning] = []
+    for path in paths:
+        merged.extend(read_report(path))
+    return sorted(
+        merged,
+        key=lambda w: (w.file.as_posix(), w.line, w.code, w.pattern),
+    )
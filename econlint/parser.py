@@ -5,22 +5,62 @@ import sys
 from pathlib import Path
 
 
-def parse_file(file_path: Path) -> tuple[ast.Module, str] | None:
-    """Parse a Python file into an AST.
+def read_source_bytes(file_path: Path) -> bytes | None:
+    """Read the raw bytes of a file.
 
-    Returns the AST and source code, or None if parsing fails.
-    Errors are printed to stderr.
+    Returns None if the file cannot be read. Errors are printed to stderr.
+    """
+    try:
+        return file_path.read_bytes()
+    except OSError as e:
+        print(f"Error reading {file_path}: {e}", file=sys.stderr)
+        return None
+
+
+def decode_source(data: bytes, file_path: Path) -> str | None:
+    """Decode file contents as UTF-8 with universal newlines.
+
+    Matches what Path.read_text() would return. Returns None if the bytes
+    are not valid UTF-8. Errors are printed to stderr.
     """
     try:
-        source = file_path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError) as e:
+        source = data.decode("utf-8")
+    except UnicodeDecodeError as e:
         print(f"Error reading {file_path}: {e}", file=sys.stderr)
         return None
+    if "\r" in source:
+        source = source.replace("\r\n", "\n").replace("\r", "\n")
+    return source
 
+
+def parse_source(source: str, file_path: Path) -> ast.Module | None:
+    """Parse Python source into an AST.
+
+    Returns None if parsing fails. Errors are printed to stderr.
+    """
     try:
-        tree = ast.parse(source, filename=str(file_path))
+        return ast.parse(source, filename=str(file_path))
     except SyntaxError as e:
         print(f"Syntax error in {file_path}: {e}", file=sys.stderr)
         return None
 
+
+def parse_file(file_path: Path) -> tuple[ast.Module, str] | None:
+    """Parse a Python file into an AST.
+
+    Returns the AST and source code, or None if parsing fails.
+    Errors are printed to stderr.
+    """
+    data = read_source_bytes(file_path)
+    if data is None:
+        return None
+
+    source = decode_source(data, file_path)
+    if source is None:
+        return None
+
+    tree = parse_source(source, file_path)
+    if tree is None:
+        return None
+
     return tree, source
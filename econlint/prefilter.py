@@ -0,0 +1,42 @@
+"""Byte-level prefilter that skips files no enabled rule can match.
+
+Each rule declares trigger tokens: byte strings at least one of which must
+appear in a file for the rule to possibly fire. Files containing none of
+the enabled rules' triggers are skipped before being decoded or parsed.
+"""
+
+from collections.abc import Iterable
+
+
+class Prefilter:
+    """Fast "could any rule match?" check over raw file contents."""
+
+    def __init__(self, tokens: Iterable[bytes]) -> None:
+        unique = set(tokens)
+        # A token containing another token is redundant: whenever it is
+        # present, the shorter one is too
+        self.tokens = tuple(sorted(
+            token for token in unique
+            if not any(other != token and other in token for other in unique)
+        ))
+
+    def could_match(self, data: bytes) -> bool:
+        """Check if the contents contain any trigger token."""
+        # bytes.__contains__ uses a fast substring search; for a handful of
+        # tokens this beats a compiled alternation regex
+        return any(token in data for token in self.tokens)
+
+
+def build_prefilter(rules: Iterable[type]) -> Prefilter | None:
+    """Build a prefilter for the enabled rules.
+
+    Returns None if some rule declares no triggers, since then no file
+    can be skipped.
+    """
+    tokens: list[bytes] = []
+    for rule in rules:
+        triggers = getattr(rule, "triggers", ())
+        if not triggers:
+            return None
+        tokens.extend(triggers)
+    return Prefilter(tokens)
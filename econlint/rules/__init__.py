@@ -1,11 +1,42 @@
-"""Rule implementations for econlint."""
+"""Rule implementations for econlint.
+
+Rules are registered by code and their modules are imported on first use,
+so disabled rules cost nothing at startup. `ALL_RULES` and the rule
+classes (`ECON001`, ...) are still available as attributes of this package.
+"""
+
+import importlib
 
 from econlint.rules.base import BaseRule
-from econlint.rules.econ001 import ECON001
-from econlint.rules.econ002 import ECON002
-from econlint.rules.econ003 import ECON003
-from econlint.rules.econ004 import ECON004
 
-ALL_RULES: list[type[BaseRule]] = [ECON001, ECON002, ECON003, ECON004]
+# Rule code -> module defining a class of the same name, in reporting order
+RULE_MODULES = {
+    "ECON001": "econlint.rules.econ001",
+    "ECON002": "econlint.rules.econ002",
+    "ECON003": "econlint.rules.econ003",
+    "ECON004": "econlint.rules.econ004",
+}
+
+RULE_CODES = tuple(RULE_MODULES)
+
+
+def load_rule(code: str) -> type[BaseRule]:
+    """Import and return the rule class for a code."""
+    return getattr(importlib.import_module(RULE_MODULES[code]), code)
+
+
+def load_rules(codes: list[str] | tuple[str, ...] = RULE_CODES) -> list[type[BaseRule]]:
+    """Import and return the rule classes for codes, in registry order."""
+    wanted = set(codes)
+    return [load_rule(code) for code in RULE_CODES if code in wanted]
+
+
+def __getattr__(name: str) -> object:
+    if name == "ALL_RULES":
+        return load_rules()
+    if name in RULE_MODULES:
+        return load_rule(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["BaseRule", "ECON001", "ECON002", "ECON003", "ECON004", "ALL_RULES"]
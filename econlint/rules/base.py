@@ -3,28 +3,61 @@
 import ast
 from pathlib import Path
 
+from econlint.engine import walk
+from econlint.facts import CallName, ModuleFacts, expr_name
 from econlint.warnings import Warning, EXPLANATIONS
 
 
-class BaseRule(ast.NodeVisitor):
+class BaseRule:
     """Base class for all econlint rules.
 
     Subclasses should:
     - Set `code` class attribute (e.g., "ECON001")
     - Set `message` class attribute (e.g., "External call inside loop")
-    - Override visit methods to detect patterns
+    - Set `triggers` to byte strings, one of which must appear in any file
+      the rule can fire on (leave empty to always run)
+    - Define `visit_<NodeType>` / `leave_<NodeType>` handlers to detect patterns
     - Call `self.add_warning()` when a pattern is found
+
+    Handlers are called by the single-pass engine (see econlint.engine) and
+    must not recurse into children themselves. Context shared between rules
+    (enclosing loops, call names, source lines, imports) is read from
+    `self.facts` rather than recomputed (see econlint.facts). Top-level
+    definitions may be analyzed separately (see econlint.incremental); a
+    rule whose results depend on code outside the definition must override
+    `module_context`.
     """
 
     code: str = ""
     message: str = ""
+    triggers: tuple[bytes, ...] = ()
 
-    def __init__(self, file_path: Path, source: str) -> None:
+    def __init__(
+        self,
+        file_path: Path,
+        source: str,
+        facts: ModuleFacts | None = None,
+    ) -> None:
         self.file_path = file_path
         self.source = source
-        self.source_lines = source.splitlines()
+        self.facts = facts if facts is not None else ModuleFacts(source)
         self.warnings: list[Warning] = []
 
+    @classmethod
+    def module_context(cls, source: str) -> str:
+        """Summarize the module-wide facts this rule's results depend on.
+
+        Results cached for a definition are only reused when this is
+        unchanged.
+        """
+        return ""
+
+    def visit(self, node: ast.AST) -> None:
+        """Run this rule on its own over a tree."""
+        if self.facts.tree is None and isinstance(node, ast.Module):
+            self.facts.tree = node
+        walk(node, [self], facts=self.facts)
+
     def add_warning(self, node: ast.AST, pattern: str) -> None:
         """Add a warning for the given AST node."""
         warning = Warning(
@@ -39,23 +72,21 @@ class BaseRule(ast.NodeVisitor):
 
     def get_call_name(self, node: ast.Call) -> str:
         """Extract a readable name from a Call node."""
-        return self._get_expr_name(node.func)
+        return self.facts.call_name(node)
+
+    def get_qualified_name(self, node: ast.Call) -> str:
+        """Call name resolved through the module's imports, e.g. "httpx.get"."""
+        return self.facts.qualified_name(node)
+
+    def get_call_parts(self, node: ast.Call) -> CallName:
+        """Call name split into receiver and method, e.g. ("s3", "get_object")."""
+        return self.facts.call_parts(node)
 
     def _get_expr_name(self, node: ast.expr) -> str:
-        """Recursively build a dotted name from an expression."""
-        if isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.Attribute):
-            value_name = self._get_expr_name(node.value)
-            if value_name:
-                return f"{value_name}.{node.attr}"
-            return node.attr
-        elif isinstance(node, ast.Call):
-            return self._get_expr_name(node.func) + "()"
-        elif isinstance(node, ast.Subscript):
-            return self._get_expr_name(node.value) + "[]"
-        return ""
+        """Build a dotted name from an expression."""
+        return expr_name(node)
 
-    def has_keyword(self, node: ast.Call, keyword: str) -> bool:
+    @staticmethod
+    def has_keyword(node: ast.Call, keyword: str) -> bool:
         """Check if a Call node has a specific keyword argument."""
         return any(kw.arg == keyword for kw in node.keywords)
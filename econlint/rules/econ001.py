@@ -2,8 +2,10 @@
 
 import ast
 import re
+from functools import lru_cache
 
 from econlint.rules.base import BaseRule
+from econlint.rules.matchers import CLASSIFICATION_CACHE_SIZE, WordIndex
 
 
 # HTTP methods that are actually network calls (not list methods like append)
@@ -15,6 +17,20 @@ HTTP_LIBRARY_PREFIXES = (
     "urllib3.", "asks.", "treq.", "grequests.",
 )
 
+# Network entry points of those libraries, matched on names resolved
+# through the module's imports. The prefixes above would also match the
+# libraries' constructors, exceptions and helpers (urllib.request.Request,
+# http.client.InvalidURL), which do no I/O.
+NETWORK_ENTRY_POINTS = frozenset({
+    *(
+        f"{library}.{method}"
+        for library in ("requests", "httpx", "grequests", "treq", "asks")
+        for method in HTTP_METHODS
+    ),
+    "httpx.stream", "aiohttp.request", "urllib3.request",
+    "urllib.request.urlopen", "urllib.request.urlretrieve",
+})
+
 # Explicit external call methods (full match)
 EXTERNAL_METHODS = {
     # Database
@@ -33,12 +49,46 @@ EXTERNAL_RECEIVER_SUFFIXES = re.compile(
     r"(_client|_api|_service|_connection|_session|Client|Api|Service)$"
 )
 
-# Methods that are typically external API calls when on a client-like receiver
-API_METHODS = {
-    "get", "post", "put", "patch", "delete", "head", "options",  # HTTP verbs
-    "request", "send", "fetch", "call", "invoke", "execute",  # Generic API methods
-    "query", "read", "write", "create", "update", "remove",  # CRUD operations
-}
+# The tables above, compiled
+HTTP_LIBRARY_INDEX = WordIndex(HTTP_LIBRARY_PREFIXES)
+EXTERNAL_METHOD_INDEX = WordIndex(EXTERNAL_METHODS)
+
+# Loops whose bodies are checked (async for is not)
+LOOP_TYPES = (
+    ast.For, ast.While, ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp,
+)
+
+
+def is_network_call_name(qualified: str) -> bool:
+    """Check if an import-resolved call name is a known network entry point."""
+    return qualified in NETWORK_ENTRY_POINTS
+
+
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def is_external_method_name(call_name: str) -> bool:
+    """Check if a dotted call name is a database, AWS or API client call."""
+    # Check explicit external methods
+    if EXTERNAL_METHOD_INDEX.suffix_of(call_name):
+        return True
+
+    # Any method call on a *_client, *_api, etc. receiver is suspicious
+    receiver = call_name.rpartition(".")[0]
+    return bool(receiver) and EXTERNAL_RECEIVER_SUFFIXES.search(receiver) is not None
+
+
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def is_external_call_name(call_name: str) -> bool:
+    """Check if a dotted call name looks like an external call."""
+    # Check HTTP library prefixes
+    if HTTP_LIBRARY_INDEX.prefix_of(call_name):
+        return True
+
+    # Special handling for 'requests' library (could conflict with list variable named 'requests')
+    method = call_name.rpartition(".")[2]
+    if call_name.startswith("requests.") and method.lower() in HTTP_METHODS:
+        return True
+
+    return is_external_method_name(call_name)
 
 
 class ECON001(BaseRule):
@@ -46,89 +96,36 @@ class ECON001(BaseRule):
 
     code = "ECON001"
     message = "External call inside loop"
-
-    def __init__(self, file_path, source):
-        super().__init__(file_path, source)
-        self.loop_depth = 0
+    # Every loop and comprehension needs one of these keywords
+    triggers = (b"for", b"while")
 
     def _is_external_call(self, node: ast.Call) -> tuple[bool, str]:
         """Check if a Call node represents an external call.
 
         Returns (is_external, call_name).
         """
-        call_name = self.get_call_name(node)
+        call = self.get_call_parts(node)
+        call_name = call.dotted
         if not call_name:
             return False, ""
-
-        # Check HTTP library prefixes
-        for prefix in HTTP_LIBRARY_PREFIXES:
-            if call_name.startswith(prefix):
-                return True, call_name
-
-        # Special handling for 'requests' library (could conflict with list variable named 'requests')
-        if call_name.startswith("requests."):
-            method = call_name.split(".")[-1].lower()
-            if method in HTTP_METHODS:
-                return True, call_name
-
-        # Check explicit external methods
-        for method in EXTERNAL_METHODS:
-            if call_name.endswith(method):
-                return True, call_name
-
-        # Check for client-like receivers with API methods
-        parts = call_name.rsplit(".", 1)
-        if len(parts) == 2:
-            receiver, method = parts
-            # Check if receiver looks like an API client
-            if EXTERNAL_RECEIVER_SUFFIXES.search(receiver):
-                # Any method call on a *_client, *_api, etc. is suspicious
-                return True, call_name
-            # Check if it's an API method on something that might be a client
-            if method.lower() in API_METHODS:
-                # Only flag if the receiver name suggests it's a client
-                if EXTERNAL_RECEIVER_SUFFIXES.search(receiver):
-                    return True, call_name
-
+        if is_external_call_name(call_name):
+            return True, call_name
+        # Imported under another name: import httpx as hx; from requests import get
+        if call.qualified != call_name and is_network_call_name(call.qualified):
+            return True, call_name
         return False, call_name
 
-    def _check_call(self, node: ast.Call) -> None:
+    def _in_loop(self) -> bool:
+        loops = self.facts.loops
+        if not loops:
+            return False
+        if isinstance(loops[-1], LOOP_TYPES):
+            return True
+        return any(isinstance(loop, LOOP_TYPES) for loop in loops)
+
+    def visit_Call(self, node: ast.Call) -> None:
         """Check a call node if we're inside a loop."""
-        if self.loop_depth > 0:
+        if self._in_loop():
             is_external, call_name = self._is_external_call(node)
             if is_external:
                 self.add_warning(node, f"{call_name}() called inside loop")
-
-    def visit_For(self, node: ast.For) -> None:
-        self.loop_depth += 1
-        self.generic_visit(node)
-        self.loop_depth -= 1
-
-    def visit_While(self, node: ast.While) -> None:
-        self.loop_depth += 1
-        self.generic_visit(node)
-        self.loop_depth -= 1
-
-    def visit_ListComp(self, node: ast.ListComp) -> None:
-        self.loop_depth += 1
-        self.generic_visit(node)
-        self.loop_depth -= 1
-
-    def visit_SetComp(self, node: ast.SetComp) -> None:
-        self.loop_depth += 1
-        self.generic_visit(node)
-        self.loop_depth -= 1
-
-    def visit_DictComp(self, node: ast.DictComp) -> None:
-        self.loop_depth += 1
-        self.generic_visit(node)
-        self.loop_depth -= 1
-
-    def visit_GeneratorExp(self, node: ast.GeneratorExp) -> None:
-        self.loop_depth += 1
-        self.generic_visit(node)
-        self.loop_depth -= 1
-
-    def visit_Call(self, node: ast.Call) -> None:
-        self._check_call(node)
-        self.generic_visit(node)
@@ -1,80 +1,131 @@
 """ECON002: Unbounded retries."""
 
 import ast
+from dataclasses import dataclass
 
 from econlint.rules.base import BaseRule
 
+# Identifiers that suggest an attempt counter or limit
+COUNTER_WORDS = ("attempt", "retry", "tries", "count", "max_", "limit")
+
+# Comparisons that can bound a loop (attempt < 5, elapsed >= timeout)
+ORDERING_OPS = (ast.Lt, ast.LtE, ast.Gt, ast.GtE)
+
+
+@dataclass(slots=True)
+class _RetryLoop:
+    """What has been seen so far inside a while True loop."""
+
+    node: ast.While
+    # Position in the warnings list when the loop was entered
+    index: int
+    has_try: bool = False
+    has_sleep: bool = False
+    has_counter: bool = False
+
 
 class ECON002(BaseRule):
     """Detect unbounded retry patterns."""
 
     code = "ECON002"
     message = "Unbounded retry pattern"
+    triggers = (b"retry", b"Retrying", b"while")
 
-    def __init__(self, file_path, source):
-        super().__init__(file_path, source)
-        self._in_while_true = False
-        self._while_true_node = None
+    def __init__(self, file_path, source, facts=None):
+        super().__init__(file_path, source, facts)
+        # Enclosing while True loops, innermost last. Facts are recorded on
+        # the innermost loop and merged into its parent when it is left, so
+        # nested loops are analyzed in a single pass.
+        self._loops: list[_RetryLoop] = []
 
     def visit_Call(self, node: ast.Call) -> None:
         """Check for tenacity/retrying decorators without limits."""
-        call_name = self.get_call_name(node)
+        call = self.get_call_parts(node)
+        call_name = call.dotted
 
-        # Check tenacity @retry without stop=
-        if call_name in ("retry", "tenacity.retry"):
+        if self._loops and "sleep" in call_name:
+            self._loops[-1].has_sleep = True
+
+        # Matched by origin, so `from retrying import retry` is told apart
+        # from tenacity's retry; unimported names match as spelled
+        qualified = call.qualified
+
+        # Check tenacity @retry / Retrying() without stop=
+        if qualified in ("retry", "tenacity.retry", "tenacity.Retrying"):
             if not self.has_keyword(node, "stop"):
                 self.add_warning(node, f"{call_name}() without stop= parameter")
 
         # Check retrying @retry without stop_max_attempt_number
-        if call_name in ("retrying.retry", "Retrying"):
+        if qualified in ("retrying.retry", "retrying.Retrying", "Retrying"):
             if not self.has_keyword(node, "stop_max_attempt_number"):
                 self.add_warning(
                     node, f"{call_name}() without stop_max_attempt_number"
                 )
 
-        self.generic_visit(node)
-
     def visit_While(self, node: ast.While) -> None:
-        """Check for while True with try/except and sleep (manual retry loop)."""
+        """Start tracking a while True loop (a possible manual retry loop)."""
         if self._is_while_true(node):
-            if self._has_try_except_sleep(node):
-                if not self._has_counter_check(node):
-                    self.add_warning(
-                        node, "while True retry loop without attempt limit"
-                    )
-
-        self.generic_visit(node)
+            self._loops.append(_RetryLoop(node, len(self.warnings)))
+
+    def leave_While(self, node: ast.While) -> None:
+        """Flag a while True loop with try/except and sleep but no counter."""
+        if not self._loops or self._loops[-1].node is not node:
+            return
+        loop = self._loops.pop()
+        if loop.has_try and loop.has_sleep and not loop.has_counter:
+            # Report in source order, ahead of warnings from the loop body
+            self.add_warning(node, "while True retry loop without attempt limit")
+            self.warnings.insert(loop.index, self.warnings.pop())
+
+        if self._loops:
+            parent = self._loops[-1]
+            parent.has_try = parent.has_try or loop.has_try
+            parent.has_sleep = parent.has_sleep or loop.has_sleep
+            parent.has_counter = parent.has_counter or loop.has_counter
 
     def _is_while_true(self, node: ast.While) -> bool:
         """Check if this is a while True loop."""
         if isinstance(node.test, ast.Constant):
             return node.test.value is True
-        if isinstance(node.test, ast.NameConstant):
-            return node.test.value is True
         return False
 
-    def _has_try_except_sleep(self, node: ast.While) -> bool:
-        """Check if the while loop contains try/except with sleep."""
-        has_try = False
-        has_sleep = False
-
-        for child in ast.walk(node):
-            if isinstance(child, ast.Try):
-                has_try = True
-            if isinstance(child, ast.Call):
-                call_name = self.get_call_name(child)
-                if "sleep" in call_name:
-                    has_sleep = True
-
-        return has_try and has_sleep
-
-    def _has_counter_check(self, node: ast.While) -> bool:
-        """Check if there's a counter/attempt tracking mechanism."""
-        source_segment = ast.get_source_segment(self.source, node) or ""
-        lower_source = source_segment.lower()
-
-        counter_patterns = [
-            "attempt", "retry", "tries", "count", "max_",
-            "limit", "< ", "<= ", "> ", ">= "
-        ]
-        return any(pattern in lower_source for pattern in counter_patterns)
+    def visit_Try(self, node: ast.AST) -> None:
+        if self._loops:
+            self._loops[-1].has_try = True
+
+    visit_TryStar = visit_Try
+
+    # Counter/attempt tracking, detected from the loop's structure
+
+    def _counter_seen(self) -> None:
+        self._loops[-1].has_counter = True
+
+    def _check_identifier(self, identifier: str | None) -> None:
+        if identifier and self._loops and not self._loops[-1].has_counter:
+            lower = identifier.lower()
+            if any(word in lower for word in COUNTER_WORDS):
+                self._counter_seen()
+
+    def visit_Name(self, node: ast.Name) -> None:
+        self._check_identifier(node.id)
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        self._check_identifier(node.attr)
+
+    def visit_keyword(self, node: ast.keyword) -> None:
+        self._check_identifier(node.arg)
+
+    def visit_Compare(self, node: ast.Compare) -> None:
+        if self._loops and any(isinstance(op, ORDERING_OPS) for op in node.ops):
+            self._counter_seen()
+
+    def visit_AugAssign(self, node: ast.AugAssign) -> None:
+        # attempts += 1, self.tries -= 1; not accumulators like buf += data
+        if (
+            self._loops
+            and isinstance(node.target, (ast.Name, ast.Attribute))
+            and isinstance(node.op, (ast.Add, ast.Sub))
+            and isinstance(node.value, ast.Constant)
+            and type(node.value.value) in (int, float)
+        ):
+            self._counter_seen()
@@ -2,8 +2,10 @@
 
 import ast
 import re
+from functools import lru_cache
 
 from econlint.rules.base import BaseRule
+from econlint.rules.matchers import CLASSIFICATION_CACHE_SIZE, WordIndex
 
 
 # Method names that suggest data fetching from external sources
@@ -45,114 +47,145 @@ SAFE_METHOD_SUFFIXES = {
 }
 
 
+# The tables above, compiled
+SAFE_RECEIVER_INDEX = WordIndex(SAFE_RECEIVERS)
+SAFE_METHOD_SUFFIX_INDEX = WordIndex(SAFE_METHOD_SUFFIXES)
+
+
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def is_likely_fetch_call(call_name: str) -> bool:
+    """Check if a dotted call name looks like a fetch from an external API."""
+    receiver, _, method = call_name.rpartition(".")
+    if not FETCH_METHODS.match(method):
+        return False
+
+    # Bare function call (no receiver)
+    if not receiver:
+        # Only flag if it looks like an API function
+        return EXTERNAL_RECEIVER_PATTERNS.search(call_name) is not None
+
+    # Check if method name ends with safe suffix (getpath, getlist, etc.)
+    if SAFE_METHOD_SUFFIX_INDEX.suffix_of(method.lower()):
+        return False
+
+    # Check the receiver path, last component included, for safe patterns
+    if SAFE_RECEIVER_INDEX.found_in(receiver.lower()):
+        return False
+
+    # Only flag receivers that really look like an external API; be
+    # conservative - don't flag unless we're confident
+    return EXTERNAL_RECEIVER_PATTERNS.search(receiver) is not None
+
+
 class ECON003(BaseRule):
     """Detect N+1 query patterns."""
 
     code = "ECON003"
     message = "N+1 query pattern"
-
-    def __init__(self, file_path, source):
-        super().__init__(file_path, source)
-        self.loop_vars: list[set[str]] = []
+    # Only for loops and list comprehensions are tracked
+    triggers = (b"for",)
+
+    def __init__(self, file_path, source, facts=None):
+        super().__init__(file_path, source, facts)
+        # Loop variables and names derived from them, with the number of
+        # enclosing loops that tainted each; lookups are O(1)
+        self.tainted: dict[str, int] = {}
+        # Names each enclosing loop tainted, innermost last
+        self._frames: list[list[str]] = []
+        # Loads of tainted names so far, and its value at each open assignment
+        self._reads = 0
+        self._assignments: list[int] = []
+
+    def _taint(self, names: list[str]) -> None:
+        frame = self._frames[-1]
+        for name in names:
+            self.tainted[name] = self.tainted.get(name, 0) + 1
+            frame.append(name)
+
+    def _enter_loop(self, names: list[str]) -> None:
+        self._frames.append([])
+        self._taint(names)
+
+    def _leave_loop(self, node: ast.AST) -> None:
+        for name in self._frames.pop():
+            count = self.tainted[name] - 1
+            if count:
+                self.tainted[name] = count
+            else:
+                del self.tainted[name]
 
     def visit_For(self, node: ast.For) -> None:
-        """Track for loop variables and check for N+1 patterns."""
-        loop_vars = self._extract_loop_vars(node.target)
-        self.loop_vars.append(loop_vars)
-        self.generic_visit(node)
-        self.loop_vars.pop()
+        """Track for loop variables."""
+        self._enter_loop(self._target_names(node.target))
 
     def visit_ListComp(self, node: ast.ListComp) -> None:
-        """Check list comprehensions for N+1 patterns."""
-        all_vars: set[str] = set()
+        """Track list comprehension variables."""
+        names: list[str] = []
         for generator in node.generators:
-            all_vars.update(self._extract_loop_vars(generator.target))
+            names.extend(self._target_names(generator.target))
+        self._enter_loop(names)
+
+    leave_For = leave_ListComp = _leave_loop
+
+    def visit_Name(self, node: ast.Name) -> None:
+        if node.id in self.tainted and node.ctx.__class__ is ast.Load:
+            self._reads += 1
+
+    def _enter_assignment(self, node: ast.AST) -> None:
+        self._assignments.append(self._reads)
 
-        self.loop_vars.append(all_vars)
-        self.generic_visit(node)
-        self.loop_vars.pop()
+    def _leave_assignment(self, node: ast.AST) -> None:
+        """Taint names assigned from a loop-derived value (uid = user.id)."""
+        if self._reads > self._assignments.pop() and self._frames:
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                self._taint(self._target_names(target))
+
+    visit_Assign = visit_AnnAssign = visit_AugAssign = visit_NamedExpr = _enter_assignment
+    leave_Assign = leave_AnnAssign = leave_AugAssign = leave_NamedExpr = _leave_assignment
 
     def visit_Call(self, node: ast.Call) -> None:
         """Check if a fetch-like call uses loop variables."""
-        if self.loop_vars:
+        if self.tainted:
             call_name = self.get_call_name(node)
-            method_name = call_name.split(".")[-1] if call_name else ""
 
-            if FETCH_METHODS.match(method_name):
+            if is_likely_fetch_call(call_name):
                 if self._uses_loop_var(node):
-                    if self._is_likely_external_call(call_name, method_name):
-                        self.add_warning(
-                            node,
-                            f"{call_name}() called with loop variable (N+1 pattern)"
-                        )
-
-        self.generic_visit(node)
-
-    def _is_likely_external_call(self, call_name: str, method_name: str) -> bool:
-        """Check if this call is likely an external API call."""
-        parts = call_name.rsplit(".", 1)
-
-        # Bare function call (no receiver)
-        if len(parts) < 2:
-            # Only flag if it looks like an API function
-            return EXTERNAL_RECEIVER_PATTERNS.search(call_name) is not None
-
-        receiver = parts[0]
-
-        # Check if method name ends with safe suffix (getpath, getlist, etc.)
-        method_lower = method_name.lower()
-        for suffix in SAFE_METHOD_SUFFIXES:
-            if method_lower.endswith(suffix):
-                return False
-
-        # Check if receiver is in safe list
-        receiver_base = receiver.split(".")[-1].lower()
-        if receiver_base in SAFE_RECEIVERS:
-            return False
-
-        # Check full receiver path for safe patterns
-        receiver_lower = receiver.lower()
-        for safe in SAFE_RECEIVERS:
-            if safe in receiver_lower:
-                return False
-
-        # Check if receiver looks like an external API
-        if EXTERNAL_RECEIVER_PATTERNS.search(receiver):
-            return True
-
-        # Default: only flag if it really looks like an API
-        # Be conservative - don't flag unless we're confident
-        return False
-
-    def _extract_loop_vars(self, target: ast.expr) -> set[str]:
-        """Extract variable names from a loop target."""
-        names: set[str] = set()
+                    self.add_warning(
+                        node,
+                        f"{call_name}() called with loop variable (N+1 pattern)"
+                    )
 
+    def _target_names(self, target: ast.expr) -> list[str]:
+        """Extract the variable names bound by an assignment or loop target."""
         if isinstance(target, ast.Name):
-            names.add(target.id)
-        elif isinstance(target, ast.Tuple):
+            return [target.id]
+        if isinstance(target, ast.Starred):
+            return self._target_names(target.value)
+        if isinstance(target, (ast.Tuple, ast.List)):
+            names: list[str] = []
             for elt in target.elts:
-                names.update(self._extract_loop_vars(elt))
-
-        return names
+                names.extend(self._target_names(elt))
+            return names
+        # Attributes and subscripts do not bind names
+        return []
 
     def _uses_loop_var(self, node: ast.Call) -> bool:
-        """Check if any argument to the call uses a loop variable."""
-        current_vars = set().union(*self.loop_vars) if self.loop_vars else set()
-
+        """Check if any argument to the call uses a loop-derived variable."""
         for arg in node.args:
-            if self._expr_uses_vars(arg, current_vars):
+            if self._expr_is_tainted(arg):
                 return True
 
         for kw in node.keywords:
-            if self._expr_uses_vars(kw.value, current_vars):
+            if self._expr_is_tainted(kw.value):
                 return True
 
         return False
 
-    def _expr_uses_vars(self, node: ast.expr, var_names: set[str]) -> bool:
-        """Check if an expression uses any of the given variable names."""
+    def _expr_is_tainted(self, node: ast.expr) -> bool:
+        """Check if an expression reads a loop-derived variable."""
+        tainted = self.tainted
         for child in ast.walk(node):
-            if isinstance(child, ast.Name) and child.id in var_names:
+            if isinstance(child, ast.Name) and child.id in tainted:
                 return True
         return False
@@ -1,12 +1,59 @@
 """ECON004: Unbounded fan-out."""
 
 import ast
-import re
 
+from econlint.facts import module_has_semaphore
 from econlint.rules.base import BaseRule
 
-# Pattern to detect Semaphore instantiation in code
-SEMAPHORE_PATTERN = re.compile(r"\bSemaphore\s*\(")
+
+def _has_starred_arg(node: ast.Call) -> bool:
+    """Check if a call has a starred argument (*args)."""
+    for arg in node.args:
+        if isinstance(arg, ast.Starred):
+            return True
+    return False
+
+
+def unbounded_fan_out(call_name: str, node: ast.Call, has_semaphore: bool) -> str | None:
+    """Describe the unbounded fan-out a call makes, if it makes one.
+
+    call_name is the call's qualified name; has_semaphore tells whether
+    the module creates a Semaphore.
+    """
+    # asyncio.gather with spread operator
+    if call_name in ("asyncio.gather", "asyncio.tasks.gather", "gather"):
+        if _has_starred_arg(node) and not has_semaphore:
+            return "asyncio.gather(*...) without Semaphore"
+
+    # ThreadPoolExecutor without max_workers
+    elif call_name in (
+        "ThreadPoolExecutor",
+        "concurrent.futures.ThreadPoolExecutor",
+        "concurrent.futures.thread.ThreadPoolExecutor",
+    ):
+        if not BaseRule.has_keyword(node, "max_workers"):
+            return "ThreadPoolExecutor() without max_workers"
+
+    # ProcessPoolExecutor without max_workers
+    elif call_name in (
+        "ProcessPoolExecutor",
+        "concurrent.futures.ProcessPoolExecutor",
+        "concurrent.futures.process.ProcessPoolExecutor",
+    ):
+        if not BaseRule.has_keyword(node, "max_workers"):
+            return "ProcessPoolExecutor() without max_workers"
+
+    # multiprocessing.Pool (or its thread-backed dummy twin) without processes limit
+    elif call_name in (
+        "Pool",
+        "multiprocessing.Pool",
+        "multiprocessing.pool.Pool",
+        "multiprocessing.dummy.Pool",
+    ):
+        if not node.args and not BaseRule.has_keyword(node, "processes"):
+            return "multiprocessing.Pool() without processes limit"
+
+    return None
 
 
 class ECON004(BaseRule):
@@ -14,61 +61,19 @@ class ECON004(BaseRule):
 
     code = "ECON004"
     message = "Unbounded fan-out"
+    triggers = (b"gather", b"Executor", b"Pool")
 
-    def __init__(self, file_path, source):
-        super().__init__(file_path, source)
-        self._has_semaphore = self._check_for_semaphore()
-
-    def _check_for_semaphore(self) -> bool:
-        """Check if the module uses a Semaphore."""
-        for line in self.source_lines:
-            # Skip comment-only lines
-            code_part = line.split("#")[0]
-            if SEMAPHORE_PATTERN.search(code_part):
-                return True
-        return False
+    @classmethod
+    def module_context(cls, source: str) -> str:
+        # gather(*...) is only flagged when the module has no Semaphore
+        return "semaphore" if module_has_semaphore(source) else ""
 
     def visit_Call(self, node: ast.Call) -> None:
         """Check for unbounded fan-out patterns."""
-        call_name = self.get_call_name(node)
-
-        # asyncio.gather with spread operator
-        if call_name in ("asyncio.gather", "gather"):
-            if self._has_starred_arg(node) and not self._has_semaphore:
-                self.add_warning(
-                    node,
-                    "asyncio.gather(*...) without Semaphore"
-                )
-
-        # ThreadPoolExecutor without max_workers
-        if call_name in ("ThreadPoolExecutor", "concurrent.futures.ThreadPoolExecutor"):
-            if not self.has_keyword(node, "max_workers"):
-                self.add_warning(
-                    node,
-                    "ThreadPoolExecutor() without max_workers"
-                )
-
-        # ProcessPoolExecutor without max_workers
-        if call_name in ("ProcessPoolExecutor", "concurrent.futures.ProcessPoolExecutor"):
-            if not self.has_keyword(node, "max_workers"):
-                self.add_warning(
-                    node,
-                    "ProcessPoolExecutor() without max_workers"
-                )
-
-        # multiprocessing.Pool without processes limit
-        if call_name in ("Pool", "multiprocessing.Pool"):
-            if not node.args and not self.has_keyword(node, "processes"):
-                self.add_warning(
-                    node,
-                    "multiprocessing.Pool() without processes limit"
-                )
-
-        self.generic_visit(node)
-
-    def _has_starred_arg(self, node: ast.Call) -> bool:
-        """Check if a call has a starred argument (*args)."""
-        for arg in node.args:
-            if isinstance(arg, ast.Starred):
-                return True
-        return False
+        # Matched by origin: `from asyncio import gather as g`, `import
+        # concurrent.futures as cf`; unimported names match as spelled
+        pattern = unbounded_fan_out(
+            self.get_qualified_name(node), node, self.facts.has_semaphore
+        )
+        if pattern is not None:
+            self.add_warning(node, pattern)
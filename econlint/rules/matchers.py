@@ -0,0 +1,100 @@
+"""Compiled indexes over the literal tables rules match call names against.
+
+A WordIndex answers "does any word start / end / occur in this text" in
+time proportional to the text, however many words the table holds: words
+are stored in a trie (prefixes), a trie of reversed words (suffixes), and
+an Aho-Corasick automaton built on the first trie (substrings).
+
+Indexes are built when a rule module is imported, from its module-level
+tables; extend the tables, not the indexes.
+"""
+
+from collections import deque
+from collections.abc import Iterable
+
+# Distinct call names whose classification each rule remembers
+CLASSIFICATION_CACHE_SIZE = 65_536
+
+
+class _Trie:
+    def __init__(self, words: Iterable[str]) -> None:
+        # Node 0 is the root; goto[node] maps a character to a child node
+        self.goto: list[dict[str, int]] = [{}]
+        self.terminal: list[bool] = [False]
+        for word in words:
+            node = 0
+            for char in word:
+                child = self.goto[node].get(char)
+                if child is None:
+                    child = len(self.goto)
+                    self.goto[node][char] = child
+                    self.goto.append({})
+                    self.terminal.append(False)
+                node = child
+            self.terminal[node] = True
+
+    def starts(self, chars: Iterable[str]) -> bool:
+        """Whether some word is a prefix of chars."""
+        goto, terminal = self.goto, self.terminal
+        node = 0
+        if terminal[node]:
+            return True
+        for char in chars:
+            node = goto[node].get(char, -1)
+            if node < 0:
+                return False
+            if terminal[node]:
+                return True
+        return False
+
+
+class WordIndex:
+    """A set of literal words compiled for prefix, suffix and substring tests."""
+
+    def __init__(self, words: Iterable[str]) -> None:
+        self.words = frozenset(words)
+        self._prefixes = _Trie(self.words)
+        self._suffixes = _Trie(word[::-1] for word in self.words)
+        self._fail, self._matches = self._link(self._prefixes)
+
+    @staticmethod
+    def _link(trie: _Trie) -> tuple[list[int], list[bool]]:
+        """Aho-Corasick failure links, breadth first from the root."""
+        fail = [0] * len(trie.goto)
+        matches = list(trie.terminal)
+        queue = deque(trie.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in trie.goto[node].items():
+                state = fail[node]
+                while state and char not in trie.goto[state]:
+                    state = fail[state]
+                fail[child] = trie.goto[state].get(char, 0)
+                matches[child] = matches[child] or matches[fail[child]]
+                queue.append(child)
+        return fail, matches
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.words
+
+    def prefix_of(self, text: str) -> bool:
+        """Whether text starts with one of the words."""
+        return self._prefixes.starts(text)
+
+    def suffix_of(self, text: str) -> bool:
+        """Whether text ends with one of the words."""
+        return self._suffixes.starts(reversed(text))
+
+    def found_in(self, text: str) -> bool:
+        """Whether one of the words occurs anywhere in text."""
+        goto, fail, matches = self._prefixes.goto, self._fail, self._matches
+        if matches[0]:
+            return True
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if matches[state]:
+                return True
+        return False
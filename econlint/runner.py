@@ -0,0 +1,401 @@
+"""Per-file analysis and parallel execution for econlint."""
+
+import heapq
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from itertools import chain, islice
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from econlint.cache import MemoryCache, ResultCache
+from econlint.engine import run_rules
+from econlint.facts import ModuleFacts
+from econlint.incremental import run_rules_incremental
+from econlint.parser import decode_source, parse_source, read_source_bytes
+from econlint.prefilter import build_prefilter
+from econlint.suppression import apply_suppressions, extract_suppressions
+from econlint.warnings import Warning
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from econlint.callgraph import ModuleSummary
+
+# Below this many files per worker, process startup costs more than it saves
+MIN_FILES_PER_WORKER = 8
+
+# Upper bound on files handed to a worker at once
+MAX_CHUNKSIZE = 32
+
+# Chunks submitted ahead of the one being waited on, per worker
+CHUNKS_IN_FLIGHT_PER_WORKER = 4
+
+# Number of slowest files listed by --stats
+SLOWEST_FILES = 10
+
+# A file to analyze: a path read from disk, or a path with its contents
+Task = Path | tuple[Path, bytes]
+
+
+# FileResult.status values
+ANALYZED = "analyzed"
+CACHED = "cached"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+
+@dataclass
+class FileResult:
+    """Outcome of analyzing a single file.
+
+    timings maps phase names (and "rule:<code>" for rule handlers) to
+    seconds; it and elapsed are only filled in when the Analyzer is timed.
+    summary is only filled in when the Analyzer summarizes modules.
+    """
+
+    path: Path
+    warnings: list[Warning]
+    status: str = ANALYZED
+    timings: dict[str, float] | None = None
+    elapsed: float = 0.0
+    summary: "ModuleSummary | None" = None
+
+
+class PhaseTimer:
+    """Accumulates the wall time between successive laps per phase."""
+
+    def __init__(self) -> None:
+        self.timings: dict[str, float] = {}
+        self._start = self._last = perf_counter()
+
+    def lap(self, phase: str) -> None:
+        """Attribute the time since the previous lap to phase."""
+        now = perf_counter()
+        self.timings[phase] = self.timings.get(phase, 0.0) + now - self._last
+        self._last = now
+
+    def elapsed(self) -> float:
+        return self._last - self._start
+
+
+class _NullTimer:
+    """Stand-in for PhaseTimer when timing is off."""
+
+    timings = None
+
+    def lap(self, phase: str) -> None:
+        pass
+
+
+NULL_TIMER = _NullTimer()
+
+
+@dataclass
+class RunStats:
+    """Counts of how files were handled during a run, and where time went.
+
+    Phase times measured in workers are summed across processes, so with
+    several jobs they can exceed the wall time of the run.
+    """
+
+    files: int = 0
+    analyzed: int = 0
+    cached: int = 0
+    skipped: int = 0
+    failed: int = 0
+    phases: dict[str, float] = field(default_factory=dict)
+    rules: dict[str, float] = field(default_factory=dict)
+    wall_time: float = 0.0
+    slowest_count: int = SLOWEST_FILES
+    _slowest: list[tuple[float, str]] = field(default_factory=list, repr=False)
+
+    def record(self, result: FileResult) -> None:
+        self.files += 1
+        if result.status == ANALYZED:
+            self.analyzed += 1
+        elif result.status == CACHED:
+            self.cached += 1
+        elif result.status == SKIPPED:
+            self.skipped += 1
+        else:
+            self.failed += 1
+
+        if result.timings is None:
+            return
+        for name, seconds in result.timings.items():
+            if name.startswith("rule:"):
+                code = name[5:]
+                self.rules[code] = self.rules.get(code, 0.0) + seconds
+            else:
+                self.add_time(name, seconds)
+        entry = (result.elapsed, str(result.path))
+        if len(self._slowest) < self.slowest_count:
+            heapq.heappush(self._slowest, entry)
+        else:
+            heapq.heappushpop(self._slowest, entry)
+
+    def add_time(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def slowest(self) -> list[tuple[float, str]]:
+        """The slowest files as (seconds, path), slowest first."""
+        return sorted(self._slowest, reverse=True)
+
+    def summary(self) -> str:
+        lines = [
+            f"econlint: {self.files} files: {self.analyzed} analyzed, "
+            f"{self.cached} cached, {self.skipped} skipped by prefilter, "
+            f"{self.failed} failed"
+        ]
+        if self.wall_time:
+            lines.append(f"wall time: {self.wall_time:.3f}s")
+        if self.phases:
+            lines.append("phases:")
+            for phase, seconds in self.phases.items():
+                lines.append(f"  {phase:<16} {seconds:9.3f}s")
+        if self.rules:
+            lines.append("rule handlers (part of walk):")
+            for code, seconds in sorted(self.rules.items()):
+                lines.append(f"  {code:<16} {seconds:9.3f}s")
+        if self._slowest:
+            lines.append("slowest files:")
+            for seconds, path in self.slowest():
+                lines.append(f"  {seconds:9.3f}s  {path}")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        return {
+            "files": self.files,
+            "analyzed": self.analyzed,
+            "cached": self.cached,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "wall_time": self.wall_time,
+            "phases": self.phases,
+            "rules": self.rules,
+            "slowest": [
+                {"file": path, "seconds": seconds} for seconds, path in self.slowest()
+            ],
+        }
+
+
+def default_jobs() -> int:
+    """Number of CPUs available to this process."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+class Analyzer:
+    """Runs the enabled rules over files.
+
+    Files that cannot match any enabled rule are skipped by the byte-level
+    prefilter, and files whose contents are in the cache are answered
+    without parsing. For changed files, results for unchanged top-level
+    definitions are reused from the cache. An Analyzer is picklable so it
+    can be handed to worker processes.
+
+    A timed Analyzer records per-phase and per-rule wall times in each
+    FileResult. A summarizing Analyzer also attaches each module's function
+    summaries (see econlint.callgraph); every parseable file gets one, even
+    if the prefilter rules out all warnings.
+    """
+
+    def __init__(
+        self,
+        rules: Sequence[type],
+        cache: ResultCache | MemoryCache | None = None,
+        use_prefilter: bool = True,
+        timed: bool = False,
+        summarize: bool = False,
+    ) -> None:
+        self.rules = list(rules)
+        self.cache = cache
+        self.prefilter = build_prefilter(self.rules) if use_prefilter else None
+        self.timed = timed
+        self.summarize = summarize
+
+    def analyze_source(
+        self,
+        file_path: Path,
+        data: bytes,
+        timer: PhaseTimer | _NullTimer = NULL_TIMER,
+    ) -> FileResult:
+        """Run all rules on a file's contents.
+
+        Inline suppressions are applied before the result is cached or
+        returned, so the source can be dropped as soon as this returns.
+        """
+        if self.prefilter is not None and not self.prefilter.could_match(data):
+            timer.lap("prefilter")
+            if not self.summarize:
+                return FileResult(file_path, [], SKIPPED)
+            # No warnings, but the module's functions still need summaries
+            warnings: list[Warning] | None = []
+            status = SKIPPED
+        else:
+            timer.lap("prefilter")
+            warnings = None
+            status = ANALYZED
+
+        cache = self.cache
+        key = summary_key = None
+        summary = None
+        if cache is not None:
+            if warnings is None:
+                key = cache.key(data)
+                warnings = cache.get(key, file_path)
+                if warnings is not None:
+                    status = CACHED
+            if self.summarize:
+                from econlint.callgraph import ModuleSummary, summary_key_prefix
+
+                summary_key = cache.key(summary_key_prefix(file_path) + data)
+                entry = cache.get_entry(summary_key)
+                if entry is not None:
+                    summary = ModuleSummary.from_dict(entry)
+            timer.lap("cache")
+            if warnings is not None and (summary is not None or not self.summarize):
+                return FileResult(file_path, warnings, status, summary=summary)
+
+        source = decode_source(data, file_path)
+        if source is None:
+            timer.lap("parse")
+            return FileResult(file_path, [], FAILED)
+
+        tree = parse_source(source, file_path)
+        timer.lap("parse")
+        if tree is None:
+            return FileResult(file_path, [], FAILED)
+
+        collector = None
+        if warnings is None:
+            facts = ModuleFacts(source, tree)
+            observers: list[object] = []
+            if self.summarize:
+                from econlint.callgraph import SummaryCollector
+
+                # Summaries are gathered in the rules' pass
+                collector = SummaryCollector(file_path, source, facts)
+                observers.append(collector)
+            if cache is not None:
+                warnings = run_rules_incremental(
+                    file_path, source, tree, self.rules, cache, timer.timings,
+                    facts, observers,
+                )
+            else:
+                warnings = run_rules(
+                    file_path, source, tree, self.rules, timer.timings, facts, observers
+                )
+            timer.lap("walk")
+            if warnings:
+                warnings = apply_suppressions(warnings, extract_suppressions(source))
+                timer.lap("suppression")
+            if cache is not None and key is not None:
+                cache.put(key, warnings)
+                timer.lap("cache")
+
+        if self.summarize:
+            from econlint.callgraph import summarize_module
+
+            summary = summarize_module(file_path, source, tree, cache, collector)
+            timer.lap("summary")
+            if cache is not None and summary_key is not None:
+                cache.put_entry(summary_key, summary.to_dict())
+                timer.lap("cache")
+        return FileResult(file_path, warnings, status, summary=summary)
+
+    def analyze_file(
+        self,
+        file_path: Path,
+        timer: PhaseTimer | _NullTimer = NULL_TIMER,
+    ) -> FileResult:
+        """Read a file from disk and run all rules on it."""
+        data = read_source_bytes(file_path)
+        timer.lap("read")
+        if data is None:
+            return FileResult(file_path, [], FAILED)
+        return self.analyze_source(file_path, data, timer)
+
+    def analyze(self, task: Task) -> FileResult:
+        """Analyze a path from disk or a (path, contents) pair."""
+        if not self.timed:
+            if isinstance(task, tuple):
+                return self.analyze_source(task[0], task[1])
+            return self.analyze_file(task)
+
+        timer = PhaseTimer()
+        if isinstance(task, tuple):
+            result = self.analyze_source(task[0], task[1], timer)
+        else:
+            result = self.analyze_file(task, timer)
+        result.timings = timer.timings
+        result.elapsed = timer.elapsed()
+        return result
+
+
+# Analyzer for the current worker process, set by _init_worker
+_worker_analyzer: Analyzer | None = None
+
+
+def _init_worker(analyzer: Analyzer) -> None:
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+
+def _analyze_chunk(tasks: list[Task]) -> list[FileResult]:
+    assert _worker_analyzer is not None
+    return [_worker_analyzer.analyze(task) for task in tasks]
+
+
+def _chunks(tasks: Iterator[Task], size: int) -> Iterator[list[Task]]:
+    while chunk := list(islice(tasks, size)):
+        yield chunk
+
+
+def iter_results(
+    tasks: Iterable[Task],
+    analyzer: Analyzer,
+    jobs: int = 1,
+) -> Iterator[FileResult]:
+    """Analyze files, yielding results in the order the files were given.
+
+    Tasks are paths to read from disk or (path, contents) pairs. With
+    jobs > 1, files are distributed across worker processes. Only a bounded
+    number of files is handed out ahead of the results being consumed, and
+    results are yielded in input order as soon as they are available, so
+    output is identical to a serial run.
+    """
+    tasks = iter(tasks)
+    lookahead = list(
+        islice(tasks, jobs * MAX_CHUNKSIZE * CHUNKS_IN_FLIGHT_PER_WORKER)
+    )
+    workers = min(jobs, len(lookahead) // MIN_FILES_PER_WORKER)
+    tasks = chain(lookahead, tasks)
+
+    if workers <= 1:
+        for task in tasks:
+            yield analyzer.analyze(task)
+        return
+
+    # Only needed (and only worth its import time) for parallel runs
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = max(1, min(
+        MAX_CHUNKSIZE, len(lookahead) // (workers * CHUNKS_IN_FLIGHT_PER_WORKER)
+    ))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(analyzer,),
+    ) as executor:
+        pending: deque["Future[list[FileResult]]"] = deque()
+        for chunk in _chunks(tasks, chunksize):
+            pending.append(executor.submit(_analyze_chunk, chunk))
+            if len(pending) >= workers * CHUNKS_IN_FLIGHT_PER_WORKER:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
@@ -0,0 +1,90 @@
+"""Deterministic partitioning of files across CI shards.
+
+Every shard of a CI matrix discovers the same files and keeps only its own
+part, so no path lists need to be passed around. Files are assigned either
+by a stable hash of their path, which streams and does not depend on the
+other files, or by size-balanced bins, which evens out the work but needs
+the whole file list first.
+"""
+
+import argparse
+import hashlib
+import heapq
+import os
+from collections.abc import Iterable, Iterator
+
+from econlint.runner import Task
+
+SHARD_STRATEGIES = ("hash", "size")
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """Argparse type for --shard: 'i/N' with 1 <= i <= N."""
+    index, sep, count = value.partition("/")
+    try:
+        if not sep:
+            raise ValueError
+        shard = int(index), int(count)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected i/N, got {value!r}")
+    if not 1 <= shard[0] <= shard[1]:
+        raise argparse.ArgumentTypeError(f"shard must be between 1/N and N/N: {value}")
+    return shard
+
+
+def _task_path(task: Task) -> str:
+    path = task[0] if isinstance(task, tuple) else task
+    return path.as_posix()
+
+
+def _task_size(task: Task) -> int:
+    if isinstance(task, tuple):
+        return len(task[1])
+    try:
+        return os.stat(task).st_size
+    except OSError:
+        return 0
+
+
+def shard_of(path: str, count: int) -> int:
+    """The 1-based shard a path belongs to under hash sharding."""
+    digest = hashlib.blake2b(path.encode("utf-8", "surrogateescape"), digest_size=8)
+    return int.from_bytes(digest.digest(), "big") % count + 1
+
+
+def shard_by_hash(tasks: Iterable[Task], index: int, count: int) -> Iterator[Task]:
+    """Keep the tasks whose path hashes to shard `index` of `count`."""
+    for task in tasks:
+        if shard_of(_task_path(task), count) == index:
+            yield task
+
+
+def shard_by_size(tasks: Iterable[Task], index: int, count: int) -> list[Task]:
+    """Keep shard `index` of `count` size-balanced bins.
+
+    Files are placed largest first into the currently smallest bin, ties
+    broken by path, so every shard computes the same assignment. The
+    shard's files keep their discovery order.
+    """
+    tasks = list(tasks)
+    order = sorted(
+        range(len(tasks)),
+        key=lambda i: (-_task_size(tasks[i]), _task_path(tasks[i])),
+    )
+    bins = [(0, shard) for shard in range(1, count + 1)]
+    mine: set[int] = set()
+    for i in order:
+        load, shard = heapq.heappop(bins)
+        if shard == index:
+            mine.add(i)
+        heapq.heappush(bins, (load + _task_size(tasks[i]), shard))
+    return [task for i, task in enumerate(tasks) if i in mine]
+
+
+def select_shard(
+    tasks: Iterable[Task], index: int, count: int, strategy: str = "hash"
+) -> Iterable[Task]:
+    """Keep only the tasks of one shard."""
+    if strategy == "size":
+        return shard_by_size(tasks, index, count)
+    return shard_by_hash(tasks, index, count)
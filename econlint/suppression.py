@@ -6,7 +6,9 @@ Supports inline ignore comments:
   # econlint: ignore=ECON001,ECON003
 """
 
+import io
 import re
+import tokenize
 from pathlib import Path
 
 from econlint.warnings import Warning
@@ -16,6 +18,58 @@ IGNORE_PATTERN = re.compile(
     r"#\s*econlint:\s*ignore(?:=([A-Z0-9,]+))?\s*$"
 )
 
+# Line number -> suppressed codes (empty for a bare ignore)
+Suppressions = dict[int, frozenset[str]]
+
+
+def _parse_codes(match: re.Match[str]) -> frozenset[str]:
+    codes_str = match.group(1)
+    if codes_str is None:
+        return frozenset()
+    return frozenset(code.strip() for code in codes_str.split(","))
+
+
+def extract_suppressions(source: str) -> Suppressions:
+    """Collect the ignore directives of a file, keyed by line.
+
+    Only real comments count: text that merely looks like a directive
+    inside a string literal is not a suppression. Files that never mention
+    econlint are not tokenized at all.
+    """
+    if "econlint" not in source:
+        return {}
+
+    suppressions: Suppressions = {}
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(source).readline):
+            if token.type == tokenize.COMMENT:
+                match = IGNORE_PATTERN.search(token.string)
+                if match:
+                    suppressions[token.start[0]] = _parse_codes(match)
+    except (tokenize.TokenError, SyntaxError):
+        # Not tokenizable; fall back to matching raw lines
+        suppressions = {}
+        for line_number, line in enumerate(source.splitlines(), start=1):
+            match = IGNORE_PATTERN.search(line)
+            if match:
+                suppressions[line_number] = _parse_codes(match)
+    return suppressions
+
+
+def apply_suppressions(
+    warnings: list[Warning], suppressions: Suppressions
+) -> list[Warning]:
+    """Drop warnings suppressed by a file's ignore directives."""
+    if not suppressions:
+        return warnings
+
+    kept = []
+    for warning in warnings:
+        codes = suppressions.get(warning.line)
+        if codes is None or (codes and warning.code not in codes):
+            kept.append(warning)
+    return kept
+
 
 def get_suppressed_codes(source_lines: list[str], line: int) -> set[str] | None:
     """Get suppressed codes for a specific line.
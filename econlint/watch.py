@@ -0,0 +1,180 @@
+"""Watch mode: re-lint files as they change.
+
+The watched paths are polled by comparing each file's mtime and size with
+the previous poll, so no platform file-notification API is needed. Only
+added or modified files are analyzed again; warnings for every file are
+kept in memory so each poll can report what was introduced or resolved.
+"""
+
+import json
+import os
+import sys
+import time
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TextIO
+
+from econlint.discovery import discover_paths
+from econlint.formatters.json_fmt import warning_to_dict
+from econlint.formatters.text import format_warning
+from econlint.runner import Analyzer, iter_results
+from econlint.warnings import Warning
+
+DEFAULT_POLL_INTERVAL = 0.5
+
+# (mtime in ns, size) of a file as of the last poll
+Signature = tuple[int, int]
+
+
+@dataclass
+class Delta:
+    """What changed between two polls."""
+
+    files: list[Path] = field(default_factory=list)
+    new: list[Warning] = field(default_factory=list)
+    resolved: list[Warning] = field(default_factory=list)
+
+
+def diff_warnings(
+    old: list[Warning], new: list[Warning]
+) -> tuple[list[Warning], list[Warning]]:
+    """Split a file's warnings into (introduced, resolved).
+
+    Warnings are matched by code and pattern, not line, so code that only
+    moved is not reported.
+    """
+    remaining = Counter((w.code, w.pattern) for w in old)
+    introduced = []
+    for warning in new:
+        key = (warning.code, warning.pattern)
+        if remaining[key]:
+            remaining[key] -= 1
+        else:
+            introduced.append(warning)
+
+    remaining = Counter((w.code, w.pattern) for w in new)
+    resolved = []
+    for warning in old:
+        key = (warning.code, warning.pattern)
+        if remaining[key]:
+            remaining[key] -= 1
+        else:
+            resolved.append(warning)
+    return introduced, resolved
+
+
+class Watcher:
+    """Tracks a set of paths and re-analyzes files that changed."""
+
+    def __init__(
+        self,
+        paths: Sequence[Path],
+        analyzer: Analyzer,
+        exclude_patterns: list[str] | None = None,
+        respect_ignore_files: bool = True,
+        listed_files: Sequence[str] = (),
+        jobs: int = 1,
+    ) -> None:
+        self.paths = list(paths)
+        self.analyzer = analyzer
+        self.exclude_patterns = exclude_patterns
+        self.respect_ignore_files = respect_ignore_files
+        self.listed_files = list(listed_files)
+        self.jobs = jobs
+        self.signatures: dict[Path, Signature] = {}
+        self.results: dict[Path, list[Warning]] = {}
+
+    def _scan(self) -> dict[Path, Signature]:
+        signatures: dict[Path, Signature] = {}
+        for path in discover_paths(
+            self.paths, self.exclude_patterns,
+            self.respect_ignore_files, self.listed_files,
+        ):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            signatures[path] = (stat.st_mtime_ns, stat.st_size)
+        return signatures
+
+    def warnings(self) -> list[Warning]:
+        """All current warnings, in file discovery order."""
+        return [w for path in self.signatures for w in self.results.get(path, [])]
+
+    def poll(self) -> Delta:
+        """Re-analyze added and modified files and forget deleted ones.
+
+        The first poll analyzes everything.
+        """
+        signatures = self._scan()
+        changed = [
+            path for path, signature in signatures.items()
+            if self.signatures.get(path) != signature
+        ]
+        deleted = [path for path in self.signatures if path not in signatures]
+
+        delta = Delta(files=changed + deleted)
+        for result in iter_results(changed, self.analyzer, self.jobs):
+            introduced, resolved = diff_warnings(
+                self.results.get(result.path, []), result.warnings
+            )
+            delta.new.extend(introduced)
+            delta.resolved.extend(resolved)
+            self.results[result.path] = result.warnings
+        for path in deleted:
+            delta.resolved.extend(self.results.pop(path, []))
+
+        self.signatures = signatures
+        return delta
+
+
+def write_delta(delta: Delta, stream: TextIO, jsonl: bool = False) -> None:
+    """Write the warnings introduced and resolved by a poll."""
+    if jsonl:
+        for event, warnings in (("new", delta.new), ("resolved", delta.resolved)):
+            for warning in warnings:
+                stream.write(json.dumps({"event": event, **warning_to_dict(warning)}) + "\n")
+    else:
+        for warning in delta.new:
+            stream.write(format_warning(warning) + "\n")
+        for warning in delta.resolved:
+            stream.write(
+                f"Resolved {warning.code} at {warning.file}:{warning.line}: "
+                f"{warning.pattern}\n"
+            )
+    stream.flush()
+
+
+def watch(
+    watcher: Watcher,
+    interval: float = DEFAULT_POLL_INTERVAL,
+    jsonl: bool = False,
+    stream: TextIO | None = None,
+) -> int:
+    """Report all warnings, then report changes until interrupted."""
+    stream = stream or sys.stdout
+    delta = watcher.poll()
+    write_delta(delta, stream, jsonl)
+    print(
+        f"econlint: watching {len(watcher.signatures)} files, "
+        f"{len(delta.new)} warnings",
+        file=sys.stderr,
+    )
+
+    try:
+        while True:
+            time.sleep(interval)
+            delta = watcher.poll()
+            if not delta.files:
+                continue
+            write_delta(delta, stream, jsonl)
+            print(
+                f"econlint: {len(delta.files)} files changed: "
+                f"{len(delta.new)} new, {len(delta.resolved)} resolved, "
+                f"{len(watcher.warnings())} total",
+                file=sys.stderr,
+            )
+    except KeyboardInterrupt:
+        return 0
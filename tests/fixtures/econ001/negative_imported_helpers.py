@@ -0,0 +1,13 @@
+# Should trigger ECON001 once - only urlopen does I/O; the rest are
+# constructors, helpers and exceptions imported from the same libraries
+from http import client
+from urllib.request import OpenerDirector, Request, pathname2url, urlopen
+
+
+def fetch_all(urls):
+    for url in urls:
+        request = Request(pathname2url(url))
+        OpenerDirector()
+        client.HTTPConnection("example.com")
+        client.InvalidURL(url)
+        urlopen(request).read().decode()
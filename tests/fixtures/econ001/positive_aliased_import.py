@@ -0,0 +1,9 @@
+# Should trigger ECON001 twice - HTTP calls through imported aliases
+import httpx as hx
+from requests import get
+
+
+def fetch_all(urls):
+    for url in urls:
+        hx.post(url)
+        get(url)
@@ -0,0 +1,13 @@
+# Should NOT trigger ECON002 - the loop gives up after a bounded number of failures
+import time
+
+def fetch(client):
+    failures = 0
+    while True:
+        try:
+            return client.fetch()
+        except TimeoutError:
+            failures += 1
+            if failures > 5:
+                raise
+            time.sleep(2 ** failures)
@@ -0,0 +1,16 @@
+# Should trigger ECON002 twice - nested while True retry loops, neither bounded
+import time
+
+def poll_forever(queue):
+    while True:
+        try:
+            job = queue.pop()
+        except IndexError:
+            # retry later
+            time.sleep(1)
+            continue
+        while True:
+            try:
+                return handle(job)
+            except ConnectionError:
+                time.sleep(5)
@@ -0,0 +1,21 @@
+# Should trigger ECON002 - tenacity Retrying without stop
+import tenacity
+from tenacity import Retrying
+
+
+def fetch_data():
+    for attempt in Retrying():
+        with attempt:
+            return requests.get("/data")
+
+
+def fetch_more():
+    for attempt in tenacity.Retrying(stop=tenacity.stop_after_attempt(3)):
+        with attempt:
+            return requests.get("/more")
+
+
+def fetch_rest():
+    for attempt in tenacity.Retrying():
+        with attempt:
+            return requests.get("/rest")
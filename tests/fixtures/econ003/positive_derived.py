@@ -0,0 +1,8 @@
+# Should trigger ECON003 - N+1 pattern through a value derived from the loop variable
+def load_owners(orders, api):
+    for order in orders:
+        owner_id = order.owner_id
+        key: str = f"user:{owner_id}"
+        print(api.get_user(key))
+    # Outside the loop the derived name is no longer tracked
+    return api.get_user(owner_id)
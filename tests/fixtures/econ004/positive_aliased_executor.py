@@ -0,0 +1,7 @@
+# Should trigger ECON004 - ThreadPoolExecutor imported under another name
+from concurrent.futures import ThreadPoolExecutor as TPE
+
+
+def run_all(jobs):
+    with TPE() as pool:
+        return list(pool.map(run, jobs))
@@ -0,0 +1,23 @@
+# Should trigger ECON004 - fan-out constructors imported from submodules
+import multiprocessing.pool
+from asyncio.tasks import gather
+from concurrent.futures.process import ProcessPoolExecutor
+from concurrent.futures.thread import ThreadPoolExecutor
+from multiprocessing.dummy import Pool as ThreadPool
+from multiprocessing.pool import Pool
+
+
+async def fetch_all(urls):
+    return await gather(*[fetch(url) for url in urls])
+
+
+def run_all(jobs):
+    with ThreadPoolExecutor() as threads, ProcessPoolExecutor() as processes:
+        threads.map(run, jobs)
+        processes.map(run, jobs)
+    with Pool() as pool:
+        pool.map(run, jobs)
+    with ThreadPool() as pool:
+        pool.map(run, jobs)
+    with multiprocessing.pool.Pool() as pool:
+        pool.map(run, jobs)
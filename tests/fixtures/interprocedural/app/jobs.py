@@ -0,0 +1,22 @@
+from app.services.users import display_name, sync_user
+
+from .services import users
+
+
+class Syncer:
+    def run(self, pending):
+        for user in pending:
+            self.push(user)
+
+    def push(self, user):
+        sync_user(user)
+
+
+def nightly(all_users, batches):
+    for user in all_users:
+        sync_user(user)
+        display_name(user)
+    for batch in batches:
+        users.fetch_all(batch)
+    for user in all_users:
+        sync_user(user)  # econlint: ignore=ECON001
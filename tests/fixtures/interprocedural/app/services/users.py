@@ -0,0 +1,19 @@
+import asyncio
+
+import requests
+
+
+def _post(payload):
+    return requests.post("https://api.example.com/users", json=payload)
+
+
+def sync_user(user):
+    return _post({"id": user.id})
+
+
+async def fetch_all(urls):
+    return await asyncio.gather(*[fetch(url) for url in urls])
+
+
+def display_name(user):
+    return user.name.title()
@@ -0,0 +1,40 @@
+"""Tests for the benchmark corpus generator and regression check."""
+
+import ast
+
+from benchmarks.corpus import CorpusSpec, corpus_lines, generate_corpus, generate_module
+from benchmarks.run import compare
+from econlint.cli import main
+
+
+def test_corpus_is_reproducible(tmp_path):
+    """The same spec always generates the same sources."""
+    spec = CorpusSpec(files=3, lines_per_file=60, trigger_density=0.3, seed=7)
+    assert generate_module(spec, 1) == generate_module(spec, 1)
+    assert generate_module(spec, 1) != generate_module(CorpusSpec(seed=8), 1)
+
+    root = generate_corpus(spec, tmp_path)
+    files = sorted(root.rglob("*.py"))
+    assert len(files) == 3
+    for path in files:
+        ast.parse(path.read_text())
+    assert corpus_lines(root) == sum(len(p.read_text().splitlines()) for p in files)
+
+
+def test_corpus_triggers_every_rule(tmp_path, capsys):
+    """A dense corpus exercises all four rules."""
+    spec = CorpusSpec(files=5, lines_per_file=200, trigger_density=0.5)
+    root = generate_corpus(spec, tmp_path)
+    assert main([str(root), "--no-cache"]) == 1
+    output = capsys.readouterr().out
+    for code in ("ECON001", "ECON002", "ECON003", "ECON004"):
+        assert f"{code}:" in output
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    baseline = {"cli": {"files_per_sec": 100.0, "peak_rss_mb": 20.0}}
+    assert compare({"cli": {"files_per_sec": 90.0, "peak_rss_mb": 21.0}}, baseline, 0.15) == []
+    slower = compare({"cli": {"files_per_sec": 80.0, "peak_rss_mb": 20.0}}, baseline, 0.15)
+    larger = compare({"cli": {"files_per_sec": 100.0, "peak_rss_mb": 30.0}}, baseline, 0.15)
+    assert len(slower) == 1 and "files/s" in slower[0]
+    assert len(larger) == 1 and "RSS" in larger[0]
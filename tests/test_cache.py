@@ -0,0 +1,73 @@
+"""Tests for the on-disk result cache."""
+
+import os
+import shutil
+from pathlib import Path
+
+from econlint import runner
+from econlint.cache import ResultCache
+from econlint.rules import ALL_RULES
+from econlint.runner import CACHED, Analyzer
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def make_cache(tmp_path: Path, **kwargs) -> ResultCache:
+    return ResultCache(tmp_path / "cache", [rule.code for rule in ALL_RULES], **kwargs)
+
+
+def test_unchanged_file_is_not_parsed(tmp_path, monkeypatch):
+    """A cache hit returns the stored warnings without calling the parser."""
+    analyzer = Analyzer(ALL_RULES, make_cache(tmp_path))
+    file_path = FIXTURES / "econ001" / "positive_for_loop.py"
+
+    first = analyzer.analyze_file(file_path)
+    assert first.status != CACHED
+
+    def fail_parse(source, path):
+        raise AssertionError("cached file was parsed")
+
+    monkeypatch.setattr(runner, "parse_source", fail_parse)
+    second = analyzer.analyze_file(file_path)
+    assert second.status == CACHED
+    assert second.warnings == first.warnings
+
+
+def test_key_depends_on_content_and_rules(tmp_path):
+    """Changing file contents or the enabled rules changes the key."""
+    cache = make_cache(tmp_path)
+    other_rules = ResultCache(tmp_path / "cache", ["ECON001"])
+
+    assert cache.key(b"x = 1\n") != cache.key(b"x = 2\n")
+    assert cache.key(b"x = 1\n") != other_rules.key(b"x = 1\n")
+
+
+def test_copied_file_hits_cache_under_new_path(tmp_path):
+    """Cached warnings are attributed to the path being analyzed."""
+    analyzer = Analyzer(ALL_RULES, make_cache(tmp_path))
+    original = FIXTURES / "econ004" / "positive_gather.py"
+    copy = tmp_path / "copy.py"
+    shutil.copy(original, copy)
+
+    analyzer.analyze_file(original)
+    result = analyzer.analyze_file(copy)
+    assert result.status == CACHED
+    assert [w.file for w in result.warnings] == [copy]
+
+
+def test_prune_evicts_least_recently_used(tmp_path):
+    """Pruning keeps the most recently used entries."""
+    cache = make_cache(tmp_path, max_entries=2)
+    keys = [cache.key(str(i).encode()) for i in range(3)]
+    for age, key in enumerate(keys):
+        cache.put(key, [])
+        entry_path = cache._entry_path(key)
+        os.utime(entry_path, (1000 + age, 1000 + age))
+
+    # Touch the oldest entry so the middle one becomes least recently used
+    assert cache.get(keys[0], Path("a.py")) == []
+
+    assert cache.prune() == 1
+    assert cache.get(keys[0], Path("a.py")) == []
+    assert cache.get(keys[1], Path("a.py")) is None
+    assert cache.get(keys[2], Path("a.py")) == []
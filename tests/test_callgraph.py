@@ -0,0 +1,188 @@
+"""Tests for interprocedural analysis through function summaries."""
+
+import ast
+import json
+import pickle
+from pathlib import Path
+
+import pytest
+
+from econlint import callgraph
+from econlint.cache import ResultCache
+from econlint.callgraph import interprocedural_warnings, module_name, summarize_module
+from econlint.cli import main
+from econlint.rules import ALL_RULES
+from econlint.runner import CACHED, Analyzer
+
+PROJECT = Path(__file__).parent / "fixtures" / "interprocedural"
+
+MODULE = '''\
+import requests
+
+
+def push(item):
+    requests.post("/items", json=item)
+
+
+def unrelated():
+    return 1
+
+
+def sync(items):
+    for item in items:
+        push(item)
+'''
+
+
+FAN_OUT_MODULE = '''\
+import asyncio
+
+
+async def fetch_all(urls):
+    return await asyncio.gather(*[fetch(url) for url in urls])
+
+
+async def crawl(batches):
+    for urls in batches:
+        await fetch_all(urls)
+
+
+def other():
+    return None
+'''
+
+
+def make_cache(tmp_path: Path) -> ResultCache:
+    return ResultCache(tmp_path / "cache", [rule.code for rule in ALL_RULES])
+
+
+def test_module_name():
+    assert module_name(Path("app/services/users.py")) == ("app.services.users", "app.services")
+    assert module_name(Path("./app/__init__.py")) == ("app", "app")
+    assert module_name(Path("/src/app/jobs.py")) == ("src.app.jobs", "src.app")
+
+
+def test_loop_calls_reach_calls_in_other_modules(capsys):
+    main([str(PROJECT), "--no-cache", "--jsonl", "--interprocedural"])
+    found = [
+        (Path(w["file"]).name, w["line"], w["code"], w["pattern"])
+        for w in map(json.loads, capsys.readouterr().out.splitlines())
+    ]
+    assert found == [
+        ("jobs.py", 9, "ECON001",
+         "self.push() called inside loop makes an external call (requests.post())"),
+        ("jobs.py", 17, "ECON001",
+         "sync_user() called inside loop makes an external call (requests.post())"),
+        ("jobs.py", 20, "ECON004",
+         "users.fetch_all() called inside loop fans out (asyncio.gather(*...) without Semaphore)"),
+        ("users.py", 15, "ECON004", "asyncio.gather(*...) without Semaphore"),
+    ]
+
+
+def test_needs_the_whole_project(capsys):
+    for option in ("--shard=1/2", "--watch", "--daemon"):
+        with pytest.raises(SystemExit):
+            main([str(PROJECT), "--interprocedural", option])
+    assert "cannot be combined" in capsys.readouterr().err
+
+
+def test_only_enabled_rules_are_propagated(capsys):
+    main([str(PROJECT), "--no-cache", "--jsonl", "--interprocedural", "--disable=ECON004"])
+    assert {line.count("ECON001") for line in capsys.readouterr().out.splitlines()} == {1}
+
+
+def test_summaries_are_cached_with_results(tmp_path, monkeypatch):
+    """A rescan of unchanged files answers summaries from the cache too."""
+    analyzer = Analyzer(ALL_RULES, make_cache(tmp_path), summarize=True)
+    files = sorted(PROJECT.rglob("*.py"))
+    first = [analyzer.analyze_file(path) for path in files]
+
+    def fail_parse(source, path):
+        raise AssertionError("cached file was parsed")
+
+    monkeypatch.setattr("econlint.runner.parse_source", fail_parse)
+    second = [analyzer.analyze_file(path) for path in files]
+    assert [r.summary for r in second] == [r.summary for r in first]
+    # Summaries travel back from worker processes
+    assert [pickle.loads(pickle.dumps(r.summary)) for r in second] == [r.summary for r in first]
+    assert {r.status for r in second} <= {CACHED, "skipped"}
+    assert interprocedural_warnings((r.path, r.summary) for r in second)
+
+
+def test_only_changed_definitions_are_summarized(tmp_path, monkeypatch):
+    cache = make_cache(tmp_path)
+    path = tmp_path / "mod.py"
+    edited = MODULE.replace("return 1", "return 2")
+    # Lines of reused summaries follow their definition
+    shifted = "TIMEOUT = 5\n" + edited
+    expected = [summarize_module(path, source, ast.parse(source)) for source in (edited, shifted)]
+    summarize_module(path, MODULE, ast.parse(MODULE), cache)
+
+    walked: list[list[str]] = []
+    collect = callgraph._collect
+
+    def recording_collect(file_path, source, tree, facts):
+        walked.append([getattr(node, "name", "") for node in tree.body])
+        return collect(file_path, source, tree, facts)
+
+    monkeypatch.setattr(callgraph, "_collect", recording_collect)
+    summaries = [summarize_module(path, source, ast.parse(source), cache) for source in (edited, shifted)]
+    assert summaries == expected
+    # Statements outside definitions (the import) are always walked
+    assert walked == [["", "unrelated"], ["", ""]]
+
+    warnings = interprocedural_warnings([(path, summaries[1])])
+    assert [(w.line, w.pattern) for w in warnings[path]] == [
+        (15, "push() called inside loop makes an external call (requests.post())"),
+    ]
+
+
+def test_cached_summaries_follow_module_context(tmp_path):
+    """A Semaphore added anywhere in the module changes every definition's summary."""
+    cache = make_cache(tmp_path)
+    path = tmp_path / "mod.py"
+    bounded = FAN_OUT_MODULE.replace("return None", "return asyncio.Semaphore(10)")
+    edited = "X = 0\n" + FAN_OUT_MODULE
+    for source in (FAN_OUT_MODULE, bounded, edited):
+        warm = summarize_module(path, source, ast.parse(source), cache)
+        assert warm == summarize_module(path, source, ast.parse(source))
+
+    warnings = interprocedural_warnings([(path, warm)])
+    assert [(w.line, w.pattern) for w in warnings[path]] == [
+        (11, "fetch_all() called inside loop fans out (asyncio.gather(*...) without Semaphore)"),
+    ]
+
+
+def test_library_helpers_are_not_external_calls(tmp_path):
+    """Only network entry points make a function external, not pure helpers or exceptions."""
+    source = '''\
+import http.client
+import urllib.request
+from urllib.request import urlopen
+
+
+def to_url(path):
+    return "file:" + urllib.request.pathname2url(path)
+
+
+def check(url):
+    if not url:
+        raise http.client.InvalidURL(url)
+
+
+def load(url):
+    return urlopen(url).read()
+
+
+def run(paths):
+    for path in paths:
+        check(to_url(path))
+        load(path)
+'''
+    path = tmp_path / "mod.py"
+    summary = summarize_module(path, source, ast.parse(source))
+    assert [f.external for f in summary.functions] == ["", "", "urllib.request.urlopen", ""]
+    warnings = interprocedural_warnings([(path, summary)])
+    assert [(w.line, w.pattern) for w in warnings[path]] == [
+        (22, "load() called inside loop makes an external call (urllib.request.urlopen())"),
+    ]
@@ -0,0 +1,130 @@
+"""Tests for the scan daemon."""
+
+import os
+import shutil
+import socket
+import threading
+from pathlib import Path
+
+import pytest
+
+from econlint import daemon, runner
+from econlint.cli import main
+from econlint.daemon import DaemonError, DaemonServer, ScanService, send_request
+from econlint.rules import ALL_RULES
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def scan_request(path: Path, **options) -> dict:
+    return {"cwd": str(Path.cwd()), "paths": [str(path)], **options}
+
+
+def test_daemon_output_matches_local_scan(capsys):
+    service = ScanService(ALL_RULES)
+    for options in ({}, {"format": "json", "disable": "ECON001"}):
+        response = service.scan(scan_request(FIXTURES, **options))
+
+        argv = [str(FIXTURES), "--no-cache", "-j1"]
+        if options:
+            argv += ["--json", "--disable", "ECON001"]
+        status = main(argv)
+        assert response["output"] == capsys.readouterr().out
+        assert response["status"] == status
+
+
+def test_unchanged_files_are_not_reanalyzed(tmp_path, monkeypatch):
+    path = tmp_path / "a.py"
+    path.write_text("import requests\n\nfor url in urls:\n    requests.get(url)\n")
+    service = ScanService(ALL_RULES)
+    first = service.scan(scan_request(tmp_path))
+
+    def fail_analyze(self, task):
+        raise AssertionError("unchanged file was analyzed")
+
+    monkeypatch.setattr(runner.Analyzer, "analyze", fail_analyze)
+    assert service.scan(scan_request(tmp_path)) == first
+
+
+def test_parallel_scan_fills_the_daemon_cache(tmp_path, monkeypatch):
+    """Results from worker processes are cached in the daemon itself."""
+    project = tmp_path / "project"
+    shutil.copytree(FIXTURES, project)
+    monkeypatch.setattr(daemon, "default_jobs", lambda: 2)
+    service = ScanService(ALL_RULES)
+    first = service.scan(scan_request(project))
+    assert service.cache._entries
+
+    # Rewriting every file unchanged is answered from the cache
+    for path in project.rglob("*.py"):
+        os.utime(path, ns=(0, 0))
+
+    def fail_parse(source, path):
+        raise AssertionError("unchanged contents were parsed")
+
+    monkeypatch.setattr(runner, "parse_source", fail_parse)
+    assert service.scan(scan_request(project)) == first
+
+
+def test_deleted_files_are_forgotten(tmp_path):
+    for name in ("a.py", "b.py"):
+        (tmp_path / name).write_text("for url in urls:\n    requests.get(url)\n")
+    service = ScanService(ALL_RULES)
+    service.scan(scan_request(tmp_path))
+    assert set(service.results) == {tmp_path / "a.py", tmp_path / "b.py"}
+
+    (tmp_path / "b.py").unlink()
+    service.scan(scan_request(tmp_path))
+    assert set(service.results) == {tmp_path / "a.py"}
+
+
+def test_requests_over_the_socket(tmp_path):
+    socket_path = tmp_path / "d.sock"
+    server = DaemonServer(socket_path, ScanService(ALL_RULES))
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05})
+    thread.start()
+    try:
+        response = send_request(scan_request(FIXTURES / "econ004"), socket_path)
+        assert "ECON004" in response["output"]
+        assert response["status"] == 1
+
+        send_request({"command": "stop"}, socket_path)
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_stale_socket_falls_back_to_a_local_scan(tmp_path, capsys):
+    """A socket file left by a killed daemon means no daemon, not an error."""
+    socket_path = tmp_path / "stale.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        listener.bind(str(socket_path))
+    assert socket_path.exists()
+
+    path = str(FIXTURES / "econ004")
+    local_status = main([path, "--jsonl"])
+    local = capsys.readouterr().out
+    status = main([path, "--jsonl", "--daemon", f"--socket={socket_path}"])
+    captured = capsys.readouterr()
+    assert (status, captured.out) == (local_status, local)
+    assert "no daemon running" in captured.err
+
+
+def test_socket_directory_must_be_private(tmp_path, monkeypatch):
+    """A socket directory someone else could have created is refused."""
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr(daemon.tempfile, "gettempdir", lambda: str(tmp_path))
+    directory = tmp_path / f"econlint-{os.getuid()}"
+    assert daemon.default_socket_path() == directory / "daemon.sock"
+
+    directory.chmod(0o755)
+    with pytest.raises(DaemonError, match="not a private directory"):
+        daemon.default_socket_path()
+    assert main([str(FIXTURES / "econ004"), "--daemon"]) == 2
+
+    directory.rmdir()
+    directory.symlink_to(tmp_path)
+    with pytest.raises(DaemonError, match="not a private directory"):
+        daemon.default_socket_path()
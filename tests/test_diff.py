@@ -0,0 +1,54 @@
+"""Tests for changed-line detection."""
+
+from pathlib import Path
+
+from econlint.diff import ChangedLines
+
+DIFF = b"""\
+diff --git a/app/sync.py b/app/sync.py
+index 37cb153..051a1f0 100644
+--- a/app/sync.py
++++ b/app/sync.py
+@@ -20 +20 @@ def sync(users):
+-        requests.get(u)
++        requests.get(u, timeout=5)
+@@ -30,2 +29,0 @@ def sync(users):
+-    a()
+-    b()
+@@ -71,0 +72,3 @@ def poll():
++x = 1
++y = 2
++z = 3
+diff --git a/old.py b/old.py
+deleted file mode 100644
+--- a/old.py
++++ /dev/null
+@@ -1 +0,0 @@
+-gone()
+diff --git "a/with\\ttab.py" "b/with\\ttab.py"
+--- "a/with\\ttab.py"
++++ "b/with\\ttab.py"
+@@ -1 +1 @@
+-a
++b
+"""
+
+
+def test_parse_collects_added_line_ranges():
+    """Only lines on the new side of hunks count as changed."""
+    changed = ChangedLines.parse(DIFF)
+    path = Path("app/sync.py")
+
+    assert changed.files == [path, Path("with\ttab.py")]
+    assert changed.contains(path, 20)
+    assert not changed.contains(path, 21)
+    assert not changed.contains(path, 29)
+    assert [changed.contains(path, line) for line in (71, 72, 73, 74, 75)] == [
+        False, True, True, True, False
+    ]
+
+
+def test_deleted_and_unknown_files_have_no_changed_lines():
+    changed = ChangedLines.parse(DIFF)
+    assert not changed.contains(Path("old.py"), 1)
+    assert not changed.contains(Path("other.py"), 1)
@@ -0,0 +1,97 @@
+"""Tests for file discovery."""
+
+import os
+from pathlib import Path
+
+from econlint import discovery
+from econlint.discovery import discover_files
+
+
+def make_tree(root: Path, files: list[str]) -> None:
+    for name in files:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("", encoding="utf-8")
+
+
+def relative(root: Path, paths) -> list[str]:
+    return [path.relative_to(root).as_posix() for path in paths]
+
+
+def test_excluded_directories_are_not_entered(tmp_path, monkeypatch):
+    """--exclude prunes a directory instead of filtering its files afterwards."""
+    make_tree(tmp_path, ["app.py", "venv/lib/site.py", "pkg/mod.py"])
+    scanned: list[str] = []
+    real_scandir = os.scandir
+
+    def recording_scandir(path):
+        scanned.append(Path(path).name)
+        return real_scandir(path)
+
+    monkeypatch.setattr(discovery.os, "scandir", recording_scandir)
+    found = relative(tmp_path, discover_files(tmp_path, ["venv"]))
+
+    assert found == ["app.py", "pkg/mod.py"]
+    assert "venv" not in scanned
+
+
+def test_full_path_patterns_still_apply(tmp_path):
+    """Patterns matching the whole path behave as before."""
+    make_tree(tmp_path, ["a/tests/test_x.py", "a/x.py"])
+    found = relative(tmp_path, discover_files(tmp_path, ["**/tests/**"]))
+    assert found == ["a/x.py"]
+
+
+def test_gitignore_is_honoured(tmp_path):
+    """Paths listed in .gitignore files are skipped by default."""
+    make_tree(tmp_path, [
+        "keep.py", "build/gen.py", "pkg/skip_me.py", "pkg/keep_me.py",
+        "pkg/sub/local.py", "pkg/sub/other.py",
+    ])
+    (tmp_path / ".gitignore").write_text("build/\nskip_*.py\n", encoding="utf-8")
+    (tmp_path / "pkg" / "sub" / ".ignore").write_text("/local.py\n", encoding="utf-8")
+
+    found = relative(tmp_path, discover_files(tmp_path))
+    assert found == ["keep.py", "pkg/keep_me.py", "pkg/sub/other.py"]
+
+    everything = relative(tmp_path, discover_files(tmp_path, respect_ignore_files=False))
+    assert len(everything) == 6
+
+
+def test_gitignore_negation(tmp_path):
+    """A later '!' pattern re-includes a file."""
+    make_tree(tmp_path, ["gen_a.py", "gen_keep.py"])
+    (tmp_path / ".gitignore").write_text("gen_*.py\n!gen_keep.py\n", encoding="utf-8")
+    assert relative(tmp_path, discover_files(tmp_path)) == ["gen_keep.py"]
+
+
+def test_parent_gitignore_applies_to_subdirectory(tmp_path):
+    """Ignore files between the repository root and the target are honoured."""
+    make_tree(tmp_path, ["src/pkg/a.py", "src/pkg/generated/b.py"])
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".gitignore").write_text("src/pkg/generated/\n", encoding="utf-8")
+
+    found = relative(tmp_path, discover_files(tmp_path / "src"))
+    assert found == ["src/pkg/a.py"]
+
+
+def test_read_file_list_accepts_nul_and_newline_separators(tmp_path):
+    """Both `git ls-files -z` and plain newline lists are understood."""
+    nul_list = tmp_path / "nul.txt"
+    nul_list.write_bytes(b"a.py\0dir/with space.py\0")
+    newline_list = tmp_path / "lines.txt"
+    newline_list.write_bytes(b"a.py\r\nb.py\n\n")
+
+    assert discovery.read_file_list(str(nul_list)) == ["a.py", "dir/with space.py"]
+    assert discovery.read_file_list(str(newline_list)) == ["a.py", "b.py"]
+
+
+def test_discover_paths_merges_and_deduplicates(tmp_path):
+    """Several paths and a file list yield each Python file once."""
+    make_tree(tmp_path, ["a/x.py", "b/y.py"])
+    listed = [str(tmp_path / "a" / "x.py"), str(tmp_path / "notes.txt"), "missing.py"]
+
+    found = list(discovery.discover_paths(
+        [tmp_path / "a", tmp_path / "b", tmp_path / "a"], listed_files=listed
+    ))
+    assert found == [tmp_path / "a" / "x.py", tmp_path / "b" / "y.py", Path("missing.py")]
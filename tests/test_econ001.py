@@ -43,6 +43,23 @@ def test_positive_while_loop():
     assert warnings[0].code == "ECON001"
 
 
+def test_positive_aliased_import():
+    """Calls are matched through import aliases; the pattern shows the spelled name."""
+    warnings, _ = run_rule(FIXTURES / "positive_aliased_import.py")
+    assert [w.pattern for w in warnings] == [
+        "hx.post() called inside loop",
+        "get() called inside loop",
+    ]
+
+
+def test_negative_imported_helpers():
+    """Imported names are flagged only if they are network entry points."""
+    warnings, _ = run_rule(FIXTURES / "negative_imported_helpers.py")
+    assert [(w.line, w.pattern) for w in warnings] == [
+        (13, "urlopen() called inside loop"),
+    ]
+
+
 def test_negative_batched():
     """Batched call outside loop should not trigger."""
     warnings, _ = run_rule(FIXTURES / "negative_batched.py")
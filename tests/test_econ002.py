@@ -28,6 +28,15 @@ def test_positive_tenacity():
     assert "retry" in warnings[0].pattern.lower()
 
 
+def test_positive_tenacity_retrying():
+    """Tenacity's Retrying iterator without stop should trigger."""
+    warnings, _ = run_rule(FIXTURES / "positive_tenacity_retrying.py")
+    assert [(w.line, w.pattern) for w in warnings] == [
+        (7, "Retrying() without stop= parameter"),
+        (19, "tenacity.Retrying() without stop= parameter"),
+    ]
+
+
 def test_positive_while_true():
     """While True retry loop without counter should trigger."""
     warnings, _ = run_rule(FIXTURES / "positive_while_true.py")
@@ -35,6 +44,18 @@ def test_positive_while_true():
     assert warnings[0].code == "ECON002"
 
 
+def test_positive_nested_while():
+    """Nested retry loops are each reported, in source order; comments are not counters."""
+    warnings, _ = run_rule(FIXTURES / "positive_nested_while.py")
+    assert [w.line for w in warnings] == [5, 12]
+
+
+def test_negative_counter():
+    """A counter is detected from comparisons and increments, whatever its name."""
+    warnings, _ = run_rule(FIXTURES / "negative_counter.py")
+    assert len(warnings) == 0
+
+
 def test_negative_bounded():
     """Retry with stop parameter should not trigger."""
     warnings, _ = run_rule(FIXTURES / "negative_bounded.py")
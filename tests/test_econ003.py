@@ -36,6 +36,14 @@ def test_positive_list_comp():
     assert "fetch_profile" in warnings[0].pattern
 
 
+def test_positive_derived():
+    """Values derived from the loop variable are tracked until the loop ends."""
+    warnings, _ = run_rule(FIXTURES / "positive_derived.py")
+    assert len(warnings) == 1
+    assert warnings[0].line == 6
+    assert "get_user" in warnings[0].pattern
+
+
 def test_negative_batch():
     """Batch fetch should not trigger."""
     warnings, _ = run_rule(FIXTURES / "negative_batch.py")
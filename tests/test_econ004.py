@@ -36,6 +36,13 @@ def test_positive_executor():
     assert "ThreadPoolExecutor" in warnings[0].pattern
 
 
+def test_positive_aliased_executor():
+    """ThreadPoolExecutor imported as an alias should trigger."""
+    warnings, _ = run_rule(FIXTURES / "positive_aliased_executor.py")
+    assert len(warnings) == 1
+    assert "ThreadPoolExecutor" in warnings[0].pattern
+
+
 def test_negative_bounded():
     """ThreadPoolExecutor with max_workers should not trigger."""
     warnings, _ = run_rule(FIXTURES / "negative_bounded.py")
@@ -54,3 +61,16 @@ def test_suppressed_ignore():
     assert len(warnings) == 1
     filtered = filter_suppressed(warnings, source_cache)
     assert len(filtered) == 0
+
+
+def test_positive_submodule_imports():
+    """Constructors imported from their defining submodules should trigger."""
+    warnings, _ = run_rule(FIXTURES / "positive_submodule_imports.py")
+    assert sorted((w.line, w.pattern) for w in warnings) == [
+        (11, "asyncio.gather(*...) without Semaphore"),
+        (15, "ProcessPoolExecutor() without max_workers"),
+        (15, "ThreadPoolExecutor() without max_workers"),
+        (18, "multiprocessing.Pool() without processes limit"),
+        (20, "multiprocessing.Pool() without processes limit"),
+        (22, "multiprocessing.Pool() without processes limit"),
+    ]
@@ -0,0 +1,59 @@
+"""Tests for the single-pass rule engine."""
+
+import ast
+from pathlib import Path
+
+from econlint.engine import run_rules, walk
+from econlint.parser import parse_file
+from econlint.rules import ALL_RULES
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class RecordingRule:
+    """Minimal rule that records the order handlers are called in."""
+
+    def __init__(self, events: list[str]) -> None:
+        self.events = events
+
+    def visit_For(self, node: ast.For) -> None:
+        self.events.append("enter For")
+
+    def leave_For(self, node: ast.For) -> None:
+        self.events.append("leave For")
+
+    def visit_Call(self, node: ast.Call) -> None:
+        self.events.append("Call")
+
+
+def test_walk_calls_enter_and_leave_around_children():
+    """visit_ handlers run before children, leave_ handlers after."""
+    events: list[str] = []
+    tree = ast.parse("for x in xs:\n    f(x)\ng()\n")
+    walk(tree, [RecordingRule(events)])
+    assert events == ["enter For", "Call", "leave For", "Call"]
+
+
+def test_walk_fans_out_to_every_rule():
+    """Every rule sees every node during the same walk."""
+    first: list[str] = []
+    second: list[str] = []
+    tree = ast.parse("for x in xs:\n    f(x)\n")
+    walk(tree, [RecordingRule(first), RecordingRule(second)])
+    assert first == second == ["enter For", "Call", "leave For"]
+
+
+def test_run_rules_matches_individual_rules():
+    """A single pass produces the same warnings as running rules one by one."""
+    for file_path in sorted(FIXTURES.rglob("*.py")):
+        result = parse_file(file_path)
+        assert result is not None
+        tree, source = result
+
+        expected = []
+        for rule_class in ALL_RULES:
+            rule = rule_class(file_path, source)
+            rule.visit(tree)
+            expected.extend(rule.warnings)
+
+        assert run_rules(file_path, source, tree, ALL_RULES) == expected
@@ -0,0 +1,112 @@
+"""Tests for the per-module facts shared by rules."""
+
+import ast
+from pathlib import Path
+
+from econlint.engine import run_rules, walk
+from econlint.facts import ModuleFacts
+from econlint.rules import ALL_RULES
+
+SOURCE = '''\
+import asyncio as aio
+from concurrent.futures import ThreadPoolExecutor
+from . import sibling
+
+try:
+    import ujson as json
+except ImportError:
+    import json
+
+def fetch(urls):
+    label = "café"
+    for url in urls:
+        client.get(url, key=lambda k: k.upper())
+    return [
+        load(u) for u in urls
+    ]
+'''
+
+
+class ContextRecorder:
+    """Records the facts visible to a rule when each call is visited."""
+
+    code = "TEST"
+
+    def __init__(self, facts: ModuleFacts) -> None:
+        self.facts = facts
+        self.seen: dict[str, tuple[list[str], list[str]]] = {}
+
+    def visit_Call(self, node: ast.Call) -> None:
+        self.seen[self.facts.call_name(node)] = (
+            [type(loop).__name__ for loop in self.facts.loops],
+            [getattr(f, "name", "lambda") for f in self.facts.functions],
+        )
+
+
+def test_walk_tracks_enclosing_loops_and_functions():
+    tree = ast.parse(SOURCE)
+    facts = ModuleFacts(SOURCE, tree)
+    recorder = ContextRecorder(facts)
+    walk(tree, [recorder], facts=facts)
+
+    assert recorder.seen["client.get"] == (["For"], ["fetch"])
+    assert recorder.seen["k.upper"] == (["For"], ["fetch", "lambda"])
+    assert recorder.seen["load"] == (["ListComp"], ["fetch"])
+    assert facts.loops == [] and facts.functions == []
+
+
+def test_segment_matches_ast_get_source_segment():
+    tree = ast.parse(SOURCE)
+    facts = ModuleFacts(SOURCE, tree)
+    for node in ast.walk(tree):
+        assert facts.segment(node) == ast.get_source_segment(SOURCE, node)
+
+
+def test_imports_and_semaphore():
+    facts = ModuleFacts(SOURCE, ast.parse(SOURCE))
+    assert facts.imports == {
+        "aio": "asyncio",
+        "ThreadPoolExecutor": "concurrent.futures.ThreadPoolExecutor",
+        "sibling": ".sibling",
+        "json": "json",
+    }
+    assert not facts.has_semaphore
+    assert ModuleFacts("limit = asyncio.Semaphore(5)\n").has_semaphore
+    assert not ModuleFacts("# asyncio.Semaphore(5)\n").has_semaphore
+
+
+def test_rules_share_one_facts_object():
+    """Call names are resolved once per node, however many rules ask."""
+    tree = ast.parse(SOURCE)
+    facts = ModuleFacts(SOURCE, tree)
+    run_rules(Path("example.py"), SOURCE, tree, ALL_RULES, facts=facts)
+    calls = [node for node in ast.walk(tree) if isinstance(node, ast.Call)]
+    assert set(facts._call_names) == set(calls)
+
+
+def test_call_parts_split_receiver_and_method():
+    tree = ast.parse("client.api.get(1).json()\nfetch()\n(a + b).send()\nx.y()()\n")
+    facts = ModuleFacts("", tree)
+    calls = [node for node in ast.walk(tree) if isinstance(node, ast.Call)]
+    parts = {
+        facts.call_name(node): (facts.call_parts(node).receiver, facts.call_parts(node).method)
+        for node in calls
+    }
+    assert parts == {
+        "client.api.get().json": ("client.api.get()", "json"),
+        "client.api.get": ("client.api", "get"),
+        "fetch": ("", "fetch"),
+        "send": ("", "send"),
+        "x.y()": ("x", "y()"),
+        "x.y": ("x", "y"),
+    }
+
+
+def test_qualify_resolves_imported_names():
+    facts = ModuleFacts(SOURCE, ast.parse(SOURCE))
+    assert facts.qualify("aio.gather") == "asyncio.gather"
+    assert facts.qualify("ThreadPoolExecutor().submit") == (
+        "concurrent.futures.ThreadPoolExecutor().submit"
+    )
+    assert facts.qualify("json.loads") == "json.loads"
+    assert facts.qualify("client.get") == "client.get"
@@ -0,0 +1,55 @@
+"""Tests for output formatters."""
+
+import io
+import json
+from pathlib import Path
+
+from econlint.formatters import (
+    JsonLinesWriter, JsonWriter, TextWriter, format_json, format_text,
+)
+from econlint.warnings import EXPLANATIONS, Warning
+
+
+def make_warning(line: int) -> Warning:
+    return Warning(
+        code="ECON001",
+        message="External call inside loop",
+        file=Path("app/sync.py"),
+        line=line,
+        pattern="requests.get() called inside loop",
+        explanation=EXPLANATIONS["ECON001"],
+    )
+
+
+def stream(writer_class, batches: list[list[Warning]]) -> str:
+    out = io.StringIO()
+    writer = writer_class(out)
+    for batch in batches:
+        writer.write(batch)
+    writer.close()
+    return out.getvalue()
+
+
+def printed(text: str) -> str:
+    """What main() used to print for a fully formatted output."""
+    return text + "\n" if text else ""
+
+
+def test_streamed_text_matches_buffered_output():
+    for count in (0, 1, 3):
+        warnings = [make_warning(i + 1) for i in range(count)]
+        batches = [warnings[:1], [], warnings[1:]]
+        assert stream(TextWriter, batches) == printed(format_text(warnings))
+
+
+def test_streamed_json_matches_buffered_output():
+    for count in (0, 1, 3):
+        warnings = [make_warning(i + 1) for i in range(count)]
+        batches = [warnings[:1], [], warnings[1:]]
+        assert stream(JsonWriter, batches) == printed(format_json(warnings))
+
+
+def test_json_lines_has_one_object_per_line():
+    output = stream(JsonLinesWriter, [[make_warning(1)], [make_warning(2)]])
+    lines = output.splitlines()
+    assert [json.loads(line)["line"] for line in lines] == [1, 2]
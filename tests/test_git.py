@@ -0,0 +1,51 @@
+"""Tests for reading sources from a git revision."""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from econlint.git import GitError, iter_revision_sources
+
+
+def git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=repo, check=True, capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    git(tmp_path, "init", "-q")
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "client.py").write_text("x = 1\n", encoding="utf-8")
+    (tmp_path / "pkg" / "notes.txt").write_text("not python\n", encoding="utf-8")
+    (tmp_path / "vendor").mkdir()
+    (tmp_path / "vendor" / "lib.py").write_text("y = 2\n", encoding="utf-8")
+    git(tmp_path, "add", "-A")
+    git(tmp_path, "commit", "-q", "-m", "initial")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_reads_committed_contents_not_working_tree(repo):
+    """Blob contents come from the revision, even after local edits."""
+    (repo / "pkg" / "client.py").write_text("x = 'edited'\n", encoding="utf-8")
+
+    sources = dict(iter_revision_sources("HEAD"))
+    assert sources == {
+        Path("pkg/client.py"): b"x = 1\n",
+        Path("vendor/lib.py"): b"y = 2\n",
+    }
+
+
+def test_pathspecs_and_excludes_filter_the_tree(repo):
+    """Positional paths restrict the tree and --exclude patterns apply."""
+    assert [p for p, _ in iter_revision_sources("HEAD", ["pkg"])] == [Path("pkg/client.py")]
+    assert [p for p, _ in iter_revision_sources("HEAD", [], ["vendor"])] == [Path("pkg/client.py")]
+
+
+def test_unknown_revision_raises(repo):
+    with pytest.raises(GitError):
+        list(iter_revision_sources("no-such-rev"))
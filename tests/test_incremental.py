@@ -0,0 +1,107 @@
+"""Tests for function-level incremental analysis."""
+
+from pathlib import Path
+
+from econlint import incremental
+from econlint.cache import ResultCache
+from econlint.rules import ALL_RULES
+from econlint.runner import Analyzer
+
+MODULE = '''\
+import asyncio
+import requests
+
+
+def fetch_all(urls):
+    for url in urls:
+        requests.get(url)
+
+
+def unrelated():
+    return 1
+
+
+async def fan_out(tasks):
+    await asyncio.gather(*tasks)
+'''
+
+
+def make_analyzer(tmp_path: Path) -> Analyzer:
+    cache = ResultCache(tmp_path / "cache", [rule.code for rule in ALL_RULES])
+    return Analyzer(ALL_RULES, cache)
+
+
+def walked_functions(monkeypatch) -> list[list[str]]:
+    """Record the top-level definitions each rules pass is run over."""
+    calls: list[list[str]] = []
+    run_rules = incremental.run_rules
+
+    def recording_run_rules(
+        file_path, source, tree, rule_classes, timings=None, facts=None, observers=()
+    ):
+        calls.append([getattr(node, "name", "") for node in tree.body])
+        return run_rules(file_path, source, tree, rule_classes, timings, facts, observers)
+
+    monkeypatch.setattr(incremental, "run_rules", recording_run_rules)
+    return calls
+
+
+def test_only_changed_definitions_are_reanalyzed(tmp_path, monkeypatch):
+    analyzer = make_analyzer(tmp_path)
+    path = tmp_path / "mod.py"
+    analyzer.analyze_source(path, MODULE.encode())
+
+    calls = walked_functions(monkeypatch)
+    edited = MODULE.replace("return 1", "return 2")
+    result = analyzer.analyze_source(path, edited.encode())
+
+    assert calls == [["", "", "unrelated"]]
+    assert result.warnings == Analyzer(ALL_RULES).analyze_source(path, edited.encode()).warnings
+
+
+def test_reused_warnings_follow_shifted_code(tmp_path):
+    """Warnings from cached definitions are re-mapped to their new lines."""
+    analyzer = make_analyzer(tmp_path)
+    path = tmp_path / "mod.py"
+    before = analyzer.analyze_source(path, MODULE.encode()).warnings
+
+    shifted = MODULE.replace("import requests\n", "import requests\nTIMEOUT = 5\n\n\n")
+    after = analyzer.analyze_source(path, shifted.encode()).warnings
+
+    assert [w.code for w in after] == [w.code for w in before]
+    assert [w.line for w in after] == [w.line + 3 for w in before]
+
+
+def test_module_context_invalidates_definitions(tmp_path):
+    """Adding a Semaphore elsewhere in the module clears the ECON004 warning."""
+    analyzer = make_analyzer(tmp_path)
+    path = tmp_path / "mod.py"
+    analyzer.analyze_source(path, MODULE.encode())
+
+    bounded = MODULE + "\n\nlimit = asyncio.Semaphore(10)\n"
+    result = analyzer.analyze_source(path, bounded.encode())
+    assert "ECON004" not in [w.code for w in result.warnings]
+
+
+def test_imports_invalidate_definitions(tmp_path):
+    """Aliasing an import changes how calls in unchanged definitions resolve."""
+    analyzer = make_analyzer(tmp_path)
+    path = tmp_path / "mod.py"
+    unresolved = MODULE.replace("requests.get", "rq.get")
+    analyzer.analyze_source(path, unresolved.encode())
+
+    aliased = unresolved.replace("import requests", "import requests as rq")
+    result = analyzer.analyze_source(path, aliased.encode())
+    assert "rq.get() called inside loop" in [w.pattern for w in result.warnings]
+
+
+def test_form_feed_does_not_shift_definitions(tmp_path):
+    """Definitions are keyed by the parser's lines, not str.splitlines'."""
+    analyzer = make_analyzer(tmp_path)
+    path = tmp_path / "mod.py"
+    module = "import requests\n\x0c\ndef a():\n    pass\n\n\ndef b(urls):\n    for u in urls:\n        print(u)\n"
+    analyzer.analyze_source(path, module.encode())
+
+    edited = module.replace("print(u)", "requests.get(u)")
+    result = analyzer.analyze_source(path, edited.encode())
+    assert [(w.code, w.line) for w in result.warnings] == [("ECON001", 9)]
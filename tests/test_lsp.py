@@ -0,0 +1,85 @@
+"""Tests for the language server."""
+
+import io
+import json
+
+from econlint.lsp import LanguageServer, read_message, uri_to_path
+from econlint.rules import ALL_RULES
+
+URI = "file:///project/app%20sync.py"
+LOOP_CALL = "import requests\n\nfor url in urls:\n    requests.get(url)\n"
+
+
+def frame(message: dict) -> bytes:
+    body = json.dumps(message).encode()
+    return b"Content-Length: %d\r\n\r\n" % len(body) + body
+
+
+def sent_messages(output: io.BytesIO) -> list[dict]:
+    stream = io.BytesIO(output.getvalue())
+    messages = []
+    while (message := read_message(stream)) is not None:
+        messages.append(message)
+    return messages
+
+
+def open_document(server: LanguageServer, text: str) -> None:
+    server.handle({
+        "jsonrpc": "2.0",
+        "method": "textDocument/didOpen",
+        "params": {"textDocument": {"uri": URI, "text": text, "version": 1}},
+    })
+
+
+def test_uri_to_path():
+    assert str(uri_to_path(URI)) == "/project/app sync.py"
+    # Decoded once: a literal % in the name stays
+    assert str(uri_to_path("file:///project/%2541.py")) == "/project/%41.py"
+
+
+def test_open_publishes_diagnostics():
+    output = io.BytesIO()
+    server = LanguageServer(ALL_RULES, output)
+    open_document(server, LOOP_CALL)
+
+    [message] = sent_messages(output)
+    assert message["method"] == "textDocument/publishDiagnostics"
+    [diagnostic] = message["params"]["diagnostics"]
+    assert diagnostic["code"] == "ECON001"
+    assert diagnostic["range"]["start"] == {"line": 3, "character": 0}
+    assert diagnostic["range"]["end"] == {"line": 3, "character": 21}
+
+
+def test_changes_are_debounced_and_read_from_the_buffer():
+    """Only the last of several rapid edits is analyzed, without touching disk."""
+    output = io.BytesIO()
+    server = LanguageServer(ALL_RULES, output, debounce=60)
+    open_document(server, "x = 1\n")
+    for text in (LOOP_CALL, "y = 2\n", LOOP_CALL.replace("get", "post")):
+        server.handle({
+            "jsonrpc": "2.0",
+            "method": "textDocument/didChange",
+            "params": {"textDocument": {"uri": URI}, "contentChanges": [{"text": text}]},
+        })
+
+    timer = server._timers[URI]
+    timer.cancel()
+    server.analyze(URI)
+
+    messages = sent_messages(output)
+    assert len(messages) == 2
+    [diagnostic] = messages[1]["params"]["diagnostics"]
+    assert "requests.post()" in diagnostic["message"]
+
+
+def test_serve_handles_lifecycle():
+    requests = b"".join([
+        frame({"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}}),
+        frame({"jsonrpc": "2.0", "id": 2, "method": "shutdown"}),
+        frame({"jsonrpc": "2.0", "method": "exit"}),
+    ])
+    output = io.BytesIO()
+    assert LanguageServer(ALL_RULES, output).serve(io.BytesIO(requests)) == 0
+    responses = sent_messages(output)
+    assert [r["id"] for r in responses] == [1, 2]
+    assert responses[0]["result"]["capabilities"]["textDocumentSync"]["change"] == 1
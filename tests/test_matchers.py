@@ -0,0 +1,42 @@
+"""Tests for the compiled name tables rules classify calls with."""
+
+import random
+
+from econlint.rules.econ001 import is_external_call_name
+from econlint.rules.econ003 import is_likely_fetch_call
+from econlint.rules.matchers import WordIndex
+
+
+def test_word_index_matches_naive_string_tests():
+    rng = random.Random(0)
+    for _ in range(500):
+        words = ["".join(rng.choices("ab.", k=rng.randint(1, 4))) for _ in range(rng.randint(0, 6))]
+        index = WordIndex(words)
+        for _ in range(10):
+            text = "".join(rng.choices("ab.", k=rng.randint(0, 8)))
+            assert index.prefix_of(text) == any(text.startswith(w) for w in words)
+            assert index.suffix_of(text) == any(text.endswith(w) for w in words)
+            assert index.found_in(text) == any(w in text for w in words)
+
+
+def test_overlapping_words_are_found():
+    """Substring search falls back through shared prefixes (Aho-Corasick links)."""
+    index = WordIndex(["service", "vice_client", "ice"])
+    assert index.found_in("advice")
+    assert index.found_in("servivice_client")
+    assert not index.found_in("servic")
+
+
+def test_classifications():
+    assert is_external_call_name("httpx.get")
+    assert is_external_call_name("requests.post")
+    assert not is_external_call_name("requests.append")
+    assert is_external_call_name("db.cursor.execute")
+    assert is_external_call_name("billing_client.charge")
+    assert not is_external_call_name("items.append")
+
+    assert is_likely_fetch_call("user_api.get_user")
+    assert is_likely_fetch_call("fetch_from_remote")
+    assert not is_likely_fetch_call("user_api.get_path")
+    assert not is_likely_fetch_call("self.cache_client.get_user")
+    assert not is_likely_fetch_call("user_api.save_user")
@@ -0,0 +1,54 @@
+"""Tests for the byte-level prefilter."""
+
+from pathlib import Path
+
+from econlint import runner
+from econlint.prefilter import Prefilter, build_prefilter
+from econlint.rules import ALL_RULES, ECON002, ECON004
+from econlint.runner import SKIPPED, Analyzer
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def test_redundant_tokens_are_dropped():
+    """A token containing another token adds nothing to the search."""
+    assert Prefilter([b"Pool", b"ThreadPool", b"gather"]).tokens == (b"Pool", b"gather")
+
+
+def test_disabled_rules_shrink_the_trigger_set():
+    """Only enabled rules contribute trigger tokens."""
+    only_fanout = build_prefilter([ECON004])
+    assert only_fanout is not None
+    assert only_fanout.could_match(b"await asyncio.gather(*tasks)")
+    assert not only_fanout.could_match(b"for x in xs:\n    requests.get(x)\n")
+
+    everything = build_prefilter(ALL_RULES)
+    assert everything is not None
+    assert everything.could_match(b"for x in xs:\n    requests.get(x)\n")
+
+
+def test_files_without_triggers_are_not_parsed(monkeypatch):
+    """Files that no enabled rule can match skip decoding and parsing."""
+    def fail_parse(source, path):
+        raise AssertionError("prefiltered file was parsed")
+
+    monkeypatch.setattr(runner, "parse_source", fail_parse)
+    result = Analyzer([ECON002]).analyze_file(FIXTURES / "econ004" / "positive_executor.py")
+    assert result.status == SKIPPED
+    assert result.warnings == []
+
+
+def test_prefilter_never_hides_warnings():
+    """Every fixture with warnings passes the prefilter for all rules."""
+    with_prefilter = Analyzer(ALL_RULES)
+    without_prefilter = Analyzer(ALL_RULES, use_prefilter=False)
+    for file_path in sorted(FIXTURES.rglob("*.py")):
+        for rule in ALL_RULES:
+            assert (
+                Analyzer([rule]).analyze_file(file_path).warnings
+                == Analyzer([rule], use_prefilter=False).analyze_file(file_path).warnings
+            )
+        assert (
+            with_prefilter.analyze_file(file_path).warnings
+            == without_prefilter.analyze_file(file_path).warnings
+        )
@@ -0,0 +1,52 @@
+"""Tests for per-file analysis and parallel execution."""
+
+import json
+import pstats
+from pathlib import Path
+
+from econlint.cli import main
+from econlint.rules import ALL_RULES
+from econlint.runner import Analyzer, RunStats, iter_results
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def test_parallel_matches_serial():
+    """Worker processes yield the same results, in the same order, as a serial run."""
+    files = sorted(FIXTURES.rglob("*.py"))
+    analyzer = Analyzer(ALL_RULES)
+    serial = list(iter_results(files, analyzer, jobs=1))
+    parallel = list(iter_results(files, analyzer, jobs=2))
+
+    assert [r.path for r in parallel] == files
+    assert [r.warnings for r in parallel] == [r.warnings for r in serial]
+
+
+def test_timed_analysis_records_phases_and_rules():
+    """A timed Analyzer reports where each file's time went."""
+    files = sorted(FIXTURES.rglob("*.py"))
+    stats = RunStats(slowest_count=3)
+    for result in iter_results(files, Analyzer(ALL_RULES, timed=True)):
+        stats.record(result)
+
+    assert {"read", "parse", "walk"} <= set(stats.phases)
+    assert set(stats.rules) == {rule.code for rule in ALL_RULES}
+    slowest = stats.slowest()
+    assert len(slowest) == 3
+    assert slowest == sorted(slowest, reverse=True)
+
+
+def test_stats_json_goes_to_stderr(capsys):
+    """With --json, --stats is a JSON object on stderr and stdout stays valid."""
+    main([str(FIXTURES / "econ001"), "--json", "--stats", "--no-cache", "-j1"])
+    captured = capsys.readouterr()
+    assert isinstance(json.loads(captured.out), list)
+    stats = json.loads(captured.err)
+    assert stats["files"] == stats["analyzed"] + stats["skipped"]
+    assert "discovery" in stats["phases"] and "formatting" in stats["phases"]
+
+
+def test_profile_writes_pstats(tmp_path):
+    out = tmp_path / "run.pstats"
+    main([str(FIXTURES / "econ004"), "--no-cache", "--profile", str(out)])
+    assert pstats.Stats(str(out)).total_calls > 0
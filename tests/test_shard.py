@@ -0,0 +1,80 @@
+"""Tests for CI sharding and report merging."""
+
+import argparse
+import json
+from pathlib import Path
+
+import pytest
+
+from econlint.cli import main
+from econlint.shard import parse_shard, select_shard
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def test_parse_shard():
+    assert parse_shard("2/3") == (2, 3)
+    for value in ("0/3", "4/3", "3", "a/b"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_shard(value)
+
+
+@pytest.mark.parametrize("strategy", ["hash", "size"])
+def test_shards_partition_the_files(strategy):
+    files = sorted(FIXTURES.rglob("*.py"))
+    shards = [list(select_shard(files, i, 3, strategy)) for i in (1, 2, 3)]
+    assert sorted(f for shard in shards for f in shard) == files
+    # Same input, same assignment
+    assert list(select_shard(files, 2, 3, strategy)) == shards[1]
+
+
+def test_size_shards_are_balanced():
+    tasks = [(Path(f"f{i}.py"), b"x" * size) for i, size in enumerate([90, 50, 40, 30, 20, 10])]
+    loads = [
+        sum(len(data) for _, data in select_shard(tasks, i, 2, "size")) for i in (1, 2)
+    ]
+    assert sorted(loads) == [120, 120]
+
+
+def test_merged_shards_match_a_full_run(tmp_path, capsys):
+    reports = []
+    for index in (1, 2):
+        main([str(FIXTURES), "--no-cache", "--json", "--shard", f"{index}/2"])
+        report = tmp_path / f"shard{index}.json"
+        report.write_text(capsys.readouterr().out)
+        reports.append(str(report))
+
+    status = main([str(FIXTURES), "--no-cache", "--json"])
+    full = json.loads(capsys.readouterr().out)
+
+    assert main(["merge", *reports, "--json"]) == status == 1
+    merged = json.loads(capsys.readouterr().out)
+    key = lambda w: (w["file"], w["line"], w["code"], w["pattern"])
+    assert merged == sorted(full, key=key)
+
+
+def test_merge_of_clean_reports_succeeds(tmp_path, capsys):
+    report = tmp_path / "empty.json"
+    report.write_text("[]\n")
+    assert main(["merge", str(report), str(report)]) == 0
+    assert capsys.readouterr().out == ""
+
+
+def test_shard_is_rejected_where_it_cannot_apply(capsys):
+    for option in ("--daemon", "--watch"):
+        with pytest.raises(SystemExit):
+            main([str(FIXTURES), "--shard", "1/2", option])
+        assert "cannot be combined with --shard" in capsys.readouterr().err
+
+
+def test_merge_keeps_identical_warnings(tmp_path, capsys):
+    source = tmp_path / "twice.py"
+    source.write_text("import requests\n\nfor u in us:\n    requests.get(u); requests.get(u)\n")
+    main([str(source), "--no-cache", "--json"])
+    full = capsys.readouterr().out
+    report = tmp_path / "report.json"
+    report.write_text(full)
+
+    main(["merge", str(report), "--json"])
+    assert json.loads(capsys.readouterr().out) == json.loads(full)
+    assert len(json.loads(full)) == 2
@@ -0,0 +1,69 @@
+"""Tests that startup only imports what a run needs.
+
+Uses `python -X importtime` so the modules loaded by a fresh interpreter
+are checked, independent of what this test process already imported.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+FIXTURES = Path(__file__).parent / "fixtures"
+
+# Modules only some runs need; none of them may load on import of the CLI
+LAZY_MODULES = {
+    "econlint.rules.econ001", "econlint.rules.econ002",
+    "econlint.rules.econ003", "econlint.rules.econ004", "econlint.rules.matchers",
+    "econlint.formatters.text", "econlint.formatters.json_fmt",
+    "econlint.git", "econlint.diff", "econlint.watch",
+    "econlint.lsp", "econlint.daemon", "econlint.callgraph",
+    "concurrent.futures", "multiprocessing", "tempfile",
+}
+
+
+def imported_modules(*args: str) -> set[str]:
+    """Modules a fresh interpreter imports (its import time is benchmarked
+    by the "import" scenario of benchmarks.run)."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=False,
+    )
+    modules = set()
+    for line in completed.stderr.splitlines():
+        if line.startswith("import time:") and "cumulative" not in line:
+            modules.add(line.rpartition("|")[2].strip())
+    return modules
+
+
+def test_cli_import_is_lazy():
+    modules = imported_modules("-c", "import econlint.cli")
+    assert "econlint.cli" in modules
+    assert LAZY_MODULES.isdisjoint(modules), LAZY_MODULES & modules
+
+
+def test_disabled_rules_are_not_imported():
+    target = FIXTURES / "econ004" / "positive_gather.py"
+    completed = subprocess.run(
+        [
+            sys.executable, "-c",
+            "import sys; from econlint.cli import main; "
+            f"main([{str(target)!r}, '--no-cache', '-j1', "
+            "'--disable=ECON001,ECON002,ECON003']); "
+            "print(' '.join(sys.modules), file=sys.stderr)",
+        ],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=False,
+    )
+    loaded = set(completed.stderr.split())
+    assert "econlint.rules.econ004" in loaded
+    assert loaded.isdisjoint({
+        "econlint.rules.econ001", "econlint.rules.econ002", "econlint.rules.econ003",
+    })
@@ -0,0 +1,35 @@
+"""Tests for per-file suppression extraction."""
+
+from pathlib import Path
+
+from econlint.suppression import apply_suppressions, extract_suppressions
+from econlint.warnings import Warning
+
+
+def make_warning(code: str, line: int) -> Warning:
+    return Warning(code, "message", Path("a.py"), line, "pattern", "")
+
+
+def test_extract_suppressions_maps_lines_to_codes():
+    source = (
+        "a()  # econlint: ignore\n"
+        "b()\n"
+        "c()  # econlint: ignore=ECON001,ECON003\n"
+    )
+    assert extract_suppressions(source) == {
+        1: frozenset(),
+        3: frozenset({"ECON001", "ECON003"}),
+    }
+
+
+def test_directives_inside_strings_are_not_suppressions():
+    """Only real comments count, not lookalike text in string literals."""
+    source = 'x = "# econlint: ignore"\nmsg = """\n# econlint: ignore\n"""\n'
+    assert extract_suppressions(source) == {}
+
+
+def test_apply_suppressions():
+    warnings = [make_warning("ECON001", 1), make_warning("ECON001", 3),
+                make_warning("ECON002", 3), make_warning("ECON002", 4)]
+    suppressions = {1: frozenset(), 3: frozenset({"ECON001"})}
+    assert apply_suppressions(warnings, suppressions) == [warnings[2], warnings[3]]
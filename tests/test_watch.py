@@ -0,0 +1,59 @@
+"""Tests for watch mode."""
+
+import os
+
+from econlint.rules import ALL_RULES
+from econlint.runner import Analyzer
+from econlint.watch import Watcher
+
+LOOP_CALL = "import requests\n\nfor url in urls:\n    requests.get(url)\n"
+
+
+def bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_only_changed_files_are_reanalyzed(tmp_path):
+    (tmp_path / "a.py").write_text(LOOP_CALL)
+    (tmp_path / "b.py").write_text("x = 1\n")
+    watcher = Watcher([tmp_path], Analyzer(ALL_RULES))
+
+    first = watcher.poll()
+    assert len(first.files) == 2
+    assert [w.code for w in first.new] == ["ECON001"]
+
+    assert watcher.poll().files == []
+
+    (tmp_path / "b.py").write_text(LOOP_CALL.replace("get", "post"))
+    bump_mtime(tmp_path / "b.py")
+    delta = watcher.poll()
+    assert delta.files == [tmp_path / "b.py"]
+    assert [w.file for w in delta.new] == [tmp_path / "b.py"]
+    assert delta.resolved == []
+
+
+def test_moved_warning_is_not_reported_again(tmp_path):
+    path = tmp_path / "a.py"
+    path.write_text(LOOP_CALL)
+    watcher = Watcher([tmp_path], Analyzer(ALL_RULES))
+    watcher.poll()
+
+    path.write_text("# header\n\n" + LOOP_CALL)
+    delta = watcher.poll()
+    assert delta.files == [path]
+    assert delta.new == [] and delta.resolved == []
+    assert [w.line for w in watcher.warnings()] == [6]
+
+
+def test_deleted_and_fixed_files_resolve_warnings(tmp_path):
+    (tmp_path / "a.py").write_text(LOOP_CALL)
+    (tmp_path / "b.py").write_text(LOOP_CALL)
+    watcher = Watcher([tmp_path], Analyzer(ALL_RULES))
+    watcher.poll()
+
+    (tmp_path / "a.py").unlink()
+    (tmp_path / "b.py").write_text("import requests\n\nrequests.get(url)\n")
+    delta = watcher.poll()
+    assert sorted(w.file.name for w in delta.resolved) == ["a.py", "b.py"]
+    assert watcher.warnings() == []